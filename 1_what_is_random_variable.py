@@ -1,7 +1,8 @@
 import streamlit as st
 import plotly.graph_objs as go
 import numpy as np
-from scipy import stats
+from probability.distributions import binomial_moments, binomial_pmf, normal_cdf, normal_pdf, normal_sf
+from probability.rng import session_rng
 
 st.set_page_config(layout="wide", page_title="Understanding Random Variables")
 
@@ -49,21 +50,19 @@ with col1:
     promotion_rate = st.slider("Promotion rate (%)", 0, 100, 10) / 100
     
     if st.button("Simulate Promotions"):
-        promotions = np.random.binomial(num_employees, promotion_rate)
+        promotions = session_rng().generator("promotions").binomial(num_employees, promotion_rate)
         st.success(f"Number of employees promoted in this simulation: {promotions}")
         
         # Calculations
-        expected_promotions = num_employees * promotion_rate
-        variance = num_employees * promotion_rate * (1 - promotion_rate)
-        std_dev = np.sqrt(variance)
+        expected_promotions, variance, std_dev = binomial_moments(num_employees, promotion_rate)
         
         st.write(f"Expected number of promotions: {expected_promotions:.2f}")
         st.write(f"Variance: {variance:.2f}")
         st.write(f"Standard Deviation: {std_dev:.2f}")
         
         # Plot probability distribution
-        x = list(range(num_employees + 1))
-        y = [stats.binom.pmf(k, num_employees, promotion_rate) for k in x]
+        x = np.arange(num_employees + 1)
+        y = binomial_pmf(x, num_employees, promotion_rate)
         fig = go.Figure(go.Bar(x=x, y=y))
         fig.update_layout(title="Probability Distribution of Promotions",
                           xaxis_title="Number of Promotions",
@@ -88,7 +87,7 @@ with col2:
     std_dev = st.slider("Standard deviation of speed", 10, 100, 50)
     
     if st.button("Simulate Aircraft Speeds"):
-        speeds = np.random.normal(mean_speed, std_dev, 1000)
+        speeds = session_rng().generator("aircraft_speeds").normal(mean_speed, std_dev, 1000)
         
         st.success(f"Simulated average speed: {np.mean(speeds):.2f} km/h")
         
@@ -100,8 +99,8 @@ with col2:
         st.write(f"Population variance (σ²): {variance} (km/h)²")
         
         # Probability calculations
-        prob_below_mean = stats.norm.cdf(mean_speed, mean_speed, std_dev)
-        prob_above_mean_plus_sigma = 1 - stats.norm.cdf(mean_speed + std_dev, mean_speed, std_dev)
+        prob_below_mean = normal_cdf(mean_speed, mean_speed, std_dev)
+        prob_above_mean_plus_sigma = normal_sf(mean_speed + std_dev, mean_speed, std_dev)
         
         st.write(f"Probability of speed below mean: {prob_below_mean:.2%}")
         st.write(f"Probability of speed above mean + 1σ: {prob_above_mean_plus_sigma:.2%}")
@@ -110,7 +109,7 @@ with col2:
         fig.add_trace(go.Histogram(x=speeds, nbinsx=30, name="Simulated Speeds"))
         x_range = np.linspace(mean_speed - 3*std_dev, mean_speed + 3*std_dev, 100)
         fig.add_trace(go.Scatter(x=x_range,
-                                 y=stats.norm.pdf(x_range, mean_speed, std_dev) * len(speeds) * (speeds.max()-speeds.min())/30,
+                                 y=normal_pdf(x_range, mean_speed, std_dev) * len(speeds) * (speeds.max()-speeds.min())/30,
                                  mode="lines", name="Theoretical Distribution"))
         fig.update_layout(title="Distribution of Aircraft Speeds",
                           xaxis_title="Speed (km/h)",
@@ -2,9 +2,7 @@ import streamlit as st
 import plotly.graph_objects as go
 import numpy as np
 import plotly.express as px
-
-def bernoulli_pmf(p, x):
-    return p if x == 1 else 1-p
+from probability.distributions import bernoulli_moments, bernoulli_pmf
 
 def create_bernoulli_plot(p):
     x = [0, 1]
@@ -196,19 +194,18 @@ with tabs[4]:
     """)
 
     prop_p = st.slider('Choose p value', 0.0, 1.0, 0.5, 0.01, key='prop_slider')
+    prop_mean, prop_variance, prop_std = bernoulli_moments(prop_p)
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("Expected Value", f"{prop_p:.4f}")
+        st.metric("Expected Value", f"{prop_mean:.4f}")
     with col2:
-        st.metric("Variance", f"{prop_p*(1-prop_p):.4f}")
+        st.metric("Variance", f"{prop_variance:.4f}")
     with col3:
-        st.metric("Standard Deviation", f"{np.sqrt(prop_p*(1-prop_p)):.4f}")
+        st.metric("Standard Deviation", f"{prop_std:.4f}")
 
     # Visualize how properties change with p
     p_range = np.linspace(0, 1, 100)
-    expected_value = p_range
-    variance = p_range * (1 - p_range)
-    std_dev = np.sqrt(variance)
+    expected_value, variance, std_dev = bernoulli_moments(p_range)
 
     fig = px.line(x=p_range, y=[expected_value, variance, std_dev], 
                   labels={'x': 'p', 'value': 'Value'},
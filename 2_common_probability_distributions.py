@@ -1,7 +1,7 @@
 import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
-from scipy import stats
+from probability.distributions import binomial_pmf, normal_pdf, uniform_pdf
 
 # Set page config
 st.set_page_config(layout="wide", page_title="Common Probability Distributions Explorer", page_icon="📊")
@@ -100,7 +100,7 @@ with tab2:
     
     with col2:
         x = np.arange(0, n+1)
-        y = stats.binom.pmf(x, n, p)
+        y = binomial_pmf(x, n, p)
         
         fig = go.Figure(data=[go.Bar(x=x, y=y)])
         fig.update_layout(title=f"Binomial Distribution (n={n}, p={p})", 
@@ -142,7 +142,7 @@ with tab3:
     
     with col2:
         x = np.linspace(a-5, b+5, 1000)
-        y = np.where((x >= a) & (x <= b), 1/(b-a), 0)
+        y = uniform_pdf(x, a, b)
         
         fig = go.Figure(data=[go.Scatter(x=x, y=y, mode='lines', fill='tozeroy')])
         fig.update_layout(title=f"Uniform Distribution [a={a}, b={b}]", 
@@ -183,7 +183,7 @@ with tab4:
     
     with col2:
         x = np.linspace(40, 160, 1000)  # Fixed x-axis range
-        y = stats.norm.pdf(x, mu, sigma)
+        y = normal_pdf(x, mu, sigma)
         
         fig = go.Figure(data=[go.Scatter(x=x, y=y, mode='lines', fill='tozeroy')])
         fig.update_layout(title=f"Normal Distribution (μ={mu}, σ={sigma})", 
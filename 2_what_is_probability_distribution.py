@@ -1,7 +1,7 @@
 import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
-from scipy import stats
+from probability.distributions import binomial_pmf, normal_pdf
 
 # Set page config
 st.set_page_config(layout="wide", page_title="Probability Distribution Explorer", page_icon="📊")
@@ -105,7 +105,7 @@ with tab2:
         
     with col2:
         x = np.arange(0, n+1)
-        pmf = stats.binom.pmf(x, n, p)
+        pmf = binomial_pmf(x, n, p)
         
         fig = go.Figure()
         fig.add_trace(go.Bar(x=x, y=pmf, name="Probability"))
@@ -153,7 +153,7 @@ with tab3:
         # Set fixed x-axis range
         x_min, x_max = -10, 10
         x = np.linspace(x_min, x_max, 1000)
-        pdf = stats.norm.pdf(x, mean, std)
+        pdf = normal_pdf(x, mean, std)
         
         fig = go.Figure()
         fig.add_trace(go.Scatter(x=x, y=pdf, mode='lines', name="Probability Density"))
@@ -1,7 +1,7 @@
 import streamlit as st
 import plotly.graph_objects as go
 import numpy as np
-from scipy.stats import binom
+from probability.distributions import binomial_cdf, binomial_pmf, binomial_sf
 import plotly.express as px
 
 def main():
@@ -93,15 +93,15 @@ def display_interactive_calculator():
 
     # Calculate probabilities
     x = np.arange(0, n_days + 1)
-    pmf = binom.pmf(x, n_days, rain_prob)
-    cdf = binom.cdf(x, n_days, rain_prob)
+    pmf = binomial_pmf(x, n_days, rain_prob)
+    cdf = binomial_cdf(x, n_days, rain_prob)
 
     # Create and display plot
     fig = create_distribution_plot(x, pmf, cdf, threshold)
     st.plotly_chart(fig, use_container_width=True)
 
     # Display calculated probability
-    probability = 1 - binom.cdf(threshold, n_days, rain_prob)
+    probability = binomial_sf(threshold, n_days, rain_prob)
     st.success(f"The probability of having more than {threshold} rainy days: {probability:.4f}")
 
     # Solved numerical example
@@ -114,7 +114,7 @@ def display_interactive_calculator():
 
     Step 1: Calculate the probability of having exactly {threshold+1} rainy days
     P(X = {threshold+1}) = C({n_days}, {threshold+1}) * {rain_prob:.2f}^{threshold+1} * (1-{rain_prob:.2f})^{n_days-(threshold+1)}
-    = {binom.pmf(threshold+1, n_days, rain_prob):.6f}
+    = {binomial_pmf(threshold+1, n_days, rain_prob):.6f}
 
     Step 2: Sum the probabilities for all values above the threshold
     P(X > {threshold}) = P(X = {threshold+1}) + P(X = {threshold+2}) + ... + P(X = {n_days})
@@ -1,7 +1,7 @@
 import streamlit as st
 import plotly.graph_objects as go
 import numpy as np
-from scipy.stats import binom
+from probability.distributions import binomial_pmf
 
 st.set_page_config(layout="wide", page_title="Binomial Distribution Demo")
 
@@ -76,7 +76,7 @@ with tab2:
         x = st.slider('Number of winning tickets (x)', 0, n, 6)
 
         # Calculate probability
-        prob = binom.pmf(x, n, p)
+        prob = binomial_pmf(x, n, p)
 
         st.markdown(f"""
         <div class="info-box">
@@ -92,7 +92,7 @@ with tab2:
         fig = go.Figure()
 
         x_range = np.arange(n + 1)
-        y = binom.pmf(x_range, n, p)
+        y = binomial_pmf(x_range, n, p)
 
         fig.add_trace(go.Bar(
             x=x_range, 
@@ -103,7 +103,7 @@ with tab2:
 
         fig.add_trace(go.Scatter(
             x=[x, x],
-            y=[0, binom.pmf(x, n, p)],
+            y=[0, binomial_pmf(x, n, p)],
             mode='lines',
             name='Selected X',
             line=dict(color='red', width=2, dash='dash')
@@ -1,7 +1,8 @@
 import streamlit as st
 import plotly.graph_objects as go
-import numpy as np
-from scipy.stats import binom
+from probability.binomial import PAGE_MAX_N, binomial_table, visible_range
+from probability.decimation import decimate_figure
+from probability.distributions import binomial_cdf, binomial_pmf
 
 # Set page configuration
 st.set_page_config(page_title="Binomial Distribution Demo", layout="wide")
@@ -34,11 +35,6 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-def binomial_pmf(n, p, k):
-    return binom.pmf(k, n, p)
-
-def binomial_cdf(n, p, k):
-    return binom.cdf(k, n, p)
 
 st.title("📊 Binomial Distribution Interactive Demo")
 st.write("**Developed by : Venugopal Adep**")
@@ -61,15 +57,21 @@ st.header("🎛️ Interactive Binomial Distribution Plot")
 
 col1, col2 = st.columns(2)
 with col1:
-    n = st.slider("Number of trials (n)", 1, 100, 20)
+    n = st.number_input("Number of trials (n)", min_value=1, max_value=PAGE_MAX_N, value=20, step=1)
 with col2:
     p = st.slider("Probability of success (p)", 0.0, 1.0, 0.5, 0.01)
 
-x = np.arange(0, n+1)
-pmf = [binomial_pmf(n, p, k) for k in x]
+# Full-support table from the shared cache; only the part with visible mass is plotted
+table = binomial_table(n, p)
+lo, hi = visible_range(table.pmf)
+x, pmf = table.k[lo:hi], table.pmf[lo:hi]
 
 fig = go.Figure()
-fig.add_trace(go.Bar(x=x, y=pmf, name="Probability Mass Function", marker_color='#FF4B4B'))
+if hi - lo <= 200:
+    fig.add_trace(go.Bar(x=x, y=pmf, name="Probability Mass Function", marker_color='#FF4B4B'))
+else:
+    fig.add_trace(go.Scatter(x=x, y=pmf, name="Probability Mass Function", mode='lines', fill='tozeroy',
+                             line=dict(color='#FF4B4B')))
 fig.update_layout(
     title=f"Binomial Distribution (n={n}, p={p:.2f})",
     xaxis_title="Number of Successes",
@@ -77,7 +79,7 @@ fig.update_layout(
     plot_bgcolor='rgba(0,0,0,0)',
     paper_bgcolor='rgba(0,0,0,0)'
 )
-st.plotly_chart(fig, use_container_width=True)
+st.plotly_chart(decimate_figure(fig), use_container_width=True)
 
 st.info("""
 This interactive plot shows the probability mass function (PMF) of the binomial distribution. 
@@ -96,7 +98,7 @@ with st.expander("Example 1: Coin Flipping"):
     - k = 6 (number of successes we're interested in)
     """)
 
-    prob_6_heads = binomial_pmf(10, 0.5, 6)
+    prob_6_heads = binomial_pmf(6, 10, 0.5)
     st.success(f"The probability of getting exactly 6 heads in 10 flips is: {prob_6_heads:.4f}")
 
 with st.expander("Example 2: Quality Control"):
@@ -110,7 +112,7 @@ with st.expander("Example 2: Quality Control"):
     - k = 3 (we want 3 or fewer defectives)
     """)
 
-    prob_3_or_fewer = binomial_cdf(100, 0.05, 3)
+    prob_3_or_fewer = binomial_cdf(3, 100, 0.05)
     st.success(f"The probability of 3 or fewer defective items in a batch of 100 is: {prob_3_or_fewer:.4f}")
 
 st.header("🧠 Quiz")
@@ -1,7 +1,8 @@
 import pygame
 import sys
-import math
-from scipy.stats import binom
+import time
+from functools import lru_cache
+from probability.binomial import binomial_table, visible_range
 import numpy as np
 
 # Initialize Pygame
@@ -13,83 +14,185 @@ WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
 BLUE = (0, 0, 255)
 RED = (255, 0, 0)
+GRAY = (120, 120, 120)
 LIGHT_BLUE = (173, 216, 230)
 
+FPS_CAP = 60
+MAX_N = 5000
+# Narrower bars than this are merged: each drawn bar then covers several values of k
+MIN_BAR_WIDTH = 4
+STATS_EVENT = pygame.USEREVENT + 1
+
+# Screen regions, redrawn only when their contents change; STATS_RECT lies inside PARAMS_RECT,
+# so the stats are drawn again after every params redraw
+PARAMS_RECT = pygame.Rect(0, 0, WIDTH, 185)
+STATS_RECT = pygame.Rect(WIDTH - 230, 20, 220, 60)
+CHART_RECT = pygame.Rect(0, 185, WIDTH, HEIGHT - 185)
+
 # Set up the display
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Binomial Distribution Simulator")
 
 # Font
 font = pygame.font.Font(None, 32)
+small_font = pygame.font.Font(None, 22)
 
 # Binomial Distribution parameters
 n = 10
 p = 0.5
 x = 5
 
-def draw_text(text, x, y, color=BLACK):
-    text_surface = font.render(text, True, color)
-    screen.blit(text_surface, (x, y))
-
-def draw_bar_chart(n, p, x):
-    x_range = np.arange(n + 1)
-    y = binom.pmf(x_range, n, p)
-    max_y = max(y)
-    bar_width = WIDTH // (n + 3)
-    
-    for i, prob in enumerate(y):
+@lru_cache(maxsize=512)
+def render_text(text, color=BLACK, small=False):
+    # Rendering glyphs is the most expensive part of a frame, so every surface is reused
+    return (small_font if small else font).render(text, True, color)
+
+def draw_text(text, x, y, color=BLACK, small=False):
+    surface = render_text(text, color, small)
+    screen.blit(surface, (x, y))
+
+def aggregate_bars(n, p, max_bars):
+    """PMF grouped into at most ``max_bars`` bars over the support with visible mass.
+
+    Returns the first k of each bar, the k-span per bar and each bar's total probability.
+    """
+    table = binomial_table(n, p)
+    lo, hi = visible_range(table.pmf, tol=1e-6)
+    span = max(1, -(-(hi - lo) // max_bars))
+    starts = np.arange(lo, hi, span)
+    return starts, span, np.add.reduceat(table.pmf[lo:hi], starts - lo)
+
+def draw_params():
+    screen.fill(WHITE, PARAMS_RECT)
+
+    # Draw title
+    draw_text("Binomial Distribution Simulator", 20, 20, BLUE)
+
+    # Draw parameters
+    draw_text(f"n (trials): {n} (↑↓, PgUp/PgDn ±100)", 20, 60)
+    draw_text(f"p (probability): {p:.1f} (←→)", 20, 90)
+    draw_text(f"x (successes): {x} (W/S, hold to scroll)", 20, 120)
+
+    # Draw probability
+    prob = binomial_table(n, p).pmf[x]
+    draw_text(f"P(X = {x}) = {prob:.4f}", 20, 150, RED)
+    return PARAMS_RECT
+
+def draw_bar_chart(bars):
+    starts, span, heights = bars
+    screen.fill(WHITE, CHART_RECT)
+    max_y = heights.max()
+    bar_width = WIDTH // (len(starts) + 2)
+    gap = 5 if bar_width > 15 else 1
+    label_every = max(1, len(starts) // 15)
+
+    for i, (start, prob) in enumerate(zip(starts, heights)):
         bar_height = int(prob / max_y * 400)
         bar_x = (i + 1) * bar_width
-        pygame.draw.rect(screen, LIGHT_BLUE, (bar_x, HEIGHT - 100 - bar_height, bar_width - 5, bar_height))
-        pygame.draw.rect(screen, BLACK, (bar_x, HEIGHT - 100 - bar_height, bar_width - 5, bar_height), 1)
-        
-        if i == x:
-            pygame.draw.rect(screen, RED, (bar_x, HEIGHT - 100 - bar_height, bar_width - 5, bar_height), 3)
-        
-        draw_text(str(i), bar_x + bar_width // 2 - 10, HEIGHT - 90)
+        bar = (bar_x, HEIGHT - 100 - bar_height, bar_width - gap, bar_height)
+        pygame.draw.rect(screen, LIGHT_BLUE, bar)
+        pygame.draw.rect(screen, BLACK, bar, 1)
 
-    draw_text("Number of Successes", WIDTH // 2 - 100, HEIGHT - 50)
+        if start <= x < start + span:
+            pygame.draw.rect(screen, RED, bar, 3)
 
-def main():
+        if i % label_every == 0:
+            label = str(start) if span == 1 else f"{start}+"
+            draw_text(label, bar_x + bar_width // 2 - 10, HEIGHT - 90, small=True)
+
+    caption = "Number of Successes" if span == 1 else f"Number of Successes ({span} values per bar)"
+    draw_text(caption, WIDTH // 2 - 100, HEIGHT - 50)
+    return CHART_RECT
+
+def draw_stats(frame_ms, cpu_percent, fps):
+    screen.fill(WHITE, STATS_RECT)
+    draw_text(f"frame {frame_ms:.2f} ms  {fps:.0f} fps", STATS_RECT.x, STATS_RECT.y, GRAY, small=True)
+    draw_text(f"CPU {cpu_percent:.1f}%", STATS_RECT.x, STATS_RECT.y + 20, GRAY, small=True)
+    return STATS_RECT
+
+def handle_key(key):
+    """Apply a key press; returns whether (n, p) changed and whether anything changed."""
     global n, p, x
-    
+    old = (n, p, x)
+    if key == pygame.K_UP:
+        n = min(n + 1, MAX_N)
+    elif key == pygame.K_DOWN:
+        n = max(n - 1, 1)
+    elif key == pygame.K_PAGEUP:
+        n = min(n + 100, MAX_N)
+    elif key == pygame.K_PAGEDOWN:
+        n = max(n - 100, 1)
+    elif key == pygame.K_RIGHT and p < 1:
+        p = round(p + 0.1, 1)
+    elif key == pygame.K_LEFT and p > 0:
+        p = round(p - 0.1, 1)
+    elif key == pygame.K_w and x < n:
+        x += 1
+    elif key == pygame.K_s and x > 0:
+        x -= 1
+    x = min(x, n)
+    return (n, p) != old[:2], (n, p, x) != old
+
+def main():
+    clock = pygame.time.Clock()
+    pygame.key.set_repeat(300, 30)
+    pygame.time.set_timer(STATS_EVENT, 1000)
+    max_bars = (WIDTH - 2 * MIN_BAR_WIDTH) // MIN_BAR_WIDTH
+
+    screen.fill(WHITE)
+    bars = aggregate_bars(n, p, max_bars)
+    draw_params()
+    draw_bar_chart(bars)
+    pygame.display.flip()
+
+    frames, render_time = 0, 0.0
+    last_wall, last_cpu = time.perf_counter(), time.process_time()
+    # Latest (frame ms, CPU %, fps); None until the first STATS_EVENT
+    stats = None
+
     while True:
-        for event in pygame.event.get():
+        # Block until something happens: an idle window costs no CPU
+        events = [pygame.event.wait()] + pygame.event.get()
+        params_dirty = chart_dirty = stats_dirty = False
+        dirty = []
+
+        for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
             elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_UP and n < 20:
-                    n += 1
-                elif event.key == pygame.K_DOWN and n > 1:
-                    n -= 1
-                elif event.key == pygame.K_RIGHT and p < 1:
-                    p = round(p + 0.1, 1)
-                elif event.key == pygame.K_LEFT and p > 0:
-                    p = round(p - 0.1, 1)
-                elif event.key == pygame.K_w and x < n:
-                    x += 1
-                elif event.key == pygame.K_s and x > 0:
-                    x -= 1
-
-        screen.fill(WHITE)
-
-        # Draw title
-        draw_text("Binomial Distribution Simulator", 20, 20, BLUE)
-
-        # Draw parameters
-        draw_text(f"n (trials): {n} (↑↓)", 20, 60)
-        draw_text(f"p (probability): {p:.1f} (←→)", 20, 90)
-        draw_text(f"x (successes): {x} (W/S)", 20, 120)
-
-        # Draw probability
-        prob = binom.pmf(x, n, p)
-        draw_text(f"P(X = {x}) = {prob:.4f}", 20, 150, RED)
-
-        # Draw bar chart
-        draw_bar_chart(n, p, x)
-
-        pygame.display.flip()
+                pmf_changed, changed = handle_key(event.key)
+                if pmf_changed:
+                    bars = aggregate_bars(n, p, max_bars)
+                params_dirty |= changed
+                chart_dirty |= changed
+            elif event.type == STATS_EVENT:
+                wall, cpu = time.perf_counter(), time.process_time()
+                elapsed = wall - last_wall
+                stats = (render_time / frames * 1e3 if frames else 0.0, 100 * (cpu - last_cpu) / elapsed,
+                         frames / elapsed)
+                stats_dirty = True
+                frames, render_time = 0, 0.0
+                last_wall, last_cpu = wall, cpu
+            elif event.type == pygame.WINDOWEXPOSED:
+                params_dirty = chart_dirty = True
+
+        if params_dirty or chart_dirty:
+            start = time.perf_counter()
+            if params_dirty:
+                dirty.append(draw_params())
+            if chart_dirty:
+                dirty.append(draw_bar_chart(bars))
+            render_time += time.perf_counter() - start
+            frames += 1
+            # Never redraw faster than the cap, even while a key is held down
+            clock.tick(FPS_CAP)
+
+        if stats is not None and (stats_dirty or params_dirty):
+            dirty.append(draw_stats(*stats))
+
+        if dirty:
+            pygame.display.update(dirty)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
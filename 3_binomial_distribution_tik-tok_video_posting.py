@@ -1,7 +1,8 @@
 import streamlit as st
 import plotly.graph_objects as go
-import numpy as np
-from scipy.stats import binom
+from probability.binomial import PAGE_MAX_N, binomial_table, visible_range
+from probability.decimation import decimate_figure
+from probability.distributions import binomial_moments, binomial_pmf, binomial_sf
 import random
 
 # Set page configuration
@@ -63,21 +64,23 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Helper functions
-def binomial_pmf(n, p, k):
-    return binom.pmf(k, n, p)
-
 def create_binomial_plot(n, p):
-    k = np.arange(0, n+1)
-    pmf = [binomial_pmf(n, p, ki) for ki in k]
+    table = binomial_table(n, p)
+    lo, hi = visible_range(table.pmf)
+    k, pmf = table.k[lo:hi], table.pmf[lo:hi]
     
-    fig = go.Figure(data=[go.Bar(
-        x=k, 
-        y=pmf, 
-        text=[f'{prob:.3f}' for prob in pmf],
-        textposition='auto',
-        marker_color='#1e90ff',
-        opacity=0.8
-    )])
+    if hi - lo <= 100:
+        fig = go.Figure(data=[go.Bar(
+            x=k, 
+            y=pmf, 
+            text=[f'{prob:.3f}' for prob in pmf],
+            textposition='auto',
+            marker_color='#1e90ff',
+            opacity=0.8
+        )])
+    else:
+        # Too many bars to label; draw the PMF as a filled curve and thin it to the point budget
+        fig = go.Figure(data=[go.Scatter(x=k, y=pmf, mode='lines', fill='tozeroy', line=dict(color='#1e90ff'))])
     fig.update_layout(
         title=f'Binomial Distribution (n={n}, p={p:.2f})',
         xaxis_title='Number of TikTok Video Posters (k)',
@@ -85,7 +88,7 @@ def create_binomial_plot(n, p):
         plot_bgcolor='rgba(0,0,0,0)',
         paper_bgcolor='rgba(0,0,0,0)'
     )
-    return fig
+    return decimate_figure(fig)
 
 # Main content
 st.title('TikTok Video Posting: Binomial Distribution Explorer')
@@ -101,7 +104,7 @@ exciting journey through the Binomial Distribution! 🚀
 st.subheader('Set Your Parameters')
 col1, col2 = st.columns(2)
 with col1:
-    n = st.slider('Number of adults surveyed (n)', 5, 100, 25)
+    n = st.number_input('Number of adults surveyed (n)', min_value=5, max_value=PAGE_MAX_N, value=25, step=1)
 with col2:
     p = st.slider('Probability an adult has posted a TikTok video (p)', 0.0, 1.0, 0.3, 0.01)
 
@@ -113,16 +116,16 @@ st.plotly_chart(create_binomial_plot(n, p), use_container_width=True)
 st.subheader('Explore Probabilities')
 k = st.slider('Number of adults who have posted a TikTok video (k)', 0, n, n//2)
 
-probability = binomial_pmf(n, p, k)
+table = binomial_table(n, p)
+probability = table.pmf[k]
 st.write(f"Probability of exactly {k} out of {n} adults having posted a TikTok video: {probability:.4f}")
 
-cumulative = sum([binomial_pmf(n, p, i) for i in range(k+1)])
+cumulative = table.cdf[k]
 st.write(f"Probability of {k} or fewer adults having posted a TikTok video: {cumulative:.4f}")
 
 # Expected Value and Variance
 st.subheader('Expected Value and Variance')
-expected = n * p
-variance = n * p * (1-p)
+expected, variance, _ = binomial_moments(n, p)
 st.write(f"Expected number of adults who have posted a TikTok video: E(X) = np = {expected:.2f}")
 st.write(f"Variance: Var(X) = np(1-p) = {variance:.2f}")
 
@@ -140,7 +143,7 @@ what's the probability that exactly 8 adults have posted a video?
 </div>
 """, unsafe_allow_html=True)
 
-ex1_prob = binomial_pmf(20, 0.4, 8)
+ex1_prob = binomial_pmf(8, 20, 0.4)
 st.write(f"Solution: The probability is {ex1_prob:.4f} or about {ex1_prob*100:.2f}%")
 
 # Example 2
@@ -151,7 +154,7 @@ what's the probability that 20 or more adults have posted a video?
 </div>
 """, unsafe_allow_html=True)
 
-ex2_prob = 1 - sum([binomial_pmf(50, 0.3, i) for i in range(20)])
+ex2_prob = binomial_sf(19, 50, 0.3)
 st.write(f"Solution: The probability is {ex2_prob:.4f} or about {ex2_prob*100:.2f}%")
 
 # Quiz Section
@@ -189,7 +192,7 @@ q2 = st.radio(
 )
 
 if st.button('Check Answer for Question 2'):
-    probs = [binomial_pmf(15, 0.2, k) for k in [2, 5, 8]]
+    probs = binomial_pmf([2, 5, 8], 15, 0.2)
     correct_answer = 'Exactly 2 adults have posted a video'
     if q2 == correct_answer:
         st.success(f"Correct! {correct_answer} is the most likely outcome.")
@@ -1,6 +1,8 @@
 import streamlit as st
 import plotly.graph_objects as go
 import numpy as np
+from probability.distributions import uniform_pdf
+from probability.rng import session_rng
 
 def introduction():
     st.write("""
@@ -20,7 +22,7 @@ def introduction():
 def interactive_simulation():
     st.subheader("🎭 Interactive Simulation")
     if st.button("Roll a Die 🎲"):
-        result = np.random.randint(1, 7)
+        result = session_rng().generator("die_roll").integers(1, 7)
         st.success(f"You rolled a {result}!")
         st.balloons()
     
@@ -33,7 +35,7 @@ def visualization():
     st.subheader("📊 Uniform Distribution Visualizer")
     a, b = st.slider("Range (a, b)", 0, 10, (0, 5))
     x = np.linspace(a-1, b+1, 1000)
-    y = np.where((x >= a) & (x <= b), 1/(b-a), 0)
+    y = uniform_pdf(x, a, b)
     fig = go.Figure(go.Scatter(x=x, y=y, mode='lines', fill='tozeroy', line_color='#FF4B4B'))
     fig.update_layout(
         title='Probability Density Function',
@@ -1,7 +1,9 @@
 import streamlit as st
 import plotly.graph_objects as go
 import numpy as np
-import random
+from probability.distributions import discrete_uniform_pmf, uniform_pdf
+from probability.montecarlo import dice_task, lottery_task, run_simulation
+from probability.rng import session_rng
 
 def set_page_config():
     st.set_page_config(page_title="Uniform Distribution in Real Life", layout="wide")
@@ -49,14 +51,17 @@ def dice_roll_simulation():
     col1, col2 = st.columns(2)
     with col1:
         if st.button("Roll the Dice!"):
-            result = random.randint(1, 6)
+            result = session_rng().generator("dice_roll").integers(1, 7)
             st.success(f"You rolled a {result}!")
             st.balloons()
     with col2:
-        rolls = st.slider("Number of rolls", 100, 10000, 1000)
-        results = [random.randint(1, 6) for _ in range(rolls)]
-        fig = go.Figure(data=[go.Histogram(x=results, nbinsx=6)])
-        fig.update_layout(title=f"Distribution of {rolls} Dice Rolls", xaxis_title="Dice Value", yaxis_title="Frequency")
+        rolls = st.select_slider("Number of rolls", options=[100, 1000, 10**4, 10**5, 10**6, 10**7],
+                                 value=1000, format_func=lambda n: f"{n:,}")
+        # Rolls are counted per face in chunks, in-process: the figure only receives six bars
+        counts = run_simulation(dice_task, rolls, seed=session_rng().seed_sequence("dice_rolls"), max_workers=1)["counts"]
+        fig = go.Figure(data=[go.Bar(x=np.arange(1, 7), y=counts)])
+        fig.add_hline(y=rolls / 6, line_dash="dash", line_color="red", annotation_text="Expected")
+        fig.update_layout(title=f"Distribution of {rolls:,} Dice Rolls", xaxis_title="Dice Value", yaxis_title="Frequency")
         st.plotly_chart(fig)
 
 def roulette_wheel():
@@ -67,7 +72,7 @@ def roulette_wheel():
     colors = ['green'] + ['red' if n % 2 else 'black' for n in range(1, 37)]
     
     if st.button("Spin the Wheel!"):
-        result = random.choice(numbers)
+        result = int(session_rng().generator("roulette").choice(numbers))
         color = colors[numbers.index(result)]
         st.success(f"The ball landed on {result} ({color})!")
         
@@ -84,11 +89,10 @@ def random_number_generator():
     max_val = st.number_input("Maximum value", value=100)
     
     if st.button("Generate Random Number"):
-        result = random.randint(min_val, max_val)
+        result = session_rng().generator("random_number").integers(min_val, max_val, endpoint=True)
         st.success(f"Your random number is: {result}")
         
-        x = list(range(min_val, max_val+1))
-        y = [1/(max_val-min_val+1)] * len(x)
+        x, y = discrete_uniform_pmf(min_val, max_val)
         fig = go.Figure(go.Bar(x=x, y=y, marker_color='lightblue'))
         fig.add_vline(x=result, line_width=3, line_dash="dash", line_color="red")
         fig.update_layout(title="Uniform Distribution of Random Numbers", xaxis_title="Number", yaxis_title="Probability")
@@ -99,11 +103,11 @@ def waiting_time():
     st.write("If buses arrive every 15 minutes, your waiting time is uniformly distributed between 0 and 15 minutes.")
     
     if st.button("Simulate Arrival"):
-        wait_time = random.uniform(0, 15)
+        wait_time = session_rng().generator("waiting_time").uniform(0, 15)
         st.success(f"You waited for {wait_time:.2f} minutes.")
         
         x = np.linspace(0, 15, 100)
-        y = [1/15] * 100
+        y = uniform_pdf(x, 0, 15)
         fig = go.Figure(go.Scatter(x=x, y=y, fill='tozeroy'))
         fig.add_vline(x=wait_time, line_width=3, line_dash="dash", line_color="red")
         fig.update_layout(title="Uniform Distribution of Waiting Times", xaxis_title="Time (minutes)", yaxis_title="Probability Density")
@@ -114,17 +118,24 @@ def lottery_simulation():
     st.write("In a lottery, each ticket has an equal chance of winning.")
     
     total_tickets = st.number_input("Total number of tickets", min_value=1, value=1000)
-    num_simulations = st.slider("Number of simulations", 1, 10000, 1000)
+    num_simulations = st.select_slider("Number of simulations", options=[10, 100, 1000, 10**4, 10**5, 10**6, 10**7, 10**8],
+                                       value=1000, format_func=lambda n: f"{n:,}")
     
     if st.button("Run Lottery Simulation"):
-        wins = [random.randint(1, total_tickets) for _ in range(num_simulations)]
-        your_ticket = random.randint(1, total_tickets)
-        your_wins = wins.count(your_ticket)
+        rng_service = session_rng()
+        your_ticket = int(rng_service.generator("lottery_ticket").integers(1, total_tickets, endpoint=True))
+        # Draws are sharded across worker processes; only the win count and a binned histogram come back
+        bar = st.progress(0.0)
+        result = run_simulation(lottery_task, num_simulations, seed=rng_service.seed_sequence("lottery"),
+                                progress=lambda done, total: bar.progress(done / total),
+                                total_tickets=total_tickets, ticket=your_ticket)
+        your_wins = result["wins"]
         
         st.success(f"Your ticket number: {your_ticket}")
-        st.info(f"You won {your_wins} times out of {num_simulations} draws!")
+        st.info(f"You won {your_wins:,} times out of {num_simulations:,} draws!")
         
-        fig = go.Figure(data=[go.Histogram(x=wins, nbinsx=50)])
+        edges = np.linspace(1, total_tickets + 1, len(result["hist"]) + 1)
+        fig = go.Figure(data=[go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=result["hist"], width=np.diff(edges))])
         fig.add_vline(x=your_ticket, line_width=3, line_dash="dash", line_color="red")
         fig.update_layout(title=f"Distribution of Winning Tickets in {num_simulations} Draws", xaxis_title="Ticket Number", yaxis_title="Frequency")
         st.plotly_chart(fig)
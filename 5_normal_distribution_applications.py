@@ -1,7 +1,10 @@
 import streamlit as st
 import plotly.graph_objects as go
 import numpy as np
-from scipy import stats
+import os
+from probability.batch import OUTPUT_FORMATS, ScratchDir, file_format, numeric_columns, score_normal_file
+from probability.distributions import normal_cdf, normal_pdf, normal_sf, normal_two_sided_tail
+from probability.rng import session_rng
 
 # Set page config
 st.set_page_config(page_title="Normal Distribution in Real Life", layout="wide", initial_sidebar_state="expanded")
@@ -51,7 +54,7 @@ Explore real-life applications of the normal distribution in the interactive tab
 # Function to create a bell curve
 def create_bell_curve(mean, std_dev, title, x_label, highlight_value=None):
     x = np.linspace(mean - 4*std_dev, mean + 4*std_dev, 1000)
-    y = stats.norm.pdf(x, mean, std_dev)
+    y = normal_pdf(x, mean, std_dev)
     
     fig = go.Figure()
     
@@ -65,14 +68,14 @@ def create_bell_curve(mean, std_dev, title, x_label, highlight_value=None):
     
     # Highlight area if a value is provided
     if highlight_value is not None:
-        highlight_y = stats.norm.pdf(highlight_value, mean, std_dev)
+        highlight_y = normal_pdf(highlight_value, mean, std_dev)
         fig.add_trace(go.Scatter(x=[highlight_value, highlight_value], y=[0, highlight_y], 
                                  mode='lines', name='Selected Value',
                                  line=dict(color='#e53e3e', width=2)))
         
         # Shade area
         x_fill = x[x <= highlight_value]
-        y_fill = stats.norm.pdf(x_fill, mean, std_dev)
+        y_fill = normal_pdf(x_fill, mean, std_dev)
         fig.add_trace(go.Scatter(x=x_fill, y=y_fill, fill='tozeroy', 
                                  fillcolor='rgba(229, 62, 62, 0.3)', 
                                  line=dict(color='rgba(255, 255, 255, 0)'),
@@ -89,7 +92,7 @@ def create_bell_curve(mean, std_dev, title, x_label, highlight_value=None):
     return fig
 
 # Tabs
-tab1, tab2, tab3, tab4, tab5 = st.tabs(["🧠 IQ Scores", "📏 Human Height", "🏭 Manufacturing", "💹 Finance", "🐘 Natural Phenomena"])
+tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(["🧠 IQ Scores", "📏 Human Height", "🏭 Manufacturing", "💹 Finance", "🐘 Natural Phenomena", "📂 Bulk Scoring"])
 
 with tab1:
     st.header("IQ Scores")
@@ -100,7 +103,7 @@ with tab1:
         iq_score = st.slider("Enter an IQ score:", min_value=40, max_value=160, value=100, step=1, key="iq")
     with col2:
         if st.button("Calculate IQ Percentile", key="iq_button"):
-            percentile = stats.norm.cdf(iq_score, loc=100, scale=15)
+            percentile = normal_cdf(iq_score, 100, 15)
             st.metric("Percentile", f"{percentile*100:.2f}%")
     
     st.plotly_chart(create_bell_curve(100, 15, "IQ Score Distribution", "IQ Score", iq_score), use_container_width=True)
@@ -137,7 +140,7 @@ with tab2:
         if st.button("Calculate Height Percentile", key="height_button"):
             mean = 175 if gender == "Male" else 162
             std_dev = 7
-            percentile = stats.norm.cdf(height, loc=mean, scale=std_dev)
+            percentile = normal_cdf(height, mean, std_dev)
             st.metric("Percentile", f"{percentile*100:.2f}%")
     
     mean = 175 if gender == "Male" else 162
@@ -173,7 +176,7 @@ with tab3:
         tolerance = st.number_input("Tolerance (±mm):", min_value=0.1, max_value=10.0, value=0.5, step=0.1, key="tolerance")
     with col3:
         if st.button("Calculate Defect Rate", key="manufacturing_button"):
-            defect_rate = 2 * (1 - stats.norm.cdf(tolerance / (target_size * 0.01)))
+            defect_rate = normal_two_sided_tail(tolerance / (target_size * 0.01))
             st.metric("Defect Rate", f"{defect_rate*100:.2f}%")
     
     st.plotly_chart(create_bell_curve(target_size, target_size*0.01, "Product Size Distribution", "Size (mm)", target_size + tolerance), use_container_width=True)
@@ -208,7 +211,7 @@ with tab4:
         volatility = st.slider("Market Volatility (%):", min_value=0.1, max_value=5.0, value=1.0, step=0.1, key="volatility")
     with col3:
         if st.button("Calculate Return Probability", key="finance_button"):
-            probability = 1 - stats.norm.cdf(abs(daily_return) / volatility)
+            probability = normal_sf(abs(daily_return) / volatility)
             st.metric("Probability of more extreme return", f"{probability*100:.2f}%")
     
     st.plotly_chart(create_bell_curve(0, volatility, "Daily Return Distribution", "Return (%)", daily_return), use_container_width=True)
@@ -251,7 +254,7 @@ with tab5:
             mean, std_dev = 0.1, 0.02
     with col3:
         if st.button("Calculate Birth Weight Percentile", key="nature_button"):
-            percentile = stats.norm.cdf(birth_weight, loc=mean, scale=std_dev)
+            percentile = normal_cdf(birth_weight, mean, std_dev)
             st.metric("Percentile", f"{percentile*100:.2f}%")
     
     st.plotly_chart(create_bell_curve(mean, std_dev, f"{species} Birth Weight Distribution", "Weight (kg)", birth_weight), use_container_width=True)
@@ -275,6 +278,100 @@ with tab5:
     Remember, while birth weights tend to follow a normal distribution, factors like genetics, nutrition, and environmental conditions can influence individual cases.
     """)
 
+with tab6:
+    st.header("Bulk Percentile Scoring")
+    st.write("Score a whole cohort at once: upload a CSV or Parquet file of measurements and get the z-score, percentile and tail flag of every row.")
+
+    presets = {
+        "IQ Scores": (100.0, 15.0),
+        "Male Height (cm)": (175.0, 7.0),
+        "Female Height (cm)": (162.0, 7.0),
+        "Human Birth Weight (kg)": (3.5, 0.5),
+        "Elephant Birth Weight (kg)": (120.0, 15.0),
+        "Penguin Birth Weight (kg)": (0.1, 0.02),
+        "Custom": (0.0, 1.0),
+    }
+
+    col1, col2, col3, col4 = st.columns([1, 1, 1, 1])
+    with col1:
+        preset = st.selectbox("Distribution:", list(presets), key="bulk_preset")
+    with col2:
+        bulk_mean = st.number_input("Mean (μ):", value=presets[preset][0], format="%g", key=f"bulk_mean_{preset}")
+    with col3:
+        bulk_std = st.number_input("Standard deviation (σ):", min_value=1e-9, value=presets[preset][1], format="%g", key=f"bulk_std_{preset}")
+    with col4:
+        tail = st.slider("Flag the lowest/highest (%):", min_value=0.5, max_value=10.0, value=2.5, step=0.5, key="bulk_tail") / 100
+
+    def discard_bulk_result():
+        previous = st.session_state.pop("bulk_result", None)
+        if previous is not None and os.path.exists(previous["path"]):
+            os.remove(previous["path"])
+
+    uploaded = st.file_uploader("Measurements file", type=["csv", "parquet"], key="bulk_file")
+    if uploaded is None:
+        discard_bulk_result()
+    else:
+        fmt = file_format(uploaded.name)
+        columns = numeric_columns(uploaded, fmt)
+        if not columns:
+            st.error("The file has no numeric columns to score.")
+        else:
+            col1, col2 = st.columns([1, 1])
+            with col1:
+                column = st.selectbox("Column to score:", columns, key="bulk_column")
+            with col2:
+                out_format = st.radio("Output format:", list(OUTPUT_FORMATS), format_func=str.capitalize,
+                                      horizontal=True, key="bulk_out_format")
+            if st.button("Score File", key="bulk_button"):
+                discard_bulk_result()
+                # Scored rows go straight to disk so memory stays bounded by the chunk size; the session's
+                # scratch directory is removed when the session ends
+                if "bulk_scratch" not in st.session_state:
+                    st.session_state.bulk_scratch = ScratchDir()
+                path = st.session_state.bulk_scratch.new_file(OUTPUT_FORMATS[out_format])
+                bar = st.progress(0.0, text="Scoring...")
+                summary = score_normal_file(uploaded, fmt, column, bulk_mean, bulk_std, path, out_format, tail=tail,
+                                            progress=lambda fraction: bar.progress(fraction, text="Scoring..."))
+                bar.empty()
+                st.session_state.bulk_result = {"path": path, "name": uploaded.name, "column": column,
+                                                "mean": bulk_mean, "std": bulk_std, "summary": summary}
+
+    result = st.session_state.get("bulk_result")
+    if result is not None and os.path.exists(result["path"]):
+        summary = result["summary"]
+        valid = summary["rows"] - summary["invalid"]
+        moments = summary["moments"]
+
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Rows scored", f"{summary['rows']:,}", help=f"{summary['invalid']:,} rows were not numeric")
+        col2.metric("Low tail", f"{summary['low']:,}", f"{summary['low'] / max(valid, 1):.2%} of rows", delta_color="off")
+        col3.metric("High tail", f"{summary['high']:,}", f"{summary['high'] / max(valid, 1):.2%} of rows", delta_color="off")
+        col4.metric("Observed mean ± SD", f"{moments.mean:.4g} ± {moments.std(ddof=1):.4g}",
+                    f"model: {result['mean']:g} ± {result['std']:g}", delta_color="off")
+
+        hist = summary["percentiles"]
+        fig = go.Figure(go.Bar(x=hist.centers * 100, y=hist.counts, width=100 / len(hist.counts),
+                               marker_color='#4e7dd1'))
+        fig.add_hline(y=valid / len(hist.counts), line_dash="dash", line_color="#2c5282",
+                      annotation_text="Expected if the model fits")
+        fig.update_layout(title=dict(text="Percentiles of the scored values", x=0.5, xanchor='center'),
+                          xaxis_title="Percentile (%)", yaxis_title="Rows", bargap=0.05)
+        st.plotly_chart(fig, use_container_width=True)
+
+        # The file is only read when the button is clicked
+        st.download_button("Download scored rows", data=lambda: open(result["path"], "rb"),
+                           file_name=f"{os.path.splitext(result['name'])[0]}_{result['column']}_scores{os.path.splitext(result['path'])[1]}",
+                           mime="application/octet-stream", on_click="ignore", key="bulk_download")
+
+        st.write("""
+        **Explanation:**
+
+        Each row's z-score is (value − μ) / σ and its percentile is the share of the normal distribution at or below it.
+        Rows in the lowest or highest tail you chose are flagged `low` or `high` in the downloaded file.
+        If the measurements really follow the chosen normal distribution, every percentile band holds about the same number of rows;
+        a U-shape means the data are more spread out than the model assumes, and a hump in the middle means they are less.
+        """)
+
 # Add an explanation about the application
 st.sidebar.title("About this app")
 st.sidebar.write("""
@@ -285,6 +382,7 @@ This interactive application demonstrates five real-life applications of the nor
 3. 🏭 Manufacturing Tolerances
 4. 💹 Financial Returns
 5. 🐘 Natural Phenomena (Birth Weights)
+6. 📂 Bulk Scoring of uploaded measurement files
 
 Each tab allows you to interact with the normal distribution in a different context. 
 Enter values using the sliders and input fields, then see how they relate to the normal distribution for each scenario.
@@ -306,7 +404,7 @@ fun_facts = [
     "The normal distribution is used in many fields, including psychology, biology, and finance.",
     "The standard normal distribution has a mean of 0 and a standard deviation of 1."
 ]
-st.sidebar.info(np.random.choice(fun_facts))
+st.sidebar.info(session_rng().generator("fun_fact").choice(fun_facts))
 
 # Add a footer
 st.markdown("""
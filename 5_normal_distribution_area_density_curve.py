@@ -1,7 +1,7 @@
 import streamlit as st
 import plotly.graph_objects as go
 import numpy as np
-from scipy import stats
+from probability.distributions import normal_interval_probability, normal_pdf
 
 def main():
     st.set_page_config(page_title="Normal Distribution Area Explorer", layout="wide")
@@ -38,7 +38,7 @@ def interactive_plot():
         std_dev = st.slider("Standard Deviation (σ)", 0.1, 3.0, 1.0, 0.1)
     
     x = np.linspace(-10, 10, 1000)
-    y = stats.norm.pdf(x, mean, std_dev)
+    y = normal_pdf(x, mean, std_dev)
     
     fig = go.Figure()
     fig.add_trace(go.Scatter(x=x, y=y, mode='lines', name='Normal Distribution', line=dict(color='royalblue', width=3)))
@@ -47,11 +47,11 @@ def interactive_plot():
     upper = st.slider("Upper bound", lower, 10.0, float(mean + std_dev), 0.1)
     
     x_fill = np.linspace(max(lower, -10), min(upper, 10), 100)
-    y_fill = stats.norm.pdf(x_fill, mean, std_dev)
+    y_fill = normal_pdf(x_fill, mean, std_dev)
     
     fig.add_trace(go.Scatter(x=x_fill, y=y_fill, fill='tozeroy', fillcolor='rgba(255,0,0,0.3)', line=dict(color='rgba(255,0,0,0.5)'), name='Area'))
     
-    prob = stats.norm.cdf(upper, mean, std_dev) - stats.norm.cdf(lower, mean, std_dev)
+    prob = normal_interval_probability(lower, upper, mean, std_dev)
     
     fig.update_layout(
         title=f"Normal Distribution (μ={mean:.2f}, σ={std_dev:.2f})",
@@ -103,7 +103,7 @@ def probability_calculator():
     with col2:
         upper = st.number_input("Upper bound", value=float(mean + std_dev), step=0.1)
     
-    prob = stats.norm.cdf(upper, mean, std_dev) - stats.norm.cdf(lower, mean, std_dev)
+    prob = normal_interval_probability(lower, upper, mean, std_dev)
     
     st.write(f"The probability of a value between {lower} and {upper} is: {prob:.4f}")
     
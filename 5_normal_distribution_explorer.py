@@ -1,10 +1,7 @@
 import streamlit as st
 import plotly.graph_objects as go
 import numpy as np
-from scipy import stats
-
-def normal_pdf(x, mu, sigma):
-    return (1 / (sigma * np.sqrt(2 * np.pi))) * np.exp(-(x - mu)**2 / (2 * sigma**2))
+from probability.distributions import normal_pdf, normal_sf
 
 st.set_page_config(layout="wide", page_title="Normal Distribution Explorer", page_icon="🔔")
 
@@ -127,7 +124,7 @@ with tab2:
     2. Use a z-table or statistical function to find the area to the right of z = 2.
     """)
 
-    prob = 1 - stats.norm.cdf(2)
+    prob = normal_sf(2)
     st.write(f"Probability = {prob:.4f} or {prob*100:.2f}%")
 
     st.write("""
@@ -1,7 +1,9 @@
 import streamlit as st
 import plotly.graph_objects as go
 import numpy as np
-from scipy import stats
+import pandas as pd
+from probability.batch import breach_probabilities, file_format, fit_file, numeric_columns
+from probability.distributions import normal_interval_probability, normal_pdf, normal_sf
 
 def main():
     st.set_page_config(page_title="Food Delivery Time Explorer", layout="wide")
@@ -14,7 +16,7 @@ def main():
     how delivery times are distributed and what you can expect from a food delivery service.
     """)
     
-    tab1, tab2, tab3 = st.tabs(["📊 Interactive Plot", "🧮 Probability Calculator", "🧠 Quiz"])
+    tab1, tab2, tab3, tab4 = st.tabs(["📊 Interactive Plot", "🧮 Probability Calculator", "📂 Delivery Log Analytics", "🧠 Quiz"])
     
     with tab1:
         interactive_plot()
@@ -23,6 +25,9 @@ def main():
         probability_calculator()
     
     with tab3:
+        delivery_log_analytics()
+    
+    with tab4:
         quiz()
 
 def interactive_plot():
@@ -35,7 +40,7 @@ def interactive_plot():
         std_dev = st.slider("Standard deviation (minutes)", 1, 20, 10)
     
     x = np.linspace(0, 80, 1000)
-    y = stats.norm.pdf(x, mean, std_dev)
+    y = normal_pdf(x, mean, std_dev)
     
     fig = go.Figure()
     fig.add_trace(go.Scatter(x=x, y=y, mode='lines', name='Delivery Time Distribution', line=dict(color='royalblue', width=3)))
@@ -91,7 +96,7 @@ def probability_calculator():
     with col2:
         upper = st.number_input("Maximum time (minutes)", value=50, min_value=int(lower), max_value=int(mean*2))
     
-    prob = stats.norm.cdf(upper, mean, std_dev) - stats.norm.cdf(lower, mean, std_dev)
+    prob = normal_interval_probability(lower, upper, mean, std_dev)
     
     st.write(f"The probability of a delivery taking between {lower} and {upper} minutes is: {prob:.2%}")
     
@@ -105,6 +110,108 @@ def probability_calculator():
     This is a powerful way to estimate delivery times and set customer expectations!
     """)
 
+def delivery_log_analytics():
+    st.header("Delivery Log SLA Analytics")
+    st.write("Upload a log of real delivery times (CSV or Parquet) to fit a normal model and check SLA breach rates against the data.")
+    
+    uploaded = st.file_uploader("Delivery log", type=["csv", "parquet"], key="log_file")
+    if uploaded is not None:
+        fmt = file_format(uploaded.name)
+        columns = numeric_columns(uploaded, fmt)
+        if not columns:
+            st.error("The log has no numeric columns.")
+        else:
+            col1, col2 = st.columns(2)
+            with col1:
+                # Preselect the first column that looks like a duration rather than an ID
+                guess = next((i for i, name in enumerate(columns) if any(word in name.lower() for word in ("time", "min", "duration"))), 0)
+                column = st.selectbox("Delivery time column (minutes)", columns, index=guess, key="log_column")
+            with col2:
+                max_minutes = st.number_input("Longest delivery to resolve (minutes)", value=240, min_value=10, max_value=1440,
+                                              help="Times above this are still counted, but tail probabilities beyond it are not resolved.")
+            
+            if st.button("Analyze Log"):
+                bar = st.progress(0.0, text="Reading log...")
+                # Quarter-minute bins: fine enough to read breach rates at any SLA window
+                edges = np.arange(0, max_minutes + 0.25, 0.25)
+                summary = fit_file(uploaded, fmt, column, edges, progress=lambda fraction: bar.progress(fraction, text="Reading log..."))
+                bar.empty()
+                st.session_state.delivery_log = {"name": uploaded.name, "column": column, "summary": summary}
+    
+    log = st.session_state.get("delivery_log")
+    if log is None:
+        return
+    summary = log["summary"]
+    moments = summary["moments"]
+    if moments.count < 2:
+        st.error("The log needs at least two numeric delivery times.")
+        return
+    mean, std_dev = moments.mean, moments.std(ddof=1)
+    
+    st.subheader(f"Fitted model for {log['name']} ({log['column']})")
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Deliveries", f"{moments.count:,}", help=f"{summary['invalid']:,} rows were not numeric")
+    col2.metric("Mean", f"{mean:.2f} min")
+    col3.metric("Standard deviation", f"{std_dev:.2f} min")
+    col4.metric("Skewness", f"{moments.skewness:.2f}", help="0 for a normal distribution; positive means a long tail of late deliveries.")
+    
+    # The fit is kept in the session, so changing the windows does not re-read the log
+    longest = int(summary["hist"].edges[-1])
+    lower, upper = st.slider("SLA windows (minutes)", 5, longest, (min(20, longest), min(90, longest)), key="sla_range")
+    step = st.number_input("Window step (minutes)", value=5, min_value=1, max_value=60, key="sla_step")
+    breaches = breach_probabilities(summary, np.arange(lower, upper + 1, step))
+    
+    table = pd.DataFrame({
+        "SLA (minutes)": breaches["threshold"],
+        "Breach rate, normal model": breaches["normal"],
+        "Breach rate, observed": breaches["empirical"],
+        "Observed / model": breaches["empirical"] / breaches["normal"],
+    })
+    st.dataframe(table.style.format({
+        "SLA (minutes)": "{:.0f}",
+        "Breach rate, normal model": "{:.3%}",
+        "Breach rate, observed": "{:.3%}",
+        "Observed / model": "{:.2f}x",
+    }), hide_index=True)
+    
+    hist = summary["hist"]
+    x = hist.edges
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=x, y=hist.sf(x), mode='lines', name='Observed', line=dict(color='royalblue', width=3)))
+    fig.add_trace(go.Scatter(x=x, y=normal_sf(x, mean, std_dev), mode='lines', name='Normal model', line=dict(color='red', width=2, dash='dash')))
+    fig.update_layout(
+        title="Probability a delivery takes longer than t",
+        xaxis_title="t (minutes)",
+        yaxis_title="P(delivery time > t)",
+        yaxis_type="log",
+        yaxis_range=[np.log10(max(1 / moments.count, 1e-12)) - 0.5, 0.1],
+        height=500
+    )
+    st.plotly_chart(fig, use_container_width=True)
+    
+    density = hist.counts / (hist.total * np.diff(hist.edges))
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=hist.centers, y=density, name='Observed', marker_color='royalblue', opacity=0.6))
+    fig.add_trace(go.Scatter(x=hist.centers, y=normal_pdf(hist.centers, mean, std_dev), mode='lines', name='Normal model', line=dict(color='red', width=2)))
+    fig.update_layout(
+        title="Delivery Time Distribution: Observed vs Normal Model",
+        xaxis_title="Delivery Time (minutes)",
+        yaxis_title="Probability Density",
+        bargap=0,
+        height=500
+    )
+    st.plotly_chart(fig, use_container_width=True)
+    
+    st.markdown("""
+    ### Reading the results
+    
+    - The normal model uses the mean and standard deviation of every delivery in the log.
+    - A breach rate is the share of deliveries that take longer than the SLA window.
+    - If the observed / model ratio is well above 1 for long windows, late deliveries are more common than the normal model predicts.
+      Real delivery times are often right-skewed, so an SLA promise based only on the normal model can be too optimistic.
+    - On the log-scale tail plot, the gap between the two curves shows how far the model is off for rare, very late deliveries.
+    """)
+
 def quiz():
     st.header("Food Delivery Time Quiz")
     
@@ -1,7 +1,7 @@
 import streamlit as st
 import plotly.graph_objects as go
 import numpy as np
-from scipy import stats
+from probability.distributions import normal_interval_probability, normal_pdf
 
 def main():
     st.set_page_config(page_title="Normal Distribution Explorer", layout="wide")
@@ -73,7 +73,7 @@ def interactive_plot():
         std_dev = st.slider("Select the standard deviation", 0.1, 3.0, 1.0, 0.1)
     
     x = np.linspace(-10, 10, 1000)
-    y = stats.norm.pdf(x, mean, std_dev)
+    y = normal_pdf(x, mean, std_dev)
     
     fig = go.Figure()
     fig.add_trace(go.Scatter(x=x, y=y, mode='lines', name='Normal Distribution', line=dict(color='royalblue', width=3)))
@@ -101,7 +101,7 @@ def interactive_plot():
     lower = st.number_input("Lower bound", value=mean-std_dev, format="%.2f")
     upper = st.number_input("Upper bound", value=mean+std_dev, format="%.2f")
     
-    prob = stats.norm.cdf(upper, mean, std_dev) - stats.norm.cdf(lower, mean, std_dev)
+    prob = normal_interval_probability(lower, upper, mean, std_dev)
     st.write(f"Probability of a value between {lower:.2f} and {upper:.2f}: {prob:.4f}")
 
 def numerical_examples():
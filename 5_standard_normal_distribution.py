@@ -1,7 +1,7 @@
 import streamlit as st
 import plotly.graph_objects as go
 import numpy as np
-from scipy import stats
+from probability.distributions import normal_pdf, z_score as standardize
 
 def main():
     st.set_page_config(page_title="Standard Normal Distribution Explorer", layout="wide")
@@ -38,10 +38,10 @@ def interactive_plot():
         std_dev = st.slider("Standard Deviation (σ)", 0.1, 3.0, 1.0, 0.1)
     
     x = np.linspace(mean - 4*std_dev, mean + 4*std_dev, 1000)
-    y = stats.norm.pdf(x, mean, std_dev)
+    y = normal_pdf(x, mean, std_dev)
     
-    x_standard = (x - mean) / std_dev
-    y_standard = stats.norm.pdf(x_standard, 0, 1)
+    x_standard = standardize(x, mean, std_dev)
+    y_standard = normal_pdf(x_standard)
     
     fig = go.Figure()
     fig.add_trace(go.Scatter(x=x, y=y, mode='lines', name='Original Distribution', line=dict(color='green', width=3)))
@@ -92,7 +92,7 @@ def standardization_calculator():
     with col3:
         std_dev = st.number_input("Standard Deviation (σ)", value=1.0, step=0.1, min_value=0.1)
     
-    z_score = (x - mean) / std_dev
+    z_score = standardize(x, mean, std_dev)
     
     st.markdown(f"""
     ### Result
@@ -1,8 +1,8 @@
 import streamlit as st
-import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
-import plotly.express as px
+from probability.decimation import scatter_trace
+from probability.rng import make_generator
 
 # Page configuration
 st.set_page_config(layout="wide", page_title="Simple Random Sampling Demo", page_icon="🎲")
@@ -77,16 +77,16 @@ with tab2:
     st.header("Interactive Simple Random Sampling Demo")
     
     # Create a population
-    np.random.seed(42)
+    rng = make_generator(42)
     population_size = 1000
     population = pd.DataFrame({
         'ID': range(1, population_size + 1),
-        'Value': np.random.normal(loc=100, scale=15, size=population_size)
+        'Value': rng.normal(loc=100, scale=15, size=population_size)
     })
     
     # Sampling function
     def simple_random_sample(population, sample_size):
-        return population.sample(n=sample_size)
+        return population.sample(n=sample_size, random_state=rng)
     
     # User input
     sample_size = st.slider("Select sample size:", min_value=10, max_value=500, value=50, step=10)
@@ -96,8 +96,9 @@ with tab2:
     
     # Plotting
     fig = go.Figure()
-    fig.add_trace(go.Scatter(x=population['ID'], y=population['Value'], mode='markers', name='Population', 
-                             marker=dict(color='lightblue', size=5)))
+    # Population cloud is thinned to the point budget; every sampled point is still drawn
+    fig.add_trace(scatter_trace(population['ID'], population['Value'], mode='markers', name='Population', 
+                                marker=dict(color='lightblue', size=5)))
     fig.add_trace(go.Scatter(x=sample['ID'], y=sample['Value'], mode='markers', name='Sample', 
                              marker=dict(color='red', size=8)))
     fig.update_layout(title="Population vs Sample",
@@ -3,6 +3,9 @@ import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+from probability.populations import get_population
+from probability.resampling import sample_means
+from probability.rng import make_generator
 
 # Page configuration
 st.set_page_config(layout="wide", page_title="Sampling Distribution Demo", page_icon="📊")
@@ -80,19 +83,13 @@ with tab2:
         num_samples = st.slider("Number of samples to draw:", min_value=100, max_value=10000, value=1000, step=100)
     
     # Create a bimodal population
-    np.random.seed(42)
+    rng = make_generator(42)
     population_size = 100000
-    population = np.concatenate([
-        np.random.normal(loc=5, scale=1, size=int(population_size*0.6)),
-        np.random.normal(loc=8, scale=1, size=int(population_size*0.4))
-    ])
-    
-    # Function to take samples and calculate means
-    def sample_means(population, sample_size, num_samples):
-        return [np.mean(np.random.choice(population, size=sample_size, replace=True)) for _ in range(num_samples)]
+    population = get_population("normal_mixture", population_size, seed=42,
+                                components=((5.0, 1.0, 0.6), (8.0, 1.0, 0.4)))
     
     # Calculate sample means
-    means = sample_means(population, sample_size, num_samples)
+    means = sample_means(population, sample_size, num_samples, rng=rng)
     
     with col2:
         # Create subplots
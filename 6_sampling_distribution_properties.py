@@ -3,7 +3,11 @@ import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import scipy.stats as stats
+from probability.resampling import sample_means
+from probability.rng import make_generator
+from probability.lazy import lazy_import
+
+stats = lazy_import("scipy.stats")
 
 # Page configuration
 st.set_page_config(layout="wide", page_title="Sampling Distribution Properties", page_icon="📊")
@@ -73,20 +77,16 @@ with tab2:
     st.header("Interactive Demonstration")
     
     # Create a non-normal population (e.g., exponential distribution)
-    np.random.seed(42)
+    rng = make_generator(42)
     population_size = 100000
-    population = np.random.exponential(scale=1, size=population_size)
-    
-    # Function to take samples and calculate means
-    def sample_means(population, sample_size, num_samples):
-        return [np.mean(np.random.choice(population, size=sample_size, replace=True)) for _ in range(num_samples)]
+    population = rng.exponential(scale=1, size=population_size)
     
     # User inputs
     sample_size = st.slider("Select sample size (n):", min_value=1, max_value=1000, value=30, step=1)
     num_samples = st.slider("Number of samples to draw:", min_value=100, max_value=10000, value=1000, step=100)
     
     # Calculate sample means
-    means = sample_means(population, sample_size, num_samples)
+    means = sample_means(population, sample_size, num_samples, rng=rng)
     
     # Create subplots
     fig = make_subplots(rows=1, cols=2, subplot_titles=("Population Distribution", "Sampling Distribution of Means"))
@@ -98,7 +98,7 @@ with tab2:
     fig.add_trace(go.Histogram(x=means, name="Sample Means", marker_color='lightgreen'), row=1, col=2)
     
     # Add normal curve to sampling distribution
-    x = np.linspace(min(means), max(means), 100)
+    x = np.linspace(means.min(), means.max(), 100)
     y = stats.norm.pdf(x, np.mean(means), np.std(means))
     fig.add_trace(go.Scatter(x=x, y=y, mode='lines', name='Normal Curve', line=dict(color='red')), row=1, col=2)
     
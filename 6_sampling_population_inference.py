@@ -1,8 +1,10 @@
 import streamlit as st
 import plotly.graph_objects as go
-import plotly.express as px
-import numpy as np
 import pandas as pd
+from probability.estimation import bootstrap_intervals, z_confidence_interval
+from probability.populations import get_population
+from probability.resampling import bootstrap_replicates, jackknife
+from probability.rng import make_generator
 
 # Page configuration
 st.set_page_config(layout="wide", page_title="Sampling & Inference Demo", page_icon="📊")
@@ -75,12 +77,12 @@ with tab2:
     st.header("Interactive Sampling Demo")
     
     # Simulate a population
-    np.random.seed(42)
-    population = np.random.normal(loc=170, scale=10, size=10000)
+    rng = make_generator(42)
+    population = get_population("normal", 10000, seed=42, loc=170.0, scale=10.0)
 
     # Function to take a sample
     def take_sample(population, sample_size):
-        return np.random.choice(population, size=sample_size, replace=False)
+        return rng.choice(population, size=sample_size, replace=False)
 
     # Interactive sample size selector
     sample_size = st.slider("Select sample size:", min_value=10, max_value=1000, value=100, step=10)
@@ -129,9 +131,7 @@ with tab3:
     z_scores = {"90%": 1.645, "95%": 1.96, "99%": 2.576}
     z_score = z_scores[confidence_level]
 
-    margin_of_error = z_score * (sample.std() / np.sqrt(sample_size))
-    ci_lower = sample.mean() - margin_of_error
-    ci_upper = sample.mean() + margin_of_error
+    _, ci_lower, ci_upper = z_confidence_interval(sample, z_score)
 
     st.markdown(f"""
     **Formula:** CI = X̄ ± (z * (s / √n))
@@ -156,6 +156,21 @@ with tab3:
     falls between {ci_lower:.2f} cm and {ci_upper:.2f} cm.
     """)
 
+    st.subheader("Bootstrap Check")
+    st.markdown("""
+    The formula above relies on the normal approximation. The bootstrap instead resamples our sample with replacement
+    10,000 times and takes the interval straight from the spread of the resampled means.
+    """)
+    confidence = float(confidence_level.rstrip("%")) / 100
+    boot_means = bootstrap_replicates(sample, 10_000, ("mean",), rng=make_generator(42))["mean"]
+    boot_ci = bootstrap_intervals(sample.mean(), boot_means, confidence, jackknife(sample, "mean"))
+    st.dataframe(pd.DataFrame({
+        "Method": ["Normal approximation (z)", "Bootstrap percentile", "Bootstrap basic", "Bootstrap BCa"],
+        "Lower (cm)": [ci_lower, boot_ci["percentile"][0], boot_ci["basic"][0], boot_ci["bca"][0]],
+        "Upper (cm)": [ci_upper, boot_ci["percentile"][1], boot_ci["basic"][1], boot_ci["bca"][1]],
+    }).style.format(precision=2), hide_index=True)
+    st.info("For a roughly normal population like these heights, all methods agree closely; they diverge for small or skewed samples.")
+
 with tab4:
     st.header("Test Your Knowledge")
     
@@ -3,10 +3,16 @@ import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import scipy.stats as stats
+from probability.populations import get_population, open_population, population_summary
+from probability.profiling import page_profiler
+from probability.resampling import sample_means
+from probability.lazy import lazy_import
+
+stats = lazy_import("scipy.stats")
 
 # Page configuration
 st.set_page_config(layout="wide", page_title="Central Limit Theorem Demo", page_icon="🔔")
+profiler = page_profiler("7_central_limit_theorem")
 
 # Custom CSS
 st.markdown("""
@@ -77,64 +83,92 @@ with tab1:
 with tab2:
     st.header("Interactive CLT Demonstration")
     
-    # Function to generate population based on selected distribution
-    def generate_population(dist_type, size=100000):
-        if dist_type == "Normal":
-            return np.random.normal(loc=0, scale=1, size=size)
-        elif dist_type == "Uniform":
-            return np.random.uniform(low=-3, high=3, size=size)
-        elif dist_type == "Exponential":
-            return np.random.exponential(scale=1, size=size)
-        elif dist_type == "Bimodal":
-            return np.concatenate([np.random.normal(-1, 0.4, size=size//2), np.random.normal(1, 0.4, size=size//2)])
+    # Population definitions: (distribution, parameters) for the shared population store
+    population_specs = {
+        "Normal": ("normal", {"loc": 0.0, "scale": 1.0}),
+        "Uniform": ("uniform", {"low": -3.0, "high": 3.0}),
+        "Exponential": ("exponential", {"scale": 1.0}),
+        "Bimodal": ("normal_mixture", {"components": ((-1.0, 0.4, 0.5), (1.0, 0.4, 0.5))}),
+    }
+    
+    # Function to fetch the population, either cached in memory or memory-mapped from disk
+    def generate_population(dist_type, size=100000, on_disk=False):
+        distribution, params = population_specs[dist_type]
+        if on_disk:
+            return open_population(distribution, size, **params)
+        return get_population(distribution, size, **params)
     
-    # Function to take samples and calculate means
-    def sample_means(population, sample_size, num_samples):
-        return [np.mean(np.random.choice(population, size=sample_size, replace=True)) for _ in range(num_samples)]
+    # Chunked population statistics, computed once per on-disk population
+    @st.cache_data
+    def disk_population_summary(dist_type, size):
+        return population_summary(generate_population(dist_type, size, on_disk=True))
     
     # User inputs
     dist_type = st.selectbox("Select population distribution:", ["Normal", "Uniform", "Exponential", "Bimodal"])
+    on_disk = st.checkbox("Use a huge on-disk population (memory-mapped)", value=False)
+    if on_disk:
+        population_size = st.select_slider("Population size:", options=[10**6, 10**7, 10**8, 10**9], value=10**7,
+                                           format_func=lambda n: f"{n:,}")
+        st.caption("The first run for each distribution and size writes the population to disk; later runs reuse the file.")
+    else:
+        population_size = 100000
     sample_size = st.slider("Select sample size:", min_value=2, max_value=500, value=30, step=1)
     num_samples = st.slider("Number of samples to draw:", min_value=100, max_value=10000, value=1000, step=100)
     
     # Generate population and sample means
-    population = generate_population(dist_type)
-    means = sample_means(population, sample_size, num_samples)
-    
-    # Create subplots
-    fig = make_subplots(rows=1, cols=2, subplot_titles=("Population Distribution", "Sampling Distribution of Means"))
-    
-    # Population distribution
-    fig.add_trace(go.Histogram(x=population, name="Population", marker_color='lightblue'), row=1, col=1)
-    
-    # Sampling distribution of means
-    fig.add_trace(go.Histogram(x=means, name="Sample Means", marker_color='lightgreen'), row=1, col=2)
-    
-    # Add normal curve to sampling distribution
-    x = np.linspace(min(means), max(means), 100)
-    y = stats.norm.pdf(x, np.mean(means), np.std(means))
-    fig.add_trace(go.Scatter(x=x, y=y, mode='lines', name='Normal Curve', line=dict(color='red')), row=1, col=2)
-    
-    # Update layout
-    fig.update_layout(height=500, showlegend=False)
-    fig.update_xaxes(title_text="Value", row=1, col=1)
-    fig.update_xaxes(title_text="Sample Mean", row=1, col=2)
-    fig.update_yaxes(title_text="Frequency", row=1, col=1)
-    fig.update_yaxes(title_text="Frequency", row=1, col=2)
-    
-    st.plotly_chart(fig, use_container_width=True)
+    with profiler.section("data generation"):
+        population = generate_population(dist_type, population_size, on_disk)
+        means = sample_means(population, sample_size, num_samples)
+    with profiler.section("statistics"):
+        if on_disk:
+            summary = disk_population_summary(dist_type, population_size)
+            population_mean, population_std = summary["mean"], summary["std"]
+        else:
+            population_mean, population_std = np.mean(population), np.std(population)
+        means_mean, means_std = np.mean(means), np.std(means)
+        normality_p = stats.normaltest(means)[1]
+    
+    with profiler.section("figure construction"):
+        # Create subplots
+        fig = make_subplots(rows=1, cols=2, subplot_titles=("Population Distribution", "Sampling Distribution of Means"))
+        
+        # Population distribution
+        if on_disk:
+            # Pre-binned counts: the raw population is far too large to send to the browser
+            centers = (summary["edges"][:-1] + summary["edges"][1:]) / 2
+            fig.add_trace(go.Bar(x=centers, y=summary["counts"], name="Population", marker_color='lightblue'), row=1, col=1)
+        else:
+            fig.add_trace(go.Histogram(x=population, name="Population", marker_color='lightblue'), row=1, col=1)
+        
+        # Sampling distribution of means
+        fig.add_trace(go.Histogram(x=means, name="Sample Means", marker_color='lightgreen'), row=1, col=2)
+        
+        # Add normal curve to sampling distribution
+        x = np.linspace(means.min(), means.max(), 100)
+        y = stats.norm.pdf(x, means_mean, means_std)
+        fig.add_trace(go.Scatter(x=x, y=y, mode='lines', name='Normal Curve', line=dict(color='red')), row=1, col=2)
+        
+        # Update layout
+        fig.update_layout(height=500, showlegend=False)
+        fig.update_xaxes(title_text="Value", row=1, col=1)
+        fig.update_xaxes(title_text="Sample Mean", row=1, col=2)
+        fig.update_yaxes(title_text="Frequency", row=1, col=1)
+        fig.update_yaxes(title_text="Frequency", row=1, col=2)
+    
+    with profiler.section("serialization"):
+        st.plotly_chart(fig, use_container_width=True)
     
     # Statistics
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("Population Mean", f"{np.mean(population):.4f}")
-        st.metric("Population Std Dev", f"{np.std(population):.4f}")
+        st.metric("Population Mean", f"{population_mean:.4f}")
+        st.metric("Population Std Dev", f"{population_std:.4f}")
     with col2:
-        st.metric("Mean of Sample Means", f"{np.mean(means):.4f}")
-        st.metric("Std Dev of Sample Means", f"{np.std(means):.4f}")
+        st.metric("Mean of Sample Means", f"{means_mean:.4f}")
+        st.metric("Std Dev of Sample Means", f"{means_std:.4f}")
     with col3:
-        st.metric("Expected Std Error", f"{np.std(population)/np.sqrt(sample_size):.4f}")
-        st.metric("Normality Test p-value", f"{stats.normaltest(means)[1]:.4f}")
+        st.metric("Expected Std Error", f"{population_std/np.sqrt(sample_size):.4f}")
+        st.metric("Normality Test p-value", f"{normality_p:.4f}")
     
     st.info("""
     **Observations:**
@@ -197,3 +231,5 @@ st.markdown("""
 4. As sample size increases, the sampling distribution becomes more normal, and the standard error decreases.
 5. Understanding the CLT is essential for constructing confidence intervals and performing hypothesis tests in many real-world scenarios.
 """)
+
+profiler.report()
@@ -1,18 +1,18 @@
 import streamlit as st
 import numpy as np
-import plotly.graph_objects as go
 import plotly.express as px
-from scipy import stats
+from probability.resampling import sample_means
+from probability.rng import session_rng
 
-def generate_distribution(dist_type, size, mean, std):
+def generate_distribution(dist_type, size, mean, std, rng):
     if dist_type == "Normal":
-        return np.random.normal(mean, std, size)
+        return rng.normal(mean, std, size)
     elif dist_type == "Uniform":
-        return np.random.uniform(mean - std*np.sqrt(3), mean + std*np.sqrt(3), size)
+        return rng.uniform(mean - std*np.sqrt(3), mean + std*np.sqrt(3), size)
     elif dist_type == "Exponential":
-        return np.random.exponential(1/mean, size)
+        return rng.exponential(1/mean, size)
     elif dist_type == "Random":
-        return np.random.choice([np.random.normal, np.random.uniform, np.random.exponential])(mean, std, size)
+        return generate_distribution(rng.choice(["Normal", "Uniform", "Exponential"]), size, mean, std, rng)
 
 def central_limit_theorem_demo():
     st.set_page_config(page_title="Central Limit Theorem", layout="wide")
@@ -51,13 +51,14 @@ def central_limit_theorem_demo():
         tab1, tab2, tab3 = st.tabs(["Distributions", "Numerical Example", "Quiz"])
 
         with tab1:
-            population = generate_distribution(population_dist, 100000, population_mean, population_std)
-            sample_means = [np.mean(np.random.choice(population, size=sample_size)) for _ in range(num_samples)]
+            rng = session_rng().generator("clt_simulation")
+            population = generate_distribution(population_dist, 100000, population_mean, population_std, rng)
+            means = sample_means(population, sample_size, num_samples, rng=rng)
 
             fig_pop = px.histogram(population, nbins=50, title="Population Distribution")
             fig_pop.update_layout(xaxis_title="Population Values", yaxis_title="Count", showlegend=False)
 
-            fig_hist = px.histogram(sample_means, nbins=30, title=f"Distribution of Sample Means (n = {sample_size})")
+            fig_hist = px.histogram(means, nbins=30, title=f"Distribution of Sample Means (n = {sample_size})")
             fig_hist.update_layout(xaxis_title="Sample Mean", yaxis_title="Count", showlegend=False)
 
             st.plotly_chart(fig_pop, use_container_width=True)
@@ -65,7 +66,7 @@ def central_limit_theorem_demo():
 
         with tab2:
             st.markdown('<p class="medium-font">Numerical Example</p>', unsafe_allow_html=True)
-            sample = np.random.choice(population, size=sample_size)
+            sample = rng.choice(population, size=sample_size)
             sample_mean = np.mean(sample)
             sample_std = np.std(sample)
             st.write(f"For a sample size of {sample_size}:")
@@ -1,7 +1,10 @@
 import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
-import plotly.express as px
+from probability.estimation import proportion_margin_of_error
+from probability.montecarlo import poll_task, run_simulation
+from probability.resampling import sample_means
+from probability.rng import session_rng
 
 def set_page_config():
     st.set_page_config(page_title="CLT Applications", layout="wide")
@@ -26,14 +29,15 @@ def quality_control():
     mean_weight = st.slider("Set the mean weight of chips per bag (grams):", 95.0, 105.0, 100.0, 0.1)
     std_dev = st.slider("Set the standard deviation of chip weights (grams):", 1.0, 5.0, 2.0, 0.1)
 
-    population = np.random.normal(mean_weight, std_dev, 10000)
+    rng = session_rng().generator("quality_control")
+    population = rng.normal(mean_weight, std_dev, 10000)
     
     sample_sizes = [10, 30, 100]
     fig = go.Figure()
     
     for size in sample_sizes:
-        sample_means = [np.mean(np.random.choice(population, size=size)) for _ in range(1000)]
-        fig.add_trace(go.Histogram(x=sample_means, name=f'Sample Size: {size}', opacity=0.7))
+        means = sample_means(population, size, 1000, rng=rng)
+        fig.add_trace(go.Histogram(x=means, name=f'Sample Size: {size}', opacity=0.7))
 
     fig.update_layout(title="Distribution of Sample Means for Different Sample Sizes",
                       xaxis_title="Sample Mean Weight (grams)", yaxis_title="Frequency")
@@ -47,14 +51,35 @@ def polling():
 
     true_support = st.slider("Set the true support for Candidate A:", 0.0, 100.0, 52.0, 0.1) / 100
     sample_size = st.slider("Set the sample size for each poll:", 100, 2000, 500)
-
-    polls = [np.mean(np.random.binomial(1, true_support, sample_size)) for _ in range(1000)]
-    
-    fig = px.histogram(polls, nbins=30, labels={'value': 'Estimated Support for Candidate A'})
-    fig.update_layout(title=f"Distribution of Poll Results (Sample Size: {sample_size})")
-    st.plotly_chart(fig)
-
-    margin_of_error = 1.96 * np.sqrt(true_support * (1 - true_support) / sample_size)
+    num_polls = st.select_slider("Number of simulated polls:", options=[10**3, 10**5, 10**6, 10**7, 10**8], value=10**3,
+                                 format_func=lambda n: f"{n:,}")
+
+    if st.button("Run Poll Simulation"):
+        # Each poll's support count is Binomial(sample_size, p); large runs are sharded across worker processes
+        progress = None
+        if num_polls > 10**6:
+            bar = st.progress(0.0)
+            progress = lambda done, total: bar.progress(done / total)
+        result = run_simulation(poll_task, num_polls, seed=session_rng().seed_sequence("polling"), progress=progress,
+                                sample_size=sample_size, p=true_support)
+        # Kept in the session so reruns from other widgets redraw it instead of simulating again
+        st.session_state.poll_result = {"sample_size": sample_size, "num_polls": num_polls, "result": result}
+
+    polls = st.session_state.get("poll_result")
+    if polls is not None:
+        result, poll_size = polls["result"], polls["sample_size"]
+        poll_mean, poll_std = result["moments"].mean, result["moments"].std()
+
+        supporters = np.nonzero(result["hist"])[0]
+        counts = result["hist"][supporters[0]:supporters[-1] + 1]
+        fig = go.Figure(go.Bar(x=np.arange(supporters[0], supporters[-1] + 1) / poll_size, y=counts))
+        fig.update_layout(title=f"Distribution of Poll Results (Sample Size: {poll_size})",
+                          xaxis_title="Estimated Support for Candidate A", yaxis_title="Number of Polls", bargap=0)
+        st.plotly_chart(fig)
+        st.write(f"Across {polls['num_polls']:,} polls the estimated support averaged {poll_mean:.2%} "
+                 f"with a spread of {poll_std:.2%}.")
+
+    margin_of_error = proportion_margin_of_error(true_support, sample_size)
     st.markdown(f'<div class="info-box">The margin of error for this poll is approximately ±{margin_of_error:.1%}. This means we can be 95% confident that the true population support lies within this range of our poll estimate. The CLT allows pollsters to make these precise predictions even when sampling only a small fraction of the population.</div>', unsafe_allow_html=True)
 
 def financial_risk():
@@ -64,13 +89,14 @@ def financial_risk():
     mean_return = st.slider("Set the mean daily return (%):", -1.0, 1.0, 0.05, 0.01)
     std_dev = st.slider("Set the standard deviation of daily returns (%):", 0.1, 5.0, 1.0, 0.1)
 
-    daily_returns = np.random.normal(mean_return, std_dev, 10000)
+    rng = session_rng().generator("financial_risk")
+    daily_returns = rng.normal(mean_return, std_dev, 10000)
     
     holding_periods = [1, 10, 30, 100]
     fig = go.Figure()
     
     for period in holding_periods:
-        period_returns = [np.mean(np.random.choice(daily_returns, size=period)) for _ in range(1000)]
+        period_returns = sample_means(daily_returns, period, 1000, rng=rng)
         fig.add_trace(go.Histogram(x=period_returns, name=f'{period} Day Period', opacity=0.7))
 
     fig.update_layout(title="Distribution of Average Returns for Different Holding Periods",
@@ -1,7 +1,9 @@
 import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
-from scipy import stats
+from probability.decimation import DEFAULT_POINT_BUDGET, scatter_trace, thin
+from probability.estimation import coverage_experiment, t_confidence_interval
+from probability.rng import session_rng
 
 # Set page config
 st.set_page_config(layout="wide", page_title="Statistical Estimation Explorer", page_icon="📊")
@@ -103,11 +105,11 @@ with tab2:
         sample_size = st.slider("Number of Samples", min_value=10, max_value=1000, value=100, step=10)
         
         if st.button("Generate New Sample"):
-            st.session_state.sample = np.random.normal(true_mean, true_std, sample_size)
+            st.session_state.sample = session_rng().generator("point_estimation").normal(true_mean, true_std, sample_size)
     
     with col2:
         if 'sample' not in st.session_state:
-            st.session_state.sample = np.random.normal(true_mean, true_std, sample_size)
+            st.session_state.sample = session_rng().generator("point_estimation").normal(true_mean, true_std, sample_size)
         
         sample = st.session_state.sample
         sample_mean = np.mean(sample)
@@ -168,19 +170,14 @@ with tab3:
         confidence_level = st.slider("Confidence Level", min_value=0.80, max_value=0.99, value=0.95, step=0.01)
         
         if st.button("Generate New Sample", key="int_generate"):
-            st.session_state.int_sample = np.random.normal(true_mean, true_std, sample_size)
+            st.session_state.int_sample = session_rng().generator("interval_estimation").normal(true_mean, true_std, sample_size)
     
     with col2:
         if 'int_sample' not in st.session_state:
-            st.session_state.int_sample = np.random.normal(true_mean, true_std, sample_size)
+            st.session_state.int_sample = session_rng().generator("interval_estimation").normal(true_mean, true_std, sample_size)
         
         sample = st.session_state.int_sample
-        sample_mean = np.mean(sample)
-        sample_std = np.std(sample, ddof=1)
-        
-        margin_of_error = stats.t.ppf((1 + confidence_level) / 2, df=sample_size-1) * (sample_std / np.sqrt(sample_size))
-        ci_lower = sample_mean - margin_of_error
-        ci_upper = sample_mean + margin_of_error
+        sample_mean, ci_lower, ci_upper = t_confidence_interval(sample, confidence_level)
         
         fig = go.Figure()
         fig.add_trace(go.Histogram(x=sample, name="Sample Distribution"))
@@ -220,6 +217,66 @@ with tab3:
     - A wider interval is more likely to contain the true mean but gives us less precise information.
     </div>
     """, unsafe_allow_html=True)
+    
+    st.subheader("🎯 Coverage Simulation")
+    st.markdown("""
+    A confidence level is a promise about the method, not about one interval. Let's repeat the whole experiment many times
+    with the population and sample size chosen above, and count how many of the intervals actually contain the true mean.
+    """)
+    
+    col1, col2 = st.columns([3, 7])
+    
+    with col1:
+        num_intervals = st.select_slider("Number of Intervals", options=[100, 1000, 10**4, 10**5, 10**6], value=1000,
+                                         format_func=lambda n: f"{n:,}", key="coverage_intervals")
+        
+        if st.button("Run Coverage Simulation", key="coverage_run"):
+            st.session_state.coverage = coverage_experiment(session_rng().generator("coverage_experiment"), num_intervals,
+                                                            sample_size, true_mean, true_std, confidence_level)
+            st.session_state.coverage_params = (true_mean, confidence_level)
+    
+    if 'coverage' in st.session_state:
+        result = st.session_state.coverage
+        sim_mean, sim_confidence = st.session_state.coverage_params
+        covered = result["covered"]
+        widths = result["upper"] - result["lower"]
+        coverage = covered.mean()
+        
+        with col1:
+            st.metric("Empirical Coverage", f"{coverage:.2%}", f"{coverage - sim_confidence:+.2%} vs nominal {sim_confidence:.0%}")
+            st.metric("Intervals Missing the True Mean", f"{len(covered) - covered.sum():,} of {len(covered):,}")
+            st.metric("Average Interval Width", f"{widths.mean():.3f}")
+        
+        with col2:
+            # Only a uniform subset of the intervals is drawn, so the share of misses on screen stays honest
+            shown = thin(len(covered), 100)
+            fig = go.Figure()
+            for hit, color, name in [(True, "#28a745", "Contains true mean"), (False, "red", "Misses true mean")]:
+                rows = shown[covered[shown] == hit]
+                # One trace per colour: segments are separated by None gaps
+                x = np.column_stack([result["lower"][rows], result["upper"][rows], np.full(len(rows), None)]).ravel()
+                y = np.repeat(np.arange(len(shown))[covered[shown] == hit], 3)
+                fig.add_trace(go.Scatter(x=x, y=y, mode="lines", line=dict(color=color, width=2), name=name))
+            fig.add_vline(x=sim_mean, line_dash="dash", line_color="black", annotation_text="True Mean")
+            fig.update_layout(title=f"{len(shown)} of {len(covered):,} Confidence Intervals", xaxis_title="Value",
+                              yaxis_title="Experiment", yaxis=dict(showticklabels=False))
+            st.plotly_chart(fig, use_container_width=True)
+        
+        col3, col4 = st.columns(2)
+        with col3:
+            counts, edges = np.histogram(widths, bins=50)
+            fig = go.Figure(go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges)))
+            fig.update_layout(title="Distribution of Interval Widths", xaxis_title="Width", yaxis_title="Count")
+            st.plotly_chart(fig, use_container_width=True)
+        with col4:
+            running = np.cumsum(covered) / np.arange(1, len(covered) + 1)
+            # Log-spaced points, so the noisy first experiments get as much detail as the last ones on the log axis
+            shown = np.unique(np.geomspace(1, len(covered), DEFAULT_POINT_BUDGET).astype(np.int64))
+            fig = go.Figure(scatter_trace(shown, running[shown - 1], mode="lines", name="Running coverage"))
+            fig.add_hline(y=sim_confidence, line_dash="dash", line_color="red", annotation_text="Nominal")
+            fig.update_layout(title="Coverage as Experiments Accumulate", xaxis_title="Number of Experiments",
+                              yaxis_title="Share Containing the True Mean", xaxis_type="log")
+            st.plotly_chart(fig, use_container_width=True)
 
 with tab4:
     st.header("Test Your Estimation Knowledge!")
@@ -1,7 +1,14 @@
 import streamlit as st
 import plotly.graph_objs as go
 import numpy as np
-from scipy import stats
+import pandas as pd
+from probability.estimation import bootstrap_intervals, t_confidence_interval
+from probability.montecarlo import bootstrap_task, default_workers, run_simulation
+from probability.resampling import REDUCERS, jackknife
+from probability.rng import make_generator, session_rng
+from probability.lazy import lazy_import
+
+stats = lazy_import("scipy.stats")
 
 # Set page configuration
 st.set_page_config(layout="wide", page_title="Statistical Estimation Explorer", page_icon="📊")
@@ -60,7 +67,7 @@ and see how they affect the estimates in real-time.
 """)
 
 # Create tabs
-tab1, tab2, tab3, tab4 = st.tabs(["📈 Interactive Plot", "🧮 Solved Examples", "🧠 Quiz", "📚 Learn More"])
+tab1, tab_bootstrap, tab2, tab3, tab4 = st.tabs(["📈 Interactive Plot", "🥾 Bootstrap Intervals", "🧮 Solved Examples", "🧠 Quiz", "📚 Learn More"])
 
 with tab1:
     st.header("Interactive Statistical Estimation Plot")
@@ -75,14 +82,11 @@ with tab1:
         confidence_level = st.slider("Confidence Level (%)", min_value=80, max_value=99, value=95, step=1)
 
         # Generate sample data
-        np.random.seed(42)
-        sample_data = np.random.normal(population_mean, population_std, sample_size)
+        sample_data = make_generator(42).normal(population_mean, population_std, sample_size)
 
         # Calculate estimates
-        point_estimate = np.mean(sample_data)
-        confidence_interval = stats.t.interval(confidence_level/100, df=sample_size-1, 
-                                               loc=point_estimate, 
-                                               scale=stats.sem(sample_data))
+        point_estimate, ci_lower, ci_upper = t_confidence_interval(sample_data, confidence_level/100)
+        confidence_interval = (ci_lower, ci_upper)
 
 with col1:
     # Plotting
@@ -121,6 +125,96 @@ with col1:
 
     st.plotly_chart(fig, use_container_width=True)
 
+with tab_bootstrap:
+    st.header("Bootstrap Confidence Intervals")
+    st.markdown("""
+    The t-interval assumes the sample mean is roughly normal. The **bootstrap** makes no such assumption: it resamples
+    the data with replacement many times, recomputes the statistic on every resample, and reads the interval off the
+    resulting distribution. It works for any statistic, not just the mean.
+    """)
+
+    col1, col2 = st.columns([1, 2])
+
+    with col1:
+        st.subheader("📐 Sample")
+        source = st.radio("Data source", ["Generate", "Enter values"], key="boot_source")
+        if source == "Generate":
+            distribution = st.selectbox("Population", ["Normal", "Lognormal (skewed)", "Exponential"], key="boot_dist")
+            boot_size = st.select_slider("Sample Size", options=[20, 50, 100, 1000, 10000], value=100, key="boot_size")
+            rng = session_rng().generator("bootstrap_sample")
+            if distribution == "Normal":
+                boot_sample = rng.normal(100, 15, boot_size)
+            elif distribution == "Lognormal (skewed)":
+                boot_sample = rng.lognormal(3, 0.8, boot_size)
+            else:
+                boot_sample = rng.exponential(20, boot_size)
+        else:
+            text = st.text_area("Values (comma or whitespace separated)", "500, 450, 600, 525, 575, 490, 610", key="boot_values")
+            try:
+                boot_sample = np.array(text.replace(",", " ").split(), dtype=np.float64)
+            except ValueError:
+                st.error("Please enter numbers only.")
+                boot_sample = np.array([])
+
+        statistics = st.multiselect("Statistics", ["mean", "median", "std", "iqr", "min", "max"], default=["mean", "median", "std"],
+                                    key="boot_stats")
+        num_resamples = st.select_slider("Bootstrap Resamples (B)", options=[1000, 10**4, 10**5], value=10**4,
+                                         format_func=lambda n: f"{n:,}", key="boot_b")
+        boot_confidence = st.slider("Confidence Level (%)", min_value=80, max_value=99, value=95, step=1, key="boot_conf") / 100
+        shard = st.checkbox(f"Shard resamples across {default_workers()} worker processes", value=False, key="boot_shard")
+        run = st.button("Run Bootstrap", key="boot_run")
+
+    with col2:
+        if len(boot_sample) < 3 or not statistics:
+            st.info("Provide at least 3 values and choose at least one statistic.")
+        elif run:
+            bar = st.progress(0.0)
+            # Chunks are seeded by position, so sharding does not change the result
+            result = run_simulation(bootstrap_task, num_resamples, seed=session_rng().seed_sequence("bootstrap"),
+                                    chunk_size=max(1000, num_resamples // 16), max_workers=None if shard else 1,
+                                    progress=lambda done, total: bar.progress(done / total),
+                                    sample=boot_sample, reducers=tuple(statistics))
+            bar.empty()
+
+            rows = []
+            replicates = {}
+            for name in statistics:
+                replicates[name] = np.concatenate(result[name])
+                estimate = REDUCERS[name](boot_sample[np.newaxis, :])[0]
+                intervals = bootstrap_intervals(estimate, replicates[name], boot_confidence, jackknife(boot_sample, name))
+                for method, (lower, upper) in intervals.items():
+                    rows.append({"Statistic": name, "Estimate": estimate, "Method": {"percentile": "Percentile", "basic": "Basic", "bca": "BCa"}[method],
+                                 "Lower": lower, "Upper": upper, "Width": upper - lower})
+            if "mean" in statistics:
+                mean, lower, upper = t_confidence_interval(boot_sample, boot_confidence)
+                rows.append({"Statistic": "mean", "Estimate": mean, "Method": "t (parametric)", "Lower": lower, "Upper": upper, "Width": upper - lower})
+            st.session_state.boot_result = {"rows": rows, "replicates": replicates, "confidence": boot_confidence}
+
+        if "boot_result" in st.session_state and len(boot_sample) >= 3:
+            boot_result = st.session_state.boot_result
+            st.dataframe(pd.DataFrame(boot_result["rows"]).style.format(precision=3), hide_index=True, use_container_width=True)
+
+            shown = st.selectbox("Bootstrap distribution of", list(boot_result["replicates"]), key="boot_shown")
+            values = boot_result["replicates"][shown]
+            counts, edges = np.histogram(values, bins=60)
+            fig = go.Figure(go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges),
+                                   marker_color='rgba(0,100,80,0.5)', name="Replicates"))
+            for row, color in zip([r for r in boot_result["rows"] if r["Statistic"] == shown], ["green", "orange", "purple", "red"]):
+                fig.add_vrect(x0=row["Lower"], x1=row["Upper"], line=dict(color=color, width=2), fillcolor="rgba(0,0,0,0)",
+                              annotation_text=row["Method"], annotation_position="top left")
+            fig.update_layout(title=f"Bootstrap Distribution of the {shown.capitalize()} ({len(values):,} Resamples)",
+                              xaxis_title=shown.capitalize(), yaxis_title="Count", showlegend=False, height=450)
+            st.plotly_chart(fig, use_container_width=True)
+
+            st.markdown(f"""
+            <div class="highlight">
+            <b>Percentile</b> takes the middle {boot_result['confidence']:.0%} of the replicates directly.
+            <b>Basic</b> reflects them around the estimate, correcting for a shifted bootstrap distribution.
+            <b>BCa</b> (bias-corrected and accelerated) also adjusts for bias and skewness, and is usually the most accurate
+            for skewed data and statistics like the median or standard deviation.
+            </div>
+            """, unsafe_allow_html=True)
+
 with tab2:
     st.header("Solved Examples")
     
@@ -0,0 +1,113 @@
+import os
+
+import streamlit as st
+
+from probability.profiling import RerunProfiler
+
+# Single entry point for all topics: `streamlit run app.py`
+# Every page runs in this one process, so imported libraries, @st.cache_data
+# results and the shared population store stay warm across topic switches.
+# The individual scripts can still be run on their own.
+
+st.set_page_config(layout="wide", page_title="Probability & Statistics Explorer", page_icon="🎲")
+
+SECTIONS = {
+    "Foundations": [
+        ("probability_spaces.py", "Probability Spaces", "🌌"),
+        ("sample_space_events_in_probability.py", "Sample Spaces and Events", "🎲"),
+        ("probability_rules_playground.py", "Probability Rules Playground", "🎲"),
+        ("conditional_probability_explorer.py", "Conditional Probability", "🎲"),
+        ("bayes_theorem.py", "Bayes' Theorem", "🧮"),
+        ("probability_quiz2.py", "Probability Mastery Quiz", "🧠"),
+    ],
+    "Random Variables": [
+        ("1_what_is_random_variable.py", "What Is a Random Variable?", "🎯"),
+        ("2_what_is_probability_distribution.py", "What Is a Probability Distribution?", "📊"),
+        ("2_common_probability_distributions.py", "Common Probability Distributions", "📊"),
+        ("expected_value_and_variance.py", "Expected Value and Variance", "📊"),
+        ("joint_probability_distributions.py", "Joint Probability Distributions", "📊"),
+        ("transformation_of_random_variable.py", "Transformations of Random Variables", "🔄"),
+    ],
+    "Discrete Distributions": [
+        ("2_bernouli_distribution.py", "Bernoulli Distribution", "🪙"),
+        ("3_binomial_distribution.py", "Binomial Distribution", "📊"),
+        ("3_binomial_distribution_assumptions.py", "Binomial Assumptions", "📋"),
+        ("3_binomia_distribution_rainfal_probability_explorer.py", "Binomial: Rainfall", "🌧️"),
+        ("3_binomial_distribution_tik-tok_video_posting.py", "Binomial: Video Posting", "📱"),
+    ],
+    "Continuous Distributions": [
+        ("4_uniform_distribution.py", "Uniform Distribution", "📏"),
+        ("4_uniform_distribution_applications.py", "Uniform Distribution in Real Life", "📏"),
+        ("5_normal_distribution_explorer.py", "Normal Distribution Explorer", "🔔"),
+        ("5_normal_distribution_properties.py", "Normal Distribution Properties", "🔔"),
+        ("5_normal_distribution_area_density_curve.py", "Area Under the Normal Curve", "🔔"),
+        ("5_standard_normal_distribution.py", "Standard Normal Distribution", "🔔"),
+        ("5_normal_distribution_applications.py", "Normal Distribution in Real Life", "🔔"),
+        ("5_normal_distribution_food_delivery.py", "Normal: Food Delivery Times", "🛵"),
+    ],
+    "Sampling": [
+        ("6_random_sampling_demo.py", "Simple Random Sampling", "🎲"),
+        ("6_sampling_distribution.py", "Sampling Distributions", "📊"),
+        ("6_sampling_distribution_properties.py", "Sampling Distribution Properties", "📊"),
+        ("6_sampling_population_inference.py", "Sampling and Inference", "📊"),
+        ("law_of_large_number_explorer.py", "Law of Large Numbers", "📈"),
+        ("7_central_limit_theorem.py", "Central Limit Theorem", "🔔"),
+        ("7_central_limit_theorem2.py", "Central Limit Theorem: Simulation", "🔔"),
+        ("7_central_limit_theorem_applications.py", "CLT Applications", "🔔"),
+    ],
+    "Inference": [
+        ("8_estimation_introduction.py", "Introduction to Estimation", "📐"),
+        ("8_statistical_estimation.py", "Statistical Estimation", "📐"),
+        ("hypo_testing.py", "Hypothesis Testing Intro", "⚖️"),
+        ("hypothesis_testing.py", "Hypothesis Testing Explorer", "⚖️"),
+        ("hypothesis_testing_quiz.py", "Hypothesis Testing Quiz", "🧠"),
+    ],
+    "Mathematical Toolkit": [
+        ("logic_basics.py", "Logic Basics", "🧠"),
+        ("representation_of_numbers.py", "Representation of Numbers", "🔢"),
+        ("linear_algebra.py", "Linear Algebra", "📐"),
+        ("calculus.py", "Calculus", "📈"),
+        ("graph_theory_in_statistics.py", "Graph Theory in Statistics", "🕸️"),
+    ],
+}
+
+# Base styling shared by every page; pages still add their own CSS on top
+SHARED_CSS = """
+<style>
+    .stTabs [data-baseweb="tab-list"] {
+        gap: 24px;
+    }
+    .stTabs [data-baseweb="tab"] {
+        height: 50px;
+        white-space: pre-wrap;
+        border-radius: 4px 4px 0 0;
+    }
+    .big-font {
+        font-size: 24px !important;
+        font-weight: bold;
+    }
+    .medium-font {
+        font-size: 20px !important;
+        font-weight: bold;
+    }
+    .small-font {
+        font-size: 16px !important;
+    }
+</style>
+"""
+
+pages = {
+    section: [st.Page(path, title=title, icon=icon) for path, title, icon in entries]
+    for section, entries in SECTIONS.items()
+}
+
+# Script name of every page, so launcher records match the names pages use for their own profilers
+SCRIPTS = {title: os.path.splitext(path)[0] for entries in SECTIONS.values() for path, title, _ in entries}
+
+page = st.navigation(pages)
+st.markdown(SHARED_CSS, unsafe_allow_html=True)
+# Every page gets a whole-rerun timing; pages that time their own sections add them to this record
+profiler = RerunProfiler(SCRIPTS.get(page.title, page.title))
+with profiler.running():
+    page.run()
+profiler.report()
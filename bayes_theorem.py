@@ -1,6 +1,6 @@
 import streamlit as st
-import plotly.express as px
 import pandas as pd
+from probability.rules import bayes_posterior, total_probability
 
 st.set_page_config(layout="wide")
 
@@ -59,8 +59,8 @@ with tab1:
 
     # Calculating derived parameters for medical diagnosis
     false_positive_rate = 1 - test_specificity
-    p_test_positive = (prior_prob * test_sensitivity) + ((1 - prior_prob) * false_positive_rate)
-    posterior_prob = (test_sensitivity * prior_prob) / p_test_positive
+    p_test_positive = total_probability(test_sensitivity, prior_prob, false_positive_rate)
+    posterior_prob = bayes_posterior(test_sensitivity, prior_prob, p_test_positive)
 
     # Displaying the result
     st.markdown(f"### Result: Probability of sickness given a positive test result: **{posterior_prob:.2f}**")
@@ -91,7 +91,7 @@ with tab2:
     cloudy_prob = st.slider("Probability of a cloudy morning (P(Cloudy))", min_value=0.0, max_value=1.0, value=0.4, step=0.01, key="weather_cloudy")
 
     # Calculating posterior probability for weather forecasting
-    posterior_prob_weather = (cloudy_given_rain * rain_prob) / cloudy_prob
+    posterior_prob_weather = bayes_posterior(cloudy_given_rain, rain_prob, cloudy_prob)
 
     # Displaying the result
     st.markdown(f"### Result: Probability of rain given a cloudy morning: **{posterior_prob_weather:.2f}**")
@@ -183,7 +183,7 @@ with tab6:
 
     # Calculating posterior probability for the flight incident
     if flight_prob > 0:  # Ensure we don't divide by zero
-        posterior_prob_flight = (flight_given_death * death_prob) / flight_prob
+        posterior_prob_flight = bayes_posterior(flight_given_death, death_prob, flight_prob)
     else:
         posterior_prob_flight = 0
 
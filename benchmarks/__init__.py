@@ -0,0 +1 @@
+"""Benchmark suite for the simulation and distribution kernels in ``probability``."""
@@ -0,0 +1,133 @@
+"""Benchmark cases and their parameter sweeps.
+
+Each case maps a name to a ``setup(**params)`` function that does any
+untimed preparation and returns the zero-argument callable to time, plus the
+parameter grid to sweep.  Grids follow the slider ranges the pages expose.
+"""
+
+import itertools
+
+import numpy as np
+
+
+def _clt_resampling(sample_size, num_samples):
+    from probability.populations import get_population
+    from probability.resampling import sample_means
+
+    population = get_population("exponential", 100000, scale=1.0)
+    return lambda: sample_means(population, sample_size, num_samples)
+
+
+def _clt_statistics(sample_size, num_samples):
+    from probability.populations import get_population
+    from probability.resampling import resample_statistics
+
+    population = get_population("exponential", 100000, scale=1.0)
+    return lambda: resample_statistics(population, sample_size, num_samples, ("mean", "var", "median"))
+
+
+def _population_generation(size):
+    from probability.populations import PopulationStore
+
+    # A fresh store each call, so this measures generation rather than cache hits
+    return lambda: PopulationStore().get("normal_mixture", size)
+
+
+def _lln_running_mean(num_trials):
+    from probability.lln import run_running_mean
+
+    rng = np.random.default_rng(0)
+    return lambda: run_running_mean(lambda n: rng.integers(0, 2, size=n), num_trials)
+
+
+def _joint_multivariate_sampling(num_samples):
+    from probability.distributions import bivariate_normal_cov
+
+    cov = bivariate_normal_cov(1.0, 1.0, 0.5)
+    rng = np.random.default_rng(0)
+    return lambda: rng.multivariate_normal([0.0, 0.0], cov, num_samples)
+
+
+def _joint_density_grid(grid_size):
+    from probability.distributions import bivariate_normal_pdf_grid
+
+    x = np.linspace(-5, 5, grid_size)
+    return lambda: bivariate_normal_pdf_grid(x, x, 0.0, 0.0, 1.0, 1.0, 0.5)
+
+
+def _binomial_table(n):
+    from probability.binomial import build_binomial_table
+
+    # Uncached build, which is what a page pays the first time it sees (n, p)
+    return lambda: build_binomial_table(n, 0.3)
+
+
+def _graph_node_metrics():
+    import networkx as nx
+    from probability.graphs import node_metrics
+
+    G = nx.karate_club_graph()
+    return lambda: node_metrics(G)
+
+
+def _graph_network_metrics():
+    import networkx as nx
+    from probability.graphs import network_metrics
+
+    G = nx.karate_club_graph()
+    return lambda: network_metrics(G)
+
+
+def _graph_communities():
+    import networkx as nx
+    from probability.graphs import community_partition
+
+    G = nx.karate_club_graph()
+    return lambda: community_partition(G, seed=0)
+
+
+def _calculus(operation, function):
+    from probability import calculus
+
+    expr = calculus.parse_function(function)
+    if operation == "limit":
+        return lambda: calculus.limit_at(expr, 2.0)
+    if operation == "derivative":
+        return lambda: calculus.derivative_at(expr, 1.0)
+    if operation == "integral":
+        return lambda: calculus.definite_integral(expr, 0.0, 1.0)
+    return lambda: calculus.left_riemann_sum(expr, 0.0, 1.0, 50)
+
+
+def _lttb(n):
+    from probability.decimation import lttb
+
+    x = np.arange(n)
+    y = np.cumsum(np.random.default_rng(0).standard_normal(n))
+    return lambda: lttb(x, y, 2000)
+
+
+CASES = {
+    "clt_resampling": (_clt_resampling, {"sample_size": [2, 30, 100, 500, 1000],
+                                         "num_samples": [100, 1000, 10000]}),
+    "clt_statistics": (_clt_statistics, {"sample_size": [30, 1000], "num_samples": [1000, 10000]}),
+    "population_generation": (_population_generation, {"size": [10**4, 10**5, 10**6]}),
+    "lln_running_mean": (_lln_running_mean, {"num_trials": [100, 1000, 10000, 10**6, 10**7]}),
+    "joint_multivariate_sampling": (_joint_multivariate_sampling, {"num_samples": [100, 1000, 10000]}),
+    "joint_density_grid": (_joint_density_grid, {"grid_size": [50, 100, 200]}),
+    "binomial_table": (_binomial_table, {"n": [20, 100, 10**4, 10**6, 10**7]}),
+    "graph_node_metrics": (_graph_node_metrics, {}),
+    "graph_network_metrics": (_graph_network_metrics, {}),
+    "graph_communities": (_graph_communities, {}),
+    "calculus": (_calculus, {"operation": ["limit", "derivative", "integral", "riemann"],
+                             "function": ["x**2", "1 / (x - 2)", "sin(x) * exp(-x)"]}),
+    "lttb": (_lttb, {"n": [10**4, 10**5, 10**6]}),
+}
+
+
+def expand(name):
+    """All ``params`` dicts in the sweep for case ``name``."""
+    _, grid = CASES[name]
+    keys = list(grid)
+    for values in itertools.product(*(grid[k] for k in keys)):
+        yield dict(zip(keys, values))
@@ -0,0 +1,98 @@
+"""Cold-start import-time report for every page.
+
+Usage (from the repository root)::
+
+    python -m benchmarks.imports                 # all pages
+    python -m benchmarks.imports calculus.py     # selected pages
+    python -m benchmarks.imports -o imports.json
+
+For each page the module-level import statements are executed in a fresh
+interpreter under ``python -X importtime``, which is what a cold Streamlit
+worker pays before the first widget renders.  Modules the page defers with
+``lazy_import``/``lazy_callable`` are listed separately: they are only paid
+for when the code that needs them runs.
+"""
+
+import argparse
+import ast
+import glob
+import json
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def page_imports(path):
+    """The module-level import statements of a page and the modules it loads lazily."""
+    with open(path, encoding="utf-8") as fh:
+        tree = ast.parse(fh.read())
+    eager = [ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+    deferred = sorted({
+        node.args[0].value
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Call) and getattr(node.func, "id", None) in ("lazy_import", "lazy_callable")
+        and node.args and isinstance(node.args[0], ast.Constant)
+    })
+    return eager, deferred
+
+
+def measure(statements):
+    """Cumulative import time in seconds of each top-level module the statements load."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "\n".join(statements)],
+        cwd=REPO_ROOT, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # Nested imports are indented under the module that triggered them
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            modules[name.strip()] = int(cumulative) / 1e6
+    return modules
+
+
+def report(pages):
+    # Modules every interpreter loads at startup (site, encodings, ...) are not the page's cost
+    startup = measure([])
+    results = []
+    for path in pages:
+        eager, deferred = page_imports(path)
+        try:
+            modules = {name: seconds for name, seconds in measure(eager).items() if name not in startup}
+        except RuntimeError as exc:
+            print(f"{os.path.basename(path):<55} ERROR {exc}")
+            continue
+        heaviest = sorted(modules.items(), key=lambda item: item[1], reverse=True)[:3]
+        results.append({
+            "page": os.path.basename(path),
+            "import_seconds": sum(modules.values()),
+            "heaviest": dict(heaviest),
+            "deferred": deferred,
+        })
+        top = ", ".join(f"{name} {seconds * 1e3:.0f}ms" for name, seconds in heaviest)
+        print(f"{os.path.basename(path):<55} {sum(modules.values()) * 1e3:>7.0f} ms  ({top})"
+              + (f"  deferred: {', '.join(deferred)}" if deferred else ""))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pages", nargs="*", help="page scripts to report (default: every page)")
+    parser.add_argument("-o", "--output", help="also write the report as JSON")
+    args = parser.parse_args(argv)
+
+    pages = args.pages or sorted(glob.glob(os.path.join(REPO_ROOT, "*.py")))
+    results = report(pages)
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(results, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Check that process-pool workers do not re-run the page that started them.
+
+Usage (from the repository root)::
+
+    python -m benchmarks.pool_check
+
+Streamlit runs each page with a stand-in ``__main__`` whose ``__file__`` is
+the page script, and a plain ``spawn`` child re-executes that file as
+``__mp_main__`` before it runs any task.  This check installs the same kind
+of stand-in, pointing at a throwaway "page" that records every execution,
+then runs a few chunks on ``probability.montecarlo``'s pool and reports
+what each worker's ``__mp_main__`` was.  Exits with status 1 on failure.
+"""
+
+import os
+import sys
+import tempfile
+import time
+import types
+
+from probability.montecarlo import run_simulation, shutdown_pools, worker_info_task
+
+PAGE = """\
+with open({marker!r}, "a") as fh:
+    fh.write("ran\\n")
+"""
+
+
+def check(workers=2, chunks=4):
+    """Run ``chunks`` probe chunks on ``workers`` processes; returns a list of problems (empty if none)."""
+    problems = []
+    with tempfile.TemporaryDirectory() as tmp:
+        marker = os.path.join(tmp, "page_runs.txt")
+        page = os.path.join(tmp, "page.py")
+        with open(page, "w") as fh:
+            fh.write(PAGE.format(marker=marker))
+
+        fake_main = types.ModuleType("__main__")
+        fake_main.__file__ = page
+        real_main = sys.modules["__main__"]
+        sys.modules["__main__"] = fake_main
+        try:
+            start = time.perf_counter()
+            result = run_simulation(worker_info_task, chunks, chunk_size=1, max_workers=workers)
+            elapsed = time.perf_counter() - start
+        finally:
+            sys.modules["__main__"] = real_main
+            shutdown_pools()
+
+        if page in result["main_files"]:
+            problems.append(f"a worker's __mp_main__ was the page {page}")
+        if os.path.exists(marker):
+            with open(marker) as fh:
+                problems.append(f"the page ran {len(fh.readlines())} time(s) in workers")
+        if result["streamlit"]:
+            problems.append(f"streamlit was imported in {result['streamlit']} chunk(s)")
+    print(f"{chunks} chunks on {workers} workers in {elapsed:.2f} s; worker __mp_main__: {sorted(set(map(str, result['main_files'])))}")
+    return problems
+
+
+def main():
+    problems = check()
+    for problem in problems:
+        print(f"FAIL: {problem}")
+    if problems:
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""Run the benchmark suite and save or compare JSON results.
+
+Usage (from the repository root)::
+
+    python -m benchmarks.run                       # everything, results/<timestamp>.json
+    python -m benchmarks.run -k clt -o before.json # only cases whose name contains "clt"
+    python -m benchmarks.run --compare before.json after.json
+
+Every parameter combination runs in a fresh process so peak RSS is measured
+per case rather than for the whole suite.  Wall time is the median of
+``--repeat`` timed calls after one warm-up call; allocations are measured in
+a separate ``tracemalloc`` pass so tracing does not distort the timings.
+A case whose process dies (e.g. killed for running out of memory) or runs
+past ``--timeout`` seconds is recorded as an error and the suite moves on.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from queue import Empty
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from benchmarks.cases import CASES, expand
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+# How often run_case checks that the child is still alive while waiting
+POLL_INTERVAL_S = 1.0
+
+
+def _max_rss_bytes():
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def _measure(name, params, repeat, queue):
+    try:
+        setup, _ = CASES[name]
+        func = setup(**params)
+        func()  # warm-up: imports, caches, first-touch allocations
+
+        rss_before = _max_rss_bytes()
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+        rss_after = _max_rss_bytes()
+
+        tracemalloc.start()
+        func()
+        current, peak = tracemalloc.get_traced_memory()
+        blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+        tracemalloc.stop()
+
+        queue.put({
+            "wall_time_s": statistics.median(times),
+            "wall_time_min_s": min(times),
+            "peak_rss_bytes": rss_after,
+            "peak_rss_delta_bytes": None if rss_after is None else rss_after - rss_before,
+            "alloc_peak_bytes": peak,
+            "alloc_retained_bytes": current,
+            "alloc_live_blocks": blocks,
+        })
+    except Exception as exc:  # reported, not raised, so one failing case does not stop the suite
+        queue.put({"error": f"{type(exc).__name__}: {exc}"})
+
+
+def run_case(name, params, repeat, timeout=None):
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    proc = ctx.Process(target=_measure, args=(name, params, repeat, queue))
+    proc.start()
+    deadline = None if timeout is None else time.monotonic() + timeout
+    result = None
+    while result is None:
+        try:
+            result = queue.get(timeout=POLL_INTERVAL_S)
+        except Empty:
+            if not proc.is_alive():
+                # A result put just before exiting may still be in the pipe
+                try:
+                    result = queue.get(timeout=POLL_INTERVAL_S)
+                except Empty:
+                    result = {"error": f"child process exited with code {proc.exitcode} without a result"}
+            elif deadline is not None and time.monotonic() > deadline:
+                proc.terminate()
+                result = {"error": f"timed out after {timeout:g} s"}
+    proc.join()
+    return {"case": name, "params": params, **result}
+
+
+def run_suite(pattern=None, repeat=5, timeout=None):
+    results = []
+    for name in CASES:
+        if pattern and pattern not in name:
+            continue
+        for params in expand(name):
+            result = run_case(name, params, repeat, timeout)
+            results.append(result)
+            label = ", ".join(f"{k}={v}" for k, v in params.items())
+            if "error" in result:
+                print(f"{name}({label}): ERROR {result['error']}")
+            else:
+                print(f"{name}({label}): {result['wall_time_s'] * 1e3:.2f} ms, "
+                      f"alloc peak {result['alloc_peak_bytes'] / 2**20:.1f} MiB")
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "machine": {
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "cpu_count": os.cpu_count(),
+            "python": platform.python_version(),
+        },
+        "repeat": repeat,
+        "timeout": timeout,
+        "results": results,
+    }
+
+
+def _key(result):
+    return result["case"], json.dumps(result["params"], sort_keys=True)
+
+
+def compare(old_path, new_path):
+    """Print the wall-time and allocation change of every case present in both files."""
+    with open(old_path) as fh:
+        old = {_key(r): r for r in json.load(fh)["results"] if "error" not in r}
+    with open(new_path) as fh:
+        new = {_key(r): r for r in json.load(fh)["results"] if "error" not in r}
+
+    print(f"{'case':<55} {'old ms':>10} {'new ms':>10} {'speedup':>8} {'alloc Δ MiB':>12}")
+    for key in sorted(old.keys() & new.keys()):
+        before, after = old[key], new[key]
+        label = f"{key[0]} {key[1]}"
+        speedup = before["wall_time_s"] / after["wall_time_s"] if after["wall_time_s"] else float("inf")
+        alloc_delta = (after["alloc_peak_bytes"] - before["alloc_peak_bytes"]) / 2**20
+        print(f"{label[:55]:<55} {before['wall_time_s'] * 1e3:>10.2f} {after['wall_time_s'] * 1e3:>10.2f} "
+              f"{speedup:>7.2f}x {alloc_delta:>12.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-k", "--filter", help="only run cases whose name contains this string")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="timed calls per case (default 5)")
+    parser.add_argument("-t", "--timeout", type=float, help="seconds before a case is stopped (default: no limit)")
+    parser.add_argument("-o", "--output", help="JSON file to write (default benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="compare two result files and exit")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    report = run_suite(args.filter, args.repeat, args.timeout)
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        output = os.path.join(RESULTS_DIR, f"{stamp}.json")
+    with open(output, "w") as fh:
+        json.dump(report, fh, indent=2)
+    print(f"Saved {len(report['results'])} results to {output}")
+
+
+if __name__ == "__main__":
+    main()
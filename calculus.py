@@ -1,8 +1,8 @@
 import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import sympy as sp
+from probability.calculus import definite_integral, derivative_at, left_riemann_sum, limit_at, parse_function, sympy_to_function
 
 # Set page configuration
 st.set_page_config(layout="wide", page_title="Calculus Explorer", page_icon="📈")
@@ -42,10 +42,6 @@ st.title("Calculus Explorer: An Interactive Journey")
 # Create tabs for each topic
 tabs = st.tabs(["Limits", "Derivatives", "Integrals"])
 
-# Helper function to convert SymPy expressions to Python functions
-def sympy_to_function(expr):
-    return sp.lambdify(x, expr, "numpy")
-
 # Limits
 with tabs[0]:
     col1, col2 = st.columns([1, 2])
@@ -63,10 +59,10 @@ with tabs[0]:
     
     with col2:
         x = sp.Symbol('x')
-        f = sp.sympify(function)
+        f = parse_function(function)
         
         try:
-            limit = sp.limit(f, x, limit_point)
+            limit = limit_at(f, limit_point)
             
             x_vals = np.linspace(limit_point - 2, limit_point + 2, 1000)
             x_vals = x_vals[x_vals != limit_point]  # Remove the limit point to avoid division by zero
@@ -103,18 +99,16 @@ with tabs[1]:
     
     with col2:
         x = sp.Symbol('x')
-        f = sp.sympify(function_d)
+        f = parse_function(function_d)
         
         try:
-            derivative = sp.diff(f, x)
-            derivative_at_point = derivative.subs(x, point)
+            derivative, derivative_at_point, tangent_b = derivative_at(f, point)
             
             x_vals = np.linspace(point - 2, point + 2, 100)
             f_numpy = sympy_to_function(f)
             y_vals = f_numpy(x_vals)
             
             # Tangent line
-            tangent_b = f.subs(x, point) - derivative_at_point * point
             tangent_y = [float(derivative_at_point) * val + float(tangent_b) for val in x_vals]
             
             fig = go.Figure()
@@ -150,10 +144,10 @@ with tabs[2]:
     
     with col2:
         x = sp.Symbol('x')
-        f = sp.sympify(function_i)
+        f = parse_function(function_i)
         
         try:
-            integral = sp.integrate(f, (x, a, b))
+            integral = definite_integral(f, a, b)
             
             x_vals = np.linspace(a, b, 100)
             f_numpy = sympy_to_function(f)
@@ -170,7 +164,6 @@ with tabs[2]:
             
             # Visualize Riemann sum
             n_rectangles = st.slider("Number of rectangles for Riemann sum", 1, 50, 10)
-            dx = (b - a) / n_rectangles
             x_riemann = np.linspace(a, b, n_rectangles + 1)
             y_riemann = f_numpy(x_riemann)
             
@@ -187,7 +180,7 @@ with tabs[2]:
                                       width=700, height=400, showlegend=True)
             st.plotly_chart(fig_riemann)
             
-            riemann_sum = float(sum(f.subs(x, x_riemann[i]) * dx for i in range(n_rectangles)))
+            riemann_sum = left_riemann_sum(f, a, b, n_rectangles)
             st.markdown(f"**Riemann Sum Approximation:** {riemann_sum}")
         except Exception as e:
             st.error(f"An error occurred: {str(e)}")
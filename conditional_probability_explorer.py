@@ -1,8 +1,11 @@
 import streamlit as st
 import plotly.graph_objects as go
-import random
 import pandas as pd
-import matplotlib.pyplot as plt
+from probability.rules import bayes_posterior, conditional_probability, total_probability
+from probability.rng import session_rng
+from probability.lazy import lazy_import
+
+plt = lazy_import("matplotlib.pyplot")
 
 # Set page config
 st.set_page_config(layout="wide", page_title="Conditional Probability Explorer", page_icon="🎲")
@@ -118,8 +121,8 @@ with tab1:
     p_negative_given_no_disease = 0.90
     p_positive_given_no_disease = 1 - p_negative_given_no_disease
 
-    p_positive = p_disease * p_positive_given_disease + (1 - p_disease) * p_positive_given_no_disease
-    p_disease_given_positive = (p_disease * p_positive_given_disease) / p_positive
+    p_positive = total_probability(p_positive_given_disease, p_disease, p_positive_given_no_disease)
+    p_disease_given_positive = bayes_posterior(p_positive_given_disease, p_disease, p_positive)
 
     st.markdown(f"""
     <p class='small-font'>
@@ -153,8 +156,8 @@ with tab2:
     with col2:
         p_a_and_b = st.slider("P(A and B)", 0.0, min(p_a, p_b), min(p_a, p_b)/2, 0.01)
 
-    p_a_given_b = p_a_and_b / p_b if p_b != 0 else 0
-    p_b_given_a = p_a_and_b / p_a if p_a != 0 else 0
+    p_a_given_b = conditional_probability(p_a_and_b, p_b)
+    p_b_given_a = conditional_probability(p_a_and_b, p_a)
 
     st.markdown(f"""
     <p class='medium-font'>Results:</p>
@@ -189,10 +192,8 @@ with tab3:
         suits = ['♥️', '♦️', '♣️', '♠️']
         ranks = ['A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K']
         
-        first_card = f"{random.choice(ranks)}{random.choice(suits)}"
-        remaining_cards = [f"{rank}{suit}" for rank in ranks for suit in suits]
-        remaining_cards.remove(first_card)
-        second_card = random.choice(remaining_cards)
+        rng = session_rng().generator("card_draw")
+        first_card, second_card = rng.choice([f"{rank}{suit}" for rank in ranks for suit in suits], size=2, replace=False)
 
         st.markdown(f"""
         <p class='small-font'>
@@ -1,9 +1,10 @@
-
 import streamlit as st
 import plotly.graph_objects as go
-import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+from probability.lazy import lazy_import
+from probability.random_variables import discrete_moments
+
+plt = lazy_import("matplotlib.pyplot")
 
 # Set page config
 st.set_page_config(layout="wide", page_title="Expected Value and Variance Explorer", page_icon="📊")
@@ -105,9 +106,7 @@ with tab1:
     outcomes = [1, 2, 3, 4, 5, 6]
     probabilities = [1/6] * 6
     
-    expected_value = sum([x * p for x, p in zip(outcomes, probabilities)])
-    variance = sum([(x - expected_value)**2 * p for x, p in zip(outcomes, probabilities)])
-    std_dev = np.sqrt(variance)
+    expected_value, variance, std_dev = discrete_moments(outcomes, probabilities)
 
     st.markdown(f"""
     <p class='small-font'>
@@ -139,9 +138,7 @@ with tab2:
     returns = [-1000, 0, 1000, 2000]
     probabilities = [0.1, 0.3, 0.4, 0.2]
 
-    expected_return = sum([r * p for r, p in zip(returns, probabilities)])
-    variance = sum([(r - expected_return)**2 * p for r, p in zip(returns, probabilities)])
-    std_dev = np.sqrt(variance)
+    expected_return, variance, std_dev = discrete_moments(returns, probabilities)
 
     st.markdown(f"""
     <p class='small-font'>
@@ -183,9 +180,7 @@ with tab3:
     if sum(probabilities) != 1.0:
         st.warning("The sum of probabilities should be 1.0")
     else:
-        expected_value = sum([x * p for x, p in zip(outcomes, probabilities)])
-        variance = sum([(x - expected_value)**2 * p for x, p in zip(outcomes, probabilities)])
-        std_dev = np.sqrt(variance)
+        expected_value, variance, std_dev = discrete_moments(outcomes, probabilities)
 
         st.markdown(f"""
         <p class='medium-font'>Results:</p>
@@ -2,12 +2,13 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import networkx as nx
-import matplotlib.pyplot as plt
-import seaborn as sns
-from scipy.stats import pearsonr
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import networkx.algorithms.community as nx_comm
+from probability.graphs import community_partition, network_metrics, node_metrics
+from probability.profiling import page_profiler
+from probability.lazy import lazy_import
+
+plt = lazy_import("matplotlib.pyplot")
 
 @st.cache_data
 def load_data():
@@ -16,6 +17,7 @@ def load_data():
 
 def main():
     st.set_page_config(page_title="Graph Theory in Statistics Demo", layout="wide")
+    profiler = page_profiler("graph_theory_in_statistics")
     
     # Custom CSS for better styling
     st.markdown("""
@@ -71,17 +73,19 @@ def main():
         introduction_section()
     
     with tabs[1]:
-        network_visualization_section()
+        network_visualization_section(profiler)
     
     with tabs[2]:
-        network_metrics_section()
+        network_metrics_section(profiler)
     
     with tabs[3]:
-        community_detection_section()
+        community_detection_section(profiler)
     
     with tabs[4]:
         quiz_section()
 
+    profiler.report()
+
 def introduction_section():
     st.header("Introduction to Graph Theory in Statistics")
     
@@ -115,7 +119,7 @@ def introduction_section():
     - Applicable in various fields such as social network analysis, biology, transportation, and more
     """)
 
-def network_visualization_section():
+def network_visualization_section(profiler):
     st.header("Network Visualization")
 
     G = load_data()
@@ -131,16 +135,19 @@ def network_visualization_section():
     layout = st.selectbox("Choose a layout", ["spring", "circular", "random", "shell"])
     
     # Create the plot
-    fig, ax = plt.subplots(figsize=(10, 8))
-    pos = nx.spring_layout(G) if layout == "spring" else \
-          nx.circular_layout(G) if layout == "circular" else \
-          nx.random_layout(G) if layout == "random" else \
-          nx.shell_layout(G)
+    with profiler.section("layout"):
+        pos = nx.spring_layout(G) if layout == "spring" else \
+              nx.circular_layout(G) if layout == "circular" else \
+              nx.random_layout(G) if layout == "random" else \
+              nx.shell_layout(G)
     
-    nx.draw(G, pos, with_labels=True, node_color='lightblue', 
-            node_size=500, font_size=10, font_weight='bold', ax=ax)
+    with profiler.section("figure construction"):
+        fig, ax = plt.subplots(figsize=(10, 8))
+        nx.draw(G, pos, with_labels=True, node_color='lightblue', 
+                node_size=500, font_size=10, font_weight='bold', ax=ax)
     
-    st.pyplot(fig)
+    with profiler.section("serialization"):
+        st.pyplot(fig)
 
     st.markdown("""
     This visualization shows the Zachary's Karate Club network. Each node represents a member of the karate club, 
@@ -150,7 +157,7 @@ def network_visualization_section():
     Try different layouts to see how they affect the visualization of the network structure.
     """)
 
-def network_metrics_section():
+def network_metrics_section(profiler):
     st.header("Network Metrics")
 
     G = load_data()
@@ -163,30 +170,30 @@ def network_metrics_section():
     """, unsafe_allow_html=True)
 
     # Calculate metrics
-    degrees = dict(G.degree())
-    betweenness = nx.betweenness_centrality(G)
-    closeness = nx.closeness_centrality(G)
-    eigenvector = nx.eigenvector_centrality(G)
-
-    metrics_df = pd.DataFrame({
-        'Degree': degrees,
-        'Betweenness Centrality': betweenness,
-        'Closeness Centrality': closeness,
-        'Eigenvector Centrality': eigenvector
-    })
+    with profiler.section("statistics"):
+        metrics = node_metrics(G)
+        summary = network_metrics(G)
+    degrees = metrics['Degree']
+    betweenness = metrics['Betweenness Centrality']
+    closeness = metrics['Closeness Centrality']
+    eigenvector = metrics['Eigenvector Centrality']
+
+    metrics_df = pd.DataFrame(metrics)
 
     st.subheader("Node-level Metrics")
     st.write(metrics_df)
 
     # Visualize distributions
-    fig = make_subplots(rows=2, cols=2, subplot_titles=("Degree Distribution", "Betweenness Centrality", 
-                                                        "Closeness Centrality", "Eigenvector Centrality"))
-    fig.add_trace(go.Histogram(x=list(degrees.values()), name="Degree"), row=1, col=1)
-    fig.add_trace(go.Histogram(x=list(betweenness.values()), name="Betweenness"), row=1, col=2)
-    fig.add_trace(go.Histogram(x=list(closeness.values()), name="Closeness"), row=2, col=1)
-    fig.add_trace(go.Histogram(x=list(eigenvector.values()), name="Eigenvector"), row=2, col=2)
-    fig.update_layout(height=600, width=800, title_text="Distribution of Centrality Measures")
-    st.plotly_chart(fig)
+    with profiler.section("figure construction"):
+        fig = make_subplots(rows=2, cols=2, subplot_titles=("Degree Distribution", "Betweenness Centrality", 
+                                                            "Closeness Centrality", "Eigenvector Centrality"))
+        fig.add_trace(go.Histogram(x=list(degrees.values()), name="Degree"), row=1, col=1)
+        fig.add_trace(go.Histogram(x=list(betweenness.values()), name="Betweenness"), row=1, col=2)
+        fig.add_trace(go.Histogram(x=list(closeness.values()), name="Closeness"), row=2, col=1)
+        fig.add_trace(go.Histogram(x=list(eigenvector.values()), name="Eigenvector"), row=2, col=2)
+        fig.update_layout(height=600, width=800, title_text="Distribution of Centrality Measures")
+    with profiler.section("serialization"):
+        st.plotly_chart(fig)
 
     st.markdown("""
     These distributions show how centrality measures vary across nodes in the network:
@@ -198,13 +205,13 @@ def network_metrics_section():
 
     # Network-level metrics
     st.subheader("Network-level Metrics")
-    st.write(f"Number of Nodes: {G.number_of_nodes()}")
-    st.write(f"Number of Edges: {G.number_of_edges()}")
-    st.write(f"Average Clustering Coefficient: {nx.average_clustering(G):.4f}")
-    st.write(f"Network Density: {nx.density(G):.4f}")
-    st.write(f"Network Diameter: {nx.diameter(G)}")
+    st.write(f"Number of Nodes: {summary['nodes']}")
+    st.write(f"Number of Edges: {summary['edges']}")
+    st.write(f"Average Clustering Coefficient: {summary['average_clustering']:.4f}")
+    st.write(f"Network Density: {summary['density']:.4f}")
+    st.write(f"Network Diameter: {summary['diameter']}")
 
-def community_detection_section():
+def community_detection_section(profiler):
     st.header("Community Detection")
 
     G = load_data()
@@ -216,22 +223,20 @@ def community_detection_section():
     </div>
     """, unsafe_allow_html=True)
 
-    # Louvain community detection
-    communities = nx_comm.louvain_communities(G)
-
-    # Create a dictionary mapping each node to its community
-    partition = {}
-    for i, community in enumerate(communities):
-        for node in community:
-            partition[node] = i
+    # Louvain community detection, as a mapping of each node to its community
+    with profiler.section("statistics"):
+        partition = community_partition(G)
 
     # Visualization with communities
-    fig, ax = plt.subplots(figsize=(10, 8))
-    pos = nx.spring_layout(G)
-    nx.draw(G, pos, node_color=[partition[node] for node in G.nodes()], with_labels=True, 
-            node_size=500, font_size=10, font_weight='bold', cmap=plt.cm.Set3, ax=ax)
+    with profiler.section("layout"):
+        pos = nx.spring_layout(G)
+    with profiler.section("figure construction"):
+        fig, ax = plt.subplots(figsize=(10, 8))
+        nx.draw(G, pos, node_color=[partition[node] for node in G.nodes()], with_labels=True, 
+                node_size=500, font_size=10, font_weight='bold', cmap=plt.cm.Set3, ax=ax)
     
-    st.pyplot(fig)
+    with profiler.section("serialization"):
+        st.pyplot(fig)
 
     st.markdown("""
     This visualization shows the network with nodes colored by their detected communities. 
@@ -1,7 +1,15 @@
 import streamlit as st
 import plotly.graph_objects as go
 import numpy as np
-import scipy.stats as stats
+from probability.batch import column_labels, file_format, iter_chunks, numeric_values, preview
+from probability.hypothesis import welch_df
+from probability.montecarlo import default_workers, run_simulation
+from probability.power import required_sample_size, welch_power_analytic, welch_power_task
+from probability.rng import make_generator, session_rng
+from probability.sequential import simulated_batches, split_groups, stream_sequential_test
+from probability.lazy import lazy_import
+
+stats = lazy_import("scipy.stats")
 
 # Set page configuration
 st.set_page_config(page_title="Hypothesis Testing Intro", layout="wide")
@@ -131,9 +139,9 @@ with plot_col:
         st.error("Sample sizes must be greater than 1.")
     else:
         # Generate Data
-        np.random.seed(42)
-        control_scores = np.random.normal(control_mean, control_std, control_size)
-        treatment_scores = np.random.normal(treatment_mean, treatment_std, treatment_size)
+        rng = make_generator(42)
+        control_scores = rng.normal(control_mean, control_std, control_size)
+        treatment_scores = rng.normal(treatment_mean, treatment_std, treatment_size)
 
         # Calculate means
         control_sample_mean = np.mean(control_scores)
@@ -142,10 +150,8 @@ with plot_col:
         # Perform two-sample t-test
         t_stat, p_value = stats.ttest_ind(treatment_scores, control_scores, equal_var=False)
 
-        # Degrees of freedom for Welch's t-test
-        df_num = (control_std**2 / control_size + treatment_std**2 / treatment_size)**2
-        df_den = ((control_std**2 / control_size)**2) / (control_size - 1) + ((treatment_std**2 / treatment_size)**2) / (treatment_size - 1)
-        df = df_num / df_den
+        # Degrees of freedom for Welch's t-test, from the specified group standard deviations
+        df = welch_df(control_std**2, control_size, treatment_std**2, treatment_size)
 
         # Critical values for two-tailed test
         t_critical = stats.t.ppf(1 - alpha/2, df)
@@ -334,6 +340,213 @@ with plot_col:
 
     st.markdown("**Visualizations update automatically based on your inputs.**")
 
+# Section 4b: Power Analysis
+st.header("Planning a Study: Power Analysis")
+
+st.markdown("""
+Before running an experiment, ask: **if the new technique really helps, how likely is the test to detect it?**
+That probability is the test's **power**. It grows with the size of the effect and with the number of students in each group.
+Below, thousands of experiments are simulated for every combination of effect size and group size, and the share of experiments
+that reject H₀ is the simulated power. The dashed curves are the textbook (noncentral t) answer for comparison.
+""")
+
+# Cached across reruns and sessions: the same plan is only simulated once
+@st.cache_data(max_entries=32, show_spinner=False)
+def power_grid(max_effect, n_min, n_max, grid_size, ratio, sd_ratio, alpha, reps, shard):
+    effects = np.linspace(0, max_effect, grid_size)
+    n_control = np.unique(np.round(np.geomspace(n_min, n_max, grid_size)).astype(np.int64))
+    result = run_simulation(welch_power_task, reps, seed=42, chunk_size=max(1000, reps // 8),
+                            max_workers=None if shard else 1, effects=effects, n_control=n_control,
+                            ratio=ratio, sd_ratio=sd_ratio, alpha=alpha)
+    simulated = result["rejections"] / result["count"]
+    analytic = welch_power_analytic(effects, n_control, ratio, sd_ratio, alpha)
+    return effects, n_control, simulated, analytic
+
+power_input_col, power_plot_col = st.columns([1, 2])
+
+with power_input_col:
+    st.subheader("Study Plan")
+    max_effect = st.slider("Largest effect size to consider (Cohen's d)", min_value=0.2, max_value=2.0, value=1.0, step=0.1,
+                           key='power_max_effect', help="Difference in means divided by the control group's standard deviation.")
+    n_min, n_max = st.select_slider("Control group size range", options=[5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000],
+                                    value=(5, 500), key='power_n_range')
+    ratio = st.number_input("Treatment / control group size ratio", value=1.0, min_value=0.1, max_value=10.0, step=0.1,
+                            key='power_ratio')
+    sd_ratio = st.number_input("Treatment / control std dev ratio", value=treatment_std / control_std, min_value=0.1,
+                               max_value=10.0, step=0.1, format="%.2f", key='power_sd_ratio')
+    grid_size = st.select_slider("Grid points per axis", options=[10, 25, 50], value=25, key='power_grid')
+    reps = st.select_slider("Simulated experiments per grid point", options=[1000, 10000], value=1000,
+                            format_func=lambda n: f"{n:,}", key='power_reps')
+    shard = st.checkbox(f"Spread the simulation over {default_workers()} worker processes", value=False, key='power_shard')
+    target_power = st.slider("Target power", min_value=0.5, max_value=0.99, value=0.8, step=0.01, key='power_target')
+
+with power_plot_col:
+    with st.spinner("Simulating experiments..."):
+        effects, n_control, simulated, analytic = power_grid(max_effect, n_min, n_max, grid_size, ratio, sd_ratio,
+                                                             alpha, reps, shard)
+
+    fig3 = go.Figure(go.Heatmap(z=simulated, x=n_control, y=effects, zmin=0, zmax=1, colorscale='Viridis',
+                                colorbar=dict(title='Power')))
+    fig3.add_trace(go.Contour(z=analytic, x=n_control, y=effects, contours=dict(start=target_power, end=target_power,
+                              coloring='none', showlabels=True), line=dict(color='white', dash='dash', width=2),
+                              showscale=False, name=f'{target_power:.0%} power (analytic)'))
+    fig3.update_layout(title='Simulated Power of the Welch t-Test', xaxis_title='Control Group Size',
+                       yaxis_title="Effect Size (Cohen's d)", xaxis_type='log')
+    st.plotly_chart(fig3, use_container_width=True)
+
+    # Four effect sizes spread over the grid get their own curves
+    planned = np.linspace(len(effects) // 4, len(effects) - 1, 4).astype(int)
+    fig4 = go.Figure()
+    colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728']
+    for color, i in zip(colors, planned):
+        fig4.add_trace(go.Scatter(x=n_control, y=simulated[i], mode='lines+markers', line=dict(color=color),
+                                  name=f'd = {effects[i]:.2f} (simulated)'))
+        fig4.add_trace(go.Scatter(x=n_control, y=analytic[i], mode='lines', line=dict(color=color, dash='dash'),
+                                  name=f'd = {effects[i]:.2f} (analytic)'))
+    fig4.add_hline(y=target_power, line_dash='dot', line_color='gray', annotation_text='Target power')
+    fig4.update_layout(title='Power Curves', xaxis_title='Control Group Size', yaxis_title='Power', xaxis_type='log',
+                       yaxis=dict(range=[0, 1.02]))
+    st.plotly_chart(fig4, use_container_width=True)
+
+    needed = required_sample_size(effects[planned], n_control, simulated[planned], target_power)
+    st.markdown("**Smallest control group reaching the target power:** " + ", ".join(
+        f"d = {effects[i]:.2f}: {'more than ' + str(n_control[-1]) if np.isnan(n) else int(n)}"
+        for i, n in zip(planned, needed)))
+    st.markdown(f"**Largest gap between simulated and analytic power:** {np.abs(simulated - analytic).max():.3f} "
+                f"(simulation noise is about ±{2 * np.sqrt(0.25 / reps):.3f})")
+
+# Section 4c: Sequential Testing
+st.header("Watching an Experiment Live: Sequential Testing")
+
+st.markdown("""
+Real experiments are rarely analysed only once. If you re-run the t-test after every batch of students and stop as soon as
+p < α ("peeking"), you will declare far more false discoveries than α promises. A **sequential test** is built to be checked
+after every batch: its **always-valid p-value** can only fall below α by chance with probability α, however often you look,
+and its **confidence sequence** covers the true difference at every look at once. Only running totals of each group are
+kept, so each batch costs the same no matter how many millions of events came before it.
+""")
+
+seq_input_col, seq_plot_col = st.columns([1, 2])
+
+with seq_input_col:
+    st.subheader("Event Stream")
+    seq_source = st.radio("Stream", ["Simulated (uses the groups above)", "Replay a local log file"], key='seq_source')
+    seq_file = None
+    if seq_source == "Simulated (uses the groups above)":
+        seq_events = st.select_slider("Events in the experiment", options=[10**4, 10**5, 10**6, 10**7], value=10**6,
+                                      format_func=lambda n: f"{n:,}", key='seq_events')
+    else:
+        seq_file = st.file_uploader("Event log (one row per event: group and outcome)", type=["csv", "parquet"],
+                                    key='seq_file')
+        if seq_file is not None:
+            seq_fmt = file_format(seq_file.name)
+            head = preview(seq_file, seq_fmt)
+            if head.empty or head.select_dtypes("number").columns.empty:
+                st.error("The log is empty, unreadable or has no numeric outcome column.")
+                seq_file = None
+            else:
+                seq_group_col = st.selectbox("Group column", list(head.columns), key='seq_group_col')
+                seq_value_col = st.selectbox("Outcome column", list(head.select_dtypes("number").columns), key='seq_value_col')
+                seq_treatment = st.selectbox("Treatment group label", column_labels(seq_file, seq_fmt, seq_group_col),
+                                             key='seq_treatment', accept_new_options=True,
+                                             help="Labels seen in the first rows; type another if the treatment "
+                                                  "group comes later in the log. Every other label counts as control.")
+                if seq_treatment is None:
+                    st.info("Type the treatment group label.")
+                    seq_file = None
+    seq_batch = st.select_slider("Events per batch", options=[100, 1000, 10000, 100000], value=10000,
+                                 format_func=lambda n: f"{n:,}", key='seq_batch')
+    seq_tau = st.number_input("Smallest difference worth detecting (τ)", value=1.0, min_value=0.01, step=0.1,
+                              key='seq_tau', help="Tunes how quickly the test reacts to differences of this size. "
+                                                  "It changes power, not the false positive rate.")
+    seq_stop = st.checkbox("Stop as soon as H₀ is rejected", value=True, key='seq_stop')
+    run_seq = st.button("Start Stream", disabled=seq_source != "Simulated (uses the groups above)" and seq_file is None)
+
+with seq_plot_col:
+    p_placeholder = st.empty()
+    ci_placeholder = st.empty()
+    status_placeholder = st.empty()
+
+    def draw_sequential(history, true_difference=None):
+        events = history["events"]
+        fig5 = go.Figure()
+        fig5.add_trace(go.Scatter(x=events, y=history["p_value"], mode='lines', name='Always-valid p-value',
+                                  line=dict(color='#2ca02c', width=3)))
+        fig5.add_trace(go.Scatter(x=events, y=history["fixed_p_value"], mode='lines', name='t-test p-value (peeking)',
+                                  line=dict(color='gray', dash='dot')))
+        fig5.add_hline(y=alpha, line_dash='dash', line_color='red', annotation_text='α')
+        fig5.update_layout(title='p-value After Each Batch', xaxis_title='Events', yaxis_title='p-value',
+                           yaxis_type='log', yaxis=dict(range=[-6, 0.05]), height=350)
+        p_placeholder.plotly_chart(fig5, use_container_width=True)
+
+        fig6 = go.Figure()
+        fig6.add_trace(go.Scatter(x=events, y=history["upper"], mode='lines', line=dict(width=0), showlegend=False))
+        fig6.add_trace(go.Scatter(x=events, y=history["lower"], mode='lines', line=dict(width=0), fill='tonexty',
+                                  fillcolor='rgba(31, 119, 180, 0.3)', name='Confidence sequence'))
+        fig6.add_trace(go.Scatter(x=events, y=history["difference"], mode='lines', name='Observed difference',
+                                  line=dict(color='#1f77b4')))
+        fig6.add_hline(y=0, line_dash='dash', line_color='red', annotation_text='No difference')
+        if true_difference is not None:
+            fig6.add_hline(y=true_difference, line_dash='dot', line_color='black', annotation_text='True difference')
+        fig6.update_layout(title='Difference in Means (Treatment - Control)', xaxis_title='Events',
+                           yaxis_title='Difference', height=350)
+        ci_placeholder.plotly_chart(fig6, use_container_width=True)
+
+    if run_seq:
+        if seq_file is None:
+            rng = session_rng().generator("sequential_stream")
+            batches = simulated_batches(rng, seq_events, seq_batch, control_mean, control_std, treatment_mean, treatment_std)
+            total_batches = -(-seq_events // seq_batch)
+            true_difference = treatment_mean - control_mean
+        else:
+            # Groups are read as text and outcomes coerced, so a malformed value later in the log becomes NaN
+            batches = (split_groups(frame[seq_group_col].to_numpy(), numeric_values(frame, seq_value_col), seq_treatment)
+                       for frame, _ in iter_chunks(seq_file, seq_fmt, [seq_group_col, seq_value_col], chunk_rows=seq_batch,
+                                                   text_columns=[seq_group_col]))
+            total_batches = None
+            true_difference = None
+
+        keys = ["events", "p_value", "fixed_p_value", "difference", "lower", "upper"]
+        history = {key: [] for key in keys}
+        # Redrawing Plotly figures dominates the cost of a batch, so refresh about 50 times per run
+        redraw_every = max(1, (total_batches or 1000) // 50)
+        snapshot = None
+        stale = False
+        for snapshot in stream_sequential_test(batches, alpha, seq_tau, stop_on_reject=seq_stop):
+            if not np.isfinite(snapshot["lower"]):
+                continue
+            for key in keys:
+                history[key].append(snapshot[key])
+            stale = snapshot["batches"] % redraw_every != 0
+            if not stale:
+                draw_sequential(history, true_difference)
+                status_placeholder.markdown(f"**Events so far:** {snapshot['events']:,}")
+        if history["events"]:
+            if stale:
+                draw_sequential(history, true_difference)
+            st.session_state.seq_result = {"history": history, "true_difference": true_difference, "final": snapshot}
+        else:
+            st.session_state.seq_result = None
+            status_placeholder.error("The stream ended before both groups had at least two observations.")
+    elif st.session_state.get("seq_result"):
+        draw_sequential(st.session_state.seq_result["history"], st.session_state.seq_result["true_difference"])
+
+    seq_result = st.session_state.get("seq_result")
+    if seq_result:
+        final = seq_result["final"]
+        events = seq_result["history"]["events"]
+        peeked = np.flatnonzero(np.asarray(seq_result["history"]["fixed_p_value"]) < alpha)
+        if final["rejected"]:
+            first = events[np.flatnonzero(np.asarray(seq_result["history"]["p_value"]) <= alpha)[0]]
+            status_placeholder.success(f"**H₀ rejected after {first:,} events** (always-valid p < α). After {final['events']:,} "
+                                       f"events the difference is between {final['lower']:.3f} and {final['upper']:.3f}.")
+        else:
+            status_placeholder.info(f"**No decision after {final['events']:,} events:** always-valid p = {final['p_value']:.4f}. "
+                                    f"The difference is between {final['lower']:.3f} and {final['upper']:.3f}.")
+        if len(peeked):
+            st.markdown(f"A peeking t-test would first have claimed significance after "
+                        f"**{events[peeked[0]]:,} events**.")
+
 # Section 5: Real-World Example
 st.header("Real-World Example: Medical Trial")
 
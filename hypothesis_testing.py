@@ -1,8 +1,19 @@
 import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-from scipy import stats
+import pandas as pd
+from probability.batch import (aggregate_counts, column_labels, file_format, group_column_moments, numeric_columns,
+                              preview)
+from probability.decimation import thin
+from probability.hypothesis import (chi_square_independence, one_sample_t_test, parse_contingency_table,
+                                    sparse_chi_square_independence, top_chi_square_cells, welch_t_test, z_test)
+from probability.lazy import lazy_import
+from probability.montecarlo import default_workers, run_simulation
+from probability.multiple_testing import CORRECTIONS, adjust_p_values, column_tests, screen_task
+from probability.permutation import contingency_permutation_test, sign_flip_test, two_sample_permutation_test
+from probability.rng import session_rng
+
+stats = lazy_import("scipy.stats")
 
 # Set page configuration
 st.set_page_config(layout="wide", page_title="Hypothesis Testing Explorer", page_icon="📊")
@@ -40,7 +51,7 @@ st.markdown("""
 st.title("Hypothesis Testing Explorer: An Interactive Journey")
 
 # Create tabs for each topic
-tabs = st.tabs(["Z-Test", "T-Test", "Chi-Square Test"])
+tabs = st.tabs(["Z-Test", "T-Test", "Chi-Square Test", "Permutation Tests", "Multiple Testing"])
 
 # Z-Test
 with tabs[0]:
@@ -60,8 +71,7 @@ with tabs[0]:
         alpha = st.slider("Significance Level (α)", 0.01, 0.10, 0.05, 0.01)
     
     with col2:
-        z_score = (sample_mean - population_mean) / (population_std / np.sqrt(sample_size))
-        p_value = 2 * (1 - stats.norm.cdf(abs(z_score)))
+        z_score, p_value = z_test(sample_mean, population_mean, population_std, sample_size)
         
         x = np.linspace(-4, 4, 1000)
         y = stats.norm.pdf(x, 0, 1)
@@ -99,9 +109,7 @@ with tabs[1]:
     
     with col2:
         sample = np.array([float(x.strip()) for x in sample_data.split(',')])
-        t_statistic, t_p_value = stats.ttest_1samp(sample, hypothesized_mean)
-        
-        df = len(sample) - 1
+        t_statistic, t_p_value, df = one_sample_t_test(sample, hypothesized_mean)
         x_t = np.linspace(-4, 4, 1000)
         y_t = stats.t.pdf(x_t, df)
         
@@ -136,8 +144,8 @@ with tabs[2]:
         alpha_chi = st.slider("Significance Level (α)", 0.01, 0.10, 0.05, 0.01, key='chi_square_alpha')
     
     with col2:
-        observed_array = np.array([list(map(int, row.split(','))) for row in observed.split('\n')])
-        chi2, chi_p_value, dof, expected = stats.chi2_contingency(observed_array)
+        observed_array = parse_contingency_table(observed)
+        chi2, chi_p_value, dof, expected = chi_square_independence(observed_array)
         
         x_chi = np.linspace(0, 20, 1000)
         y_chi = stats.chi2.pdf(x_chi, dof)
@@ -161,6 +169,308 @@ with tabs[2]:
         st.subheader("Expected Frequencies:")
         st.write(expected)
 
+    # Tables too large to type: long-format count files, aggregated in chunks and kept sparse
+    st.markdown("---")
+    st.subheader("Large Tables: Upload a Count File")
+    st.markdown("""
+    Upload a long-format file (CSV or Parquet) with one row per cell or per observation: a **row label**, a **column label** and,
+    optionally, a **count**. Files with millions of rows are summed in chunks, and the test only ever stores the non-zero cells.
+    """)
+    chi_file = st.file_uploader("Count file", type=["csv", "parquet"], key='chi_file')
+    if chi_file is not None:
+        chi_fmt = file_format(chi_file.name)
+        chi_columns = list(preview(chi_file, chi_fmt).columns)
+        if len(chi_columns) < 2:
+            st.error("The file is empty, unreadable or has fewer than two columns.")
+            chi_file = None
+    if chi_file is not None:
+        fcol1, fcol2, fcol3 = st.columns(3)
+        with fcol1:
+            chi_row_col = st.selectbox("Row label column", chi_columns, index=0, key='chi_row_col')
+        with fcol2:
+            chi_col_col = st.selectbox("Column label column", chi_columns, index=min(1, len(chi_columns) - 1), key='chi_col_col')
+        with fcol3:
+            count_options = ["(one observation per row)"] + chi_columns
+            chi_count_col = st.selectbox("Count column", count_options, index=3 if len(chi_columns) > 2 else 0, key='chi_count_col')
+        if st.button("Run Chi-Square Test on File"):
+            bar = st.progress(0.0, text="Summing counts...")
+            table = aggregate_counts(chi_file, chi_fmt, chi_row_col, chi_col_col,
+                                     None if chi_count_col == count_options[0] else chi_count_col,
+                                     progress=lambda fraction: bar.progress(fraction, text="Summing counts..."))
+            bar.empty()
+            if len(table["counts"]) == 0:
+                st.session_state.chi_sparse = None
+                st.error("The file has no valid counts.")
+            else:
+                shape = (len(table["row_labels"]), len(table["col_labels"]))
+                result = sparse_chi_square_independence(table["rows"], table["cols"], table["counts"], shape)
+                top = top_chi_square_cells(table["rows"], table["cols"], table["counts"], k=20, shape=shape)
+                st.session_state.chi_sparse = {"name": chi_file.name, "table": table, "shape": shape,
+                                               "result": result, "top": top}
+
+    sparse = st.session_state.get("chi_sparse")
+    if sparse is not None:
+        table, shape = sparse["table"], sparse["shape"]
+        chi2_file, p_file, dof_file, _ = sparse["result"]
+        cells = shape[0] * shape[1]
+        st.markdown(f"**{sparse['name']}:** {table['lines']:,} rows read, {table['invalid']:,} skipped")
+        m1, m2, m3, m4 = st.columns(4)
+        m1.metric("Table size", f"{shape[0]:,} × {shape[1]:,}")
+        m2.metric("Non-zero cells", f"{len(table['counts']):,}", help=f"{len(table['counts']) / cells:.4%} of all cells")
+        m3.metric("Chi-Square Statistic", f"{chi2_file:,.2f}", help=f"{dof_file:,} degrees of freedom")
+        m4.metric("P-value", f"{p_file:.4g}")
+        if p_file < alpha_chi:
+            st.markdown("**Conclusion:** Reject the null hypothesis")
+        else:
+            st.markdown("**Conclusion:** Fail to reject the null hypothesis")
+        if table["counts"].sum() < 5 * cells:
+            st.warning("The average expected count is below 5, so the chi-square approximation is unreliable. "
+                       "Merging rare labels, or a permutation test on a smaller table, gives a more trustworthy p-value.")
+
+        top = sparse["top"]
+        st.subheader("Top Contributing Cells")
+        st.dataframe(pd.DataFrame({
+            "Row": table["row_labels"][top["row"]],
+            "Column": table["col_labels"][top["col"]],
+            "Observed": top["observed"],
+            "Expected": top["expected"],
+            "Residual": top["residual"],
+            "Share of Chi-Square": top["contribution"] / chi2_file if chi2_file > 0 else np.nan,
+        }).style.format({"Observed": "{:,.0f}", "Expected": "{:,.2f}", "Residual": "{:+.2f}", "Share of Chi-Square": "{:.2%}"}),
+            hide_index=True)
+        st.markdown("Residuals are (observed − expected) / √expected: positive cells occur more often than independence predicts.")
+
+# Permutation Tests
+with tabs[3]:
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        st.header("Permutation Tests")
+        st.markdown("""
+        A permutation test needs no distributional assumptions. Under H₀ the data could have been arranged differently
+        (signs flipped, group labels swapped, table labels shuffled) without changing its distribution, so the p-value is the
+        share of rearrangements whose statistic is at least as extreme as the observed one.
+        """)
+        perm_test = st.radio("Test", ["One-sample sign-flip", "Two-sample mean difference", "Contingency table independence"],
+                             key='perm_test')
+        if perm_test == "One-sample sign-flip":
+            perm_source = st.radio("Data", ["T-Test tab sample", "Generated sample"], key='perm_source',
+                                   help="H₀: the sample is symmetric about the hypothesized mean.")
+            if perm_source == "Generated sample":
+                perm_n = st.select_slider("Sample size", options=[10, 100, 1000, 10000, 100000], value=1000,
+                                          format_func=lambda n: f"{n:,}", key='perm_n')
+                perm_shift = st.slider("True mean minus hypothesized mean", -1.0, 1.0, 0.05, 0.01, key='perm_shift')
+                perm_skewed = st.checkbox("Skewed data (centred exponential)", value=False, key='perm_skewed')
+        elif perm_test == "Two-sample mean difference":
+            perm_n = st.select_slider("Size of each group", options=[5, 10, 100, 1000, 10000, 50000], value=1000,
+                                      format_func=lambda n: f"{n:,}", key='perm_group_n')
+            perm_shift = st.slider("Difference in group means", -1.0, 1.0, 0.1, 0.01, key='perm_group_shift')
+            perm_skewed = st.checkbox("Skewed data (centred exponential)", value=False, key='perm_group_skewed')
+        else:
+            st.markdown("Uses the observed frequencies from the Chi-Square Test tab.")
+        perm_permutations = st.select_slider("Maximum permutations", options=[1000, 10000, 100000], value=10000,
+                                             format_func=lambda n: f"{n:,}", key='perm_permutations')
+        alpha_perm = st.slider("Significance Level (α)", 0.01, 0.10, 0.05, 0.01, key='perm_alpha')
+        perm_early_stop = st.checkbox("Stop once the decision at α is clear", value=True, key='perm_early_stop',
+                                      help="Stops when a 99% confidence interval for the p-value lies entirely above or below α.")
+        perm_shard = st.checkbox(f"Spread permutations over {default_workers()} worker processes", value=False, key='perm_shard')
+        run_perm = st.button("Run Permutation Test")
+
+    with col2:
+        if run_perm:
+            rng = session_rng().generator("perm_data")
+            def draw(n, shift):
+                if perm_skewed:
+                    return rng.exponential(1.0, n) - 1.0 + shift
+                return rng.standard_normal(n) + shift
+            options = dict(max_permutations=perm_permutations, alpha=alpha_perm, seed=session_rng().seed_sequence("perm_test"),
+                           batch_size=max(1000, perm_permutations // 20), early_stop=perm_early_stop,
+                           max_workers=None if perm_shard else 1)
+            bar = st.progress(0.0, text="Permuting...")
+            options["progress"] = lambda done, total: bar.progress(done / total, text=f"Permuting... {done:,} / {total:,}")
+            if perm_test == "One-sample sign-flip":
+                if perm_source == "T-Test tab sample":
+                    data, mu0 = sample, hypothesized_mean
+                else:
+                    data, mu0 = draw(perm_n, perm_shift), 0.0
+                result = sign_flip_test(data, mu0, **options)
+                parametric = ("t-test", one_sample_t_test(data, mu0)[1])
+            elif perm_test == "Two-sample mean difference":
+                first, second = draw(perm_n, perm_shift), draw(perm_n, 0.0)
+                result = two_sample_permutation_test(first, second, **options)
+                parametric = ("Welch t-test", welch_t_test(first, second)[1])
+            else:
+                result = contingency_permutation_test(observed_array, **options)
+                parametric = ("Chi-square test", stats.chi2_contingency(observed_array, correction=False)[1])
+            bar.empty()
+            st.session_state.perm_result = {"test": perm_test, "alpha": alpha_perm, "result": result, "parametric": parametric}
+
+        perm = st.session_state.get("perm_result")
+        if perm is None:
+            st.info("Choose a test and press **Run Permutation Test**.")
+        else:
+            result = perm["result"]
+            name, parametric_p = perm["parametric"]
+            st.subheader(perm["test"])
+            m1, m2, m3 = st.columns(3)
+            m1.metric("Permutation p-value", f"{result['p_value']:.4f}")
+            m2.metric(f"{name} p-value", f"{parametric_p:.4f}")
+            m3.metric("Permutations", f"{result['permutations']:,}",
+                      help="All arrangements were enumerated" if result["exact"] else "Random arrangements")
+            lower, upper = result["interval"]
+            fig = go.Figure()
+            fig.add_trace(go.Bar(x=["Permutation", name], y=[result["p_value"], parametric_p], marker_color=['#4CAF50', '#2C3E50'],
+                                 error_y=dict(type='data', symmetric=False, array=[upper - result["p_value"], 0],
+                                              arrayminus=[max(result["p_value"] - lower, 0), 0])))
+            fig.add_hline(y=perm["alpha"], line_dash="dash", line_color="red", annotation_text="α")
+            fig.update_layout(title='Distribution-free vs Parametric p-value', yaxis_title='p-value',
+                              width=700, height=400, showlegend=False)
+            st.plotly_chart(fig)
+
+            if result["exact"]:
+                st.markdown("**Exact test:** every possible arrangement was evaluated, so the p-value has no simulation error.")
+            else:
+                st.markdown(f"**99% interval for the p-value:** [{lower:.4f}, {upper:.4f}]")
+                if result["stopped_early"]:
+                    st.markdown("Stopped early: more permutations would not change the decision at α.")
+            if result["p_value"] < perm["alpha"]:
+                st.markdown("**Conclusion:** Reject the null hypothesis")
+            else:
+                st.markdown("**Conclusion:** Fail to reject the null hypothesis")
+
+# Multiple Testing
+with tabs[4]:
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        st.header("Multiple Testing")
+        st.markdown("""
+        Screening many metrics at once? At α = 0.05, about 1 in 20 metrics with **no** real difference will still look significant.
+        With thousands of metrics that is hundreds of false alarms, so the p-values must be corrected:
+        
+        - **Bonferroni / Holm** keep the chance of even one false alarm below α.
+        - **Benjamini-Hochberg** keeps the expected share of false alarms among the discoveries below α.
+        """)
+        multi_source = st.radio("Data", ["Simulated screen", "Upload a wide table"], key='multi_source')
+        multi_file = None
+        if multi_source == "Simulated screen":
+            multi_metrics = st.select_slider("Metrics", options=[100, 1000, 10000], value=1000,
+                                             format_func=lambda n: f"{n:,}", key='multi_metrics')
+            multi_units = st.select_slider("Units (rows)", options=[1000, 10000, 100000], value=10000,
+                                           format_func=lambda n: f"{n:,}", key='multi_units')
+            multi_affected = st.slider("Share of metrics with a real difference", 0.0, 0.2, 0.05, 0.01, key='multi_affected')
+            multi_effect = st.slider("Size of the real differences (standard deviations)", 0.01, 0.5, 0.1, 0.01, key='multi_effect')
+            multi_shard = st.checkbox(f"Spread the simulation over {default_workers()} worker processes", value=False,
+                                      key='multi_shard')
+        else:
+            multi_file = st.file_uploader("Wide table (one row per unit, one column per metric, plus a group column)",
+                                          type=["csv", "parquet"], key='multi_file')
+            if multi_file is not None:
+                multi_fmt = file_format(multi_file.name)
+                head = preview(multi_file, multi_fmt)
+                if head.empty:
+                    st.error("The table is empty or unreadable.")
+                    multi_file = None
+            if multi_file is not None:
+                multi_group_col = st.selectbox("Group column", list(head.columns), key='multi_group_col')
+                multi_treatment = st.selectbox("Treatment group label", column_labels(multi_file, multi_fmt, multi_group_col),
+                                               key='multi_treatment', accept_new_options=True,
+                                               help="Labels seen in the first rows; type another if the treatment "
+                                                    "group comes later in the file. Every other label counts as control.")
+                multi_columns = [name for name in numeric_columns(multi_file, multi_fmt) if name != multi_group_col]
+                if multi_treatment is None:
+                    st.info("Type the treatment group label.")
+                    multi_file = None
+                elif multi_columns:
+                    st.markdown(f"**{len(multi_columns):,} numeric metric columns** will be tested.")
+                else:
+                    st.error("The table has no numeric metric columns.")
+                    multi_file = None
+        multi_test = st.radio("Test", ["Welch t-test", "z-test"], key='multi_test', horizontal=True)
+        multi_correction = st.selectbox("Correction", list(CORRECTIONS), index=3, format_func=CORRECTIONS.get,
+                                        key='multi_correction')
+        alpha_multi = st.slider("Significance Level (α)", 0.01, 0.10, 0.05, 0.01, key='multi_alpha')
+        run_multi = st.button("Run Screen", disabled=multi_source == "Upload a wide table" and multi_file is None)
+
+    with col2:
+        if run_multi:
+            bar = st.progress(0.0, text="Testing metrics...")
+            if multi_file is None:
+                shifts = np.zeros(multi_metrics)
+                truth = np.arange(multi_metrics) < round(multi_affected * multi_metrics)
+                shifts[truth] = multi_effect
+                moments = run_simulation(screen_task, multi_units, seed=session_rng().seed_sequence("multi_screen"),
+                                         chunk_size=max(1000, multi_units // 10), max_workers=None if multi_shard else 1,
+                                         progress=lambda done, total: bar.progress(done / total, text="Testing metrics..."),
+                                         shifts=shifts)
+                names = np.array([f"metric_{i:05d}" for i in range(multi_metrics)])
+                units = multi_units
+            else:
+                moments = group_column_moments(multi_file, multi_fmt, multi_group_col, multi_treatment, multi_columns,
+                                               progress=lambda fraction: bar.progress(fraction, text="Testing metrics..."))
+                truth = None
+                names = np.array(multi_columns)
+                units = moments["rows"]
+            bar.empty()
+            # Only the per-group moments are kept, so changing the test or correction does not re-read the data
+            st.session_state.multi_result = {"treatment": moments["treatment"], "control": moments["control"],
+                                             "names": names, "truth": truth, "units": units}
+
+        multi = st.session_state.get("multi_result")
+        if multi is None:
+            st.info("Choose the data and press **Run Screen**.")
+        else:
+            tests = column_tests(multi["treatment"], multi["control"], "z" if multi_test == "z-test" else "t")
+            p_values = tests["p_value"]
+            tested = int(np.count_nonzero(~np.isnan(p_values)))
+            truth = multi["truth"]
+
+            rows = []
+            for method, label in CORRECTIONS.items():
+                rejected = adjust_p_values(p_values, method) < alpha_multi
+                row = {"Correction": label, "Discoveries": int(rejected.sum())}
+                if truth is not None:
+                    row["False discoveries"] = int((rejected & ~truth).sum())
+                    row["Real differences missed"] = int((~rejected & truth).sum())
+                rows.append(row)
+            st.markdown(f"**{tested:,} metrics tested on {multi['units']:,} units**")
+            st.dataframe(pd.DataFrame(rows), hide_index=True)
+
+            adjusted = adjust_p_values(p_values, multi_correction)
+            significant = adjusted < alpha_multi
+            x = tests["effect"]
+            y = -np.log10(np.maximum(p_values, 1e-300))
+            # Every discovery is drawn; the cloud of non-significant metrics is thinned to keep the plot responsive
+            hits = np.flatnonzero(significant)
+            others = np.flatnonzero(~significant & ~np.isnan(p_values))
+            hits = hits[thin(len(hits), 5000)]
+            others = others[thin(len(others), 3000)]
+            fig = go.Figure()
+            fig.add_trace(go.Scattergl(x=x[others], y=y[others], mode='markers', name='Not significant',
+                                       marker=dict(color='#9e9e9e', size=5, opacity=0.6), text=multi["names"][others]))
+            fig.add_trace(go.Scattergl(x=x[hits], y=y[hits], mode='markers', name=f'Significant ({CORRECTIONS[multi_correction]})',
+                                       marker=dict(color='#4CAF50', size=7), text=multi["names"][hits]))
+            if len(hits):
+                # The largest raw p-value that is still a discovery marks the effective threshold
+                fig.add_hline(y=y[significant].min(), line_dash='dash', line_color='red',
+                              annotation_text='Discovery threshold')
+            fig.update_layout(title='Volcano Plot', xaxis_title='Effect Size (difference in pooled standard deviations)',
+                              yaxis_title='-log10(p-value)', width=700, height=500)
+            st.plotly_chart(fig)
+            if len(others) < int(np.count_nonzero(~significant & ~np.isnan(p_values))):
+                st.caption(f"Showing a random {len(others):,} of the non-significant metrics.")
+
+            st.subheader("Top Discoveries")
+            k = min(20, tested)
+            top = np.argpartition(np.nan_to_num(adjusted, nan=np.inf), k - 1)[:k] if k else np.array([], dtype=int)
+            top = top[np.argsort(adjusted[top])]
+            st.dataframe(pd.DataFrame({
+                "Metric": multi["names"][top],
+                "Difference": tests["difference"][top],
+                "Effect Size": x[top],
+                "P-value": p_values[top],
+                "Adjusted P-value": adjusted[top],
+            }).style.format({"Difference": "{:+.4g}", "Effect Size": "{:+.3f}", "P-value": "{:.2e}", "Adjusted P-value": "{:.2e}"}),
+                hide_index=True)
+
 # Footer
 st.markdown("---")
 st.markdown("Created with ❤️ by AI Educators | © 2024 Hypothesis Testing Explorer")
\ No newline at end of file
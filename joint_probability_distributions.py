@@ -1,8 +1,10 @@
 import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
-import plotly.figure_factory as ff
-from scipy import stats
+from probability.decimation import decimate_figure
+from probability.distributions import bivariate_normal_cov, bivariate_normal_pdf_grid
+from probability.random_variables import dice_sum_difference_joint
+from probability.rng import session_rng
 
 # Set page config
 st.set_page_config(layout="wide", page_title="Joint Probability Distributions Explorer", page_icon="📊")
@@ -107,15 +109,7 @@ with tab1:
         """, unsafe_allow_html=True)
         
         # Create joint probability matrix
-        dice_sums = np.arange(2, 13)
-        dice_diffs = np.arange(0, 6)
-        joint_prob = np.zeros((len(dice_sums), len(dice_diffs)))
-
-        for i in range(1, 7):
-            for j in range(1, 7):
-                sum_idx = i + j - 2
-                diff_idx = abs(i - j)
-                joint_prob[sum_idx, diff_idx] += 1/36
+        dice_sums, dice_diffs, joint_prob = dice_sum_difference_joint()
 
         st.markdown("""
         <p class='small-font'>
@@ -164,13 +158,7 @@ with tab2:
     with col2:
         x = np.linspace(-5, 5, 100)
         y = np.linspace(-5, 5, 100)
-        X, Y = np.meshgrid(x, y)
-        pos = np.dstack((X, Y))
-
-        rv = stats.multivariate_normal([mean_x, mean_y], [[std_x**2, correlation*std_x*std_y], 
-                                                          [correlation*std_x*std_y, std_y**2]])
-        
-        Z = rv.pdf(pos)
+        Z = bivariate_normal_pdf_grid(x, y, mean_x, mean_y, std_x, std_y, correlation)
 
         fig = go.Figure(data=[go.Surface(z=Z, x=x, y=y)])
         fig.update_layout(title='Bivariate Normal Distribution (3D)',
@@ -201,9 +189,8 @@ with tab3:
         correlation = st.slider("Correlation", -1.0, 1.0, 0.0, 0.1, key="sim_correlation")
 
         if st.button("Run Simulation"):
-            cov = [[std_x**2, correlation*std_x*std_y], 
-                   [correlation*std_x*std_y, std_y**2]]
-            samples = np.random.multivariate_normal([mean_x, mean_y], cov, num_samples)
+            cov = bivariate_normal_cov(std_x, std_y, correlation)
+            samples = session_rng().generator("joint_simulation").multivariate_normal([mean_x, mean_y], cov, num_samples)
 
             st.markdown("""
             <p class='small-font'>
@@ -248,9 +235,7 @@ with tab3:
             # Create 3D surface for theoretical distribution
             x = np.linspace(min(samples[:, 0]), max(samples[:, 0]), 50)
             y = np.linspace(min(samples[:, 1]), max(samples[:, 1]), 50)
-            X, Y = np.meshgrid(x, y)
-            pos = np.dstack((X, Y))
-            Z = rv.pdf(pos)
+            Z = bivariate_normal_pdf_grid(x, y, mean_x, mean_y, std_x, std_y, correlation)
 
             trace4 = go.Surface(
                 x=x,
@@ -275,7 +260,8 @@ with tab3:
                 margin=dict(l=0, r=0, b=0, t=30)
             )
 
-            st.plotly_chart(fig)
+            # Thin the scatter cloud before shipping it to the browser
+            st.plotly_chart(decimate_figure(fig, max_points=2000))
 
 with tab4:
     st.markdown("<p class='medium-font'>Test Your Knowledge!</p>", unsafe_allow_html=True)
@@ -1,8 +1,9 @@
 import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
-import random
-import matplotlib.pyplot as plt
+from probability.decimation import decimate_figure
+from probability.lln import stream_running_mean
+from probability.rng import session_rng
 
 # Set page config
 st.set_page_config(layout="wide", page_title="Law of Large Numbers Explorer", page_icon="📊")
@@ -37,11 +38,12 @@ Key points:
 # Tabs with custom styling
 tab1, tab2, tab3, tab4 = st.tabs(["📊 Coin Toss", "🎲 Dice Roll", "📈 Normal Distribution", "🧠 Quiz"])
 
-def plot_convergence(data, expected_value, title):
-    cumulative_means = np.cumsum(data) / np.arange(1, len(data) + 1)
-    
+def plot_trace(x, y, expected_value, title, checkpoints=None, log_x=False):
     fig = go.Figure()
-    fig.add_trace(go.Scatter(y=cumulative_means, mode='lines', name='Sample Mean'))
+    fig.add_trace(go.Scatter(x=x, y=y, mode='lines', name='Sample Mean'))
+    if checkpoints is not None:
+        fig.add_trace(go.Scatter(x=checkpoints[0], y=checkpoints[1], mode='markers', name='Checkpoints',
+                                 marker=dict(size=6, color='orange')))
     fig.add_hline(y=expected_value, line_dash="dash", line_color="red", annotation_text="Expected Value")
     
     fig.update_layout(
@@ -50,7 +52,30 @@ def plot_convergence(data, expected_value, title):
         yaxis_title="Sample Mean",
         showlegend=True
     )
-    return fig
+    if log_x:
+        fig.update_xaxes(type="log")
+    return decimate_figure(fig, max_points=2000)
+
+def plot_convergence(data, expected_value, title):
+    cumulative_means = np.cumsum(data) / np.arange(1, len(data) + 1)
+    return plot_trace(np.arange(1, len(data) + 1), cumulative_means, expected_value, title)
+
+# Streaming mode: trials are generated in chunks and the chart is refreshed after each chunk
+STREAMING_TRIAL_OPTIONS = [10**5, 10**6, 10**7, 10**8, 10**9]
+
+def streaming_trials_input(label, key):
+    return st.select_slider(label, options=STREAMING_TRIAL_OPTIONS, value=10**7, format_func=lambda n: f"{n:,}", key=key)
+
+def run_streaming_simulation(draw_chunk, num_trials, expected_value, title, placeholder):
+    chunk_size = min(10**7, max(10**5, num_trials // 50))
+    progress = st.progress(0.0)
+    snapshot = None
+    for snapshot in stream_running_mean(draw_chunk, num_trials, chunk_size=chunk_size):
+        fig = plot_trace(snapshot["x"], snapshot["y"], expected_value, title,
+                         checkpoints=(snapshot["checkpoint_x"], snapshot["checkpoint_y"]), log_x=True)
+        placeholder.plotly_chart(fig)
+        progress.progress(snapshot["trials"] / num_trials)
+    return snapshot
 
 with tab1:
     st.markdown("<p class='medium-font'>Coin Toss Experiment</p>", unsafe_allow_html=True)
@@ -64,10 +89,15 @@ with tab1:
         </p>
         """, unsafe_allow_html=True)
         
-        num_tosses = st.slider("Number of coin tosses", 100, 10000, 1000, 100)
+        coin_streaming = st.checkbox("Streaming mode (up to a billion tosses)", key="coin_streaming")
+        if coin_streaming:
+            num_tosses = streaming_trials_input("Number of coin tosses", "coin_stream_trials")
+        else:
+            num_tosses = st.slider("Number of coin tosses", 100, 10000, 1000, 100)
         
-        if st.button("Run Coin Toss Simulation"):
-            tosses = np.random.choice([0, 1], size=num_tosses)  # 0 for tails, 1 for heads
+        run_coin = st.button("Run Coin Toss Simulation")
+        if run_coin and not coin_streaming:
+            tosses = session_rng().generator("coin_toss").integers(0, 2, size=num_tosses)  # 0 for tails, 1 for heads
             expected_value = 0.5
             
             st.markdown(f"""
@@ -78,7 +108,17 @@ with tab1:
             """, unsafe_allow_html=True)
 
     with col2:
-        if 'tosses' in locals():
+        if run_coin and coin_streaming:
+            rng = session_rng().generator("coin_toss")
+            result = run_streaming_simulation(lambda n: rng.integers(0, 2, size=n), num_tosses, 0.5,
+                                              "Convergence of Coin Toss Proportion", st.empty())
+            st.markdown(f"""
+            <p class='small-font'>
+            Number of tosses: {num_tosses:,}<br>
+            Final proportion of heads: {result['mean']:.6f}
+            </p>
+            """, unsafe_allow_html=True)
+        elif 'tosses' in locals():
             fig = plot_convergence(tosses, expected_value, "Convergence of Coin Toss Proportion")
             st.plotly_chart(fig)
 
@@ -94,10 +134,15 @@ with tab2:
         </p>
         """, unsafe_allow_html=True)
         
-        num_rolls = st.slider("Number of dice rolls", 100, 10000, 1000, 100)
+        dice_streaming = st.checkbox("Streaming mode (up to a billion rolls)", key="dice_streaming")
+        if dice_streaming:
+            num_rolls = streaming_trials_input("Number of dice rolls", "dice_stream_trials")
+        else:
+            num_rolls = st.slider("Number of dice rolls", 100, 10000, 1000, 100)
         
-        if st.button("Run Dice Roll Simulation"):
-            rolls = np.random.randint(1, 7, size=num_rolls)
+        run_dice = st.button("Run Dice Roll Simulation")
+        if run_dice and not dice_streaming:
+            rolls = session_rng().generator("dice_roll").integers(1, 7, size=num_rolls)
             expected_value = 3.5
             
             st.markdown(f"""
@@ -108,7 +153,18 @@ with tab2:
             """, unsafe_allow_html=True)
 
     with col2:
-        if 'rolls' in locals():
+        if run_dice and dice_streaming:
+            rng = session_rng().generator("dice_roll")
+            result = run_streaming_simulation(lambda n: rng.integers(1, 7, size=n), num_rolls, 3.5,
+                                              "Convergence of Dice Roll Average", st.empty())
+            st.markdown(f"""
+            <p class='small-font'>
+            Number of rolls: {num_rolls:,}<br>
+            Final average roll: {result['mean']:.6f}<br>
+            Standard deviation of rolls: {result['moments'].std(ddof=1):.6f}
+            </p>
+            """, unsafe_allow_html=True)
+        elif 'rolls' in locals():
             fig = plot_convergence(rolls, expected_value, "Convergence of Dice Roll Average")
             st.plotly_chart(fig)
 
@@ -126,10 +182,15 @@ with tab3:
         
         mean = st.number_input("True mean", value=0.0)
         std_dev = st.number_input("Standard deviation", value=1.0, min_value=0.1)
-        sample_size = st.slider("Sample size", 100, 10000, 1000, 100)
+        normal_streaming = st.checkbox("Streaming mode (up to a billion samples)", key="normal_streaming")
+        if normal_streaming:
+            sample_size = streaming_trials_input("Sample size", "normal_stream_trials")
+        else:
+            sample_size = st.slider("Sample size", 100, 10000, 1000, 100)
         
-        if st.button("Run Normal Distribution Simulation"):
-            samples = np.random.normal(mean, std_dev, size=sample_size)
+        run_normal = st.button("Run Normal Distribution Simulation")
+        if run_normal and not normal_streaming:
+            samples = session_rng().generator("normal_sampling").normal(mean, std_dev, size=sample_size)
             expected_value = mean
             
             st.markdown(f"""
@@ -141,7 +202,20 @@ with tab3:
             """, unsafe_allow_html=True)
 
     with col2:
-        if 'samples' in locals():
+        if run_normal and normal_streaming:
+            rng = session_rng().generator("normal_sampling")
+            result = run_streaming_simulation(lambda n: rng.normal(mean, std_dev, size=n), sample_size, mean,
+                                              "Convergence of Sample Mean (Normal Distribution)", st.empty())
+            st.markdown(f"""
+            <p class='small-font'>
+            Sample size: {sample_size:,}<br>
+            True mean: {mean}<br>
+            Final sample mean: {result['mean']:.6f}<br>
+            Sample standard deviation: {result['moments'].std(ddof=1):.6f}<br>
+            Skewness / excess kurtosis: {result['moments'].skewness:.4f} / {result['moments'].kurtosis:.4f}
+            </p>
+            """, unsafe_allow_html=True)
+        elif 'samples' in locals():
             fig = plot_convergence(samples, expected_value, "Convergence of Sample Mean (Normal Distribution)")
             st.plotly_chart(fig)
 
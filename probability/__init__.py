@@ -0,0 +1,48 @@
+"""Headless compute core for the probability Streamlit apps.
+
+Every calculation the pages perform lives here as a plain function with no
+Streamlit dependency, so it can be imported, benchmarked and reused from
+scripts.  Modules:
+
+* ``distributions`` – PMFs, PDFs, CDFs and moments of the common distributions
+* ``binomial`` – cached whole-support binomial tables for n up to 1e7
+* ``estimation`` – standard errors and confidence intervals
+* ``hypothesis`` – z, t, Welch and chi-square tests
+* ``multiple_testing`` – vectorized per-column tests and Bonferroni/Holm/BH corrections
+* ``permutation`` – exact and Monte Carlo permutation tests with early stopping
+* ``power`` – simulated and noncentral-t power of the Welch t-test
+* ``sequential`` – mSPRT always-valid p-values and confidence sequences for streams
+* ``rules`` – conditional probability and Bayes' theorem
+* ``random_variables`` – moments, joint distributions and transformations
+* ``resampling`` / ``populations`` / ``lln`` – simulation engines
+* ``rng`` – per-session, per-simulation ``Generator`` streams
+* ``montecarlo`` – sharded simulations on a process pool
+* ``accumulators`` – mergeable streaming moments and histograms
+* ``cache`` – the byte-budget LRU cache behind the population store and binomial tables
+* ``batch`` – chunked readers and scoring pipelines for uploaded CSV/Parquet files
+* ``decimation`` – figure downsampling (requires plotly)
+* ``graphs`` / ``calculus`` – network metrics and symbolic calculus
+  (require networkx and sympy; not imported here)
+* ``lazy`` – deferred imports for scipy, matplotlib and other heavy libraries
+* ``profiling`` – opt-in per-rerun section timings (requires Streamlit;
+  not imported here)
+"""
+
+from probability.accumulators import Histogram, Moments
+from probability.populations import PopulationStore, get_population, open_population, population_summary
+from probability.resampling import resample_statistics, sample_means
+from probability.rng import RNGService, make_generator, spawn_generators
+
+__all__ = [
+    "Histogram",
+    "Moments",
+    "PopulationStore",
+    "get_population",
+    "open_population",
+    "population_summary",
+    "resample_statistics",
+    "sample_means",
+    "RNGService",
+    "make_generator",
+    "spawn_generators",
+]
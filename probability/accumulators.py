@@ -0,0 +1,239 @@
+"""Mergeable streaming statistics for simulated data.
+
+Simulations feed chunks of draws to an accumulator and drop them, so the
+moments of a run never require the raw draws to fit in memory.  Chunks are
+combined with the pairwise update of Chan et al. (extended to the third and
+fourth central moments by Pébay), which stays accurate where the textbook
+sum / sum-of-squares formula cancels catastrophically.
+
+Accumulators merge with ``+`` (so ``probability.montecarlo.merge_partials``
+combines them like any other partial result), pickle for worker processes
+and round-trip through ``to_dict``/``from_dict`` for JSON.
+"""
+
+import numpy as np
+
+
+class Moments:
+    """Count, mean, variance, skewness, kurtosis, minimum and maximum of a stream."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # sums of powers of deviations from the mean
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    @classmethod
+    def from_values(cls, values):
+        acc = cls()
+        acc.update(values)
+        return acc
+
+    def update(self, values):
+        """Add a chunk of observations."""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if values.size == 0:
+            return self
+        chunk = Moments()
+        chunk.count = values.size
+        chunk.mean = values.mean()
+        deviations = values - chunk.mean
+        squared = deviations * deviations
+        chunk.m2 = squared.sum()
+        chunk.m3 = np.dot(squared, deviations)
+        chunk.m4 = np.dot(squared, squared)
+        chunk.min = values.min()
+        chunk.max = values.max()
+        return self.merge(chunk)
+
+    def merge(self, other):
+        """Fold another accumulator into this one and return it."""
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.__dict__.update(other.__dict__)
+            return self
+        na, nb = self.count, other.count
+        n = na + nb
+        delta = other.mean - self.mean
+        delta_n = delta / n
+        m2 = self.m2 + other.m2 + delta * delta_n * na * nb
+        m3 = (self.m3 + other.m3 + delta * delta_n * delta_n * na * nb * (na - nb)
+              + 3 * delta_n * (na * other.m2 - nb * self.m2))
+        m4 = (self.m4 + other.m4
+              + delta * delta_n ** 3 * na * nb * (na * na - na * nb + nb * nb)
+              + 6 * delta_n * delta_n * (na * na * other.m2 + nb * nb * self.m2)
+              + 4 * delta_n * (na * other.m3 - nb * self.m3))
+        self.mean += delta_n * nb
+        self.count, self.m2, self.m3, self.m4 = n, m2, m3, m4
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def __add__(self, other):
+        return Moments().merge(self).merge(other)
+
+    def variance(self, ddof=0):
+        return self.m2 / (self.count - ddof) if self.count > ddof else np.nan
+
+    def std(self, ddof=0):
+        return np.sqrt(self.variance(ddof))
+
+    @property
+    def skewness(self):
+        return np.sqrt(self.count) * self.m3 / self.m2 ** 1.5 if self.m2 > 0 else np.nan
+
+    @property
+    def kurtosis(self):
+        """Excess kurtosis (0 for a normal distribution)."""
+        return self.count * self.m4 / self.m2 ** 2 - 3 if self.m2 > 0 else np.nan
+
+    def to_dict(self):
+        return {key: float(value) if key != "count" else int(value) for key, value in self.__dict__.items()}
+
+    @classmethod
+    def from_dict(cls, data):
+        acc = cls()
+        acc.__dict__.update(data)
+        return acc
+
+    def __repr__(self):
+        return f"Moments(count={self.count}, mean={self.mean:.6g}, std={self.std():.6g})"
+
+
+class Histogram:
+    """Fixed-bin histogram that counts draws outside ``edges`` as under/overflow."""
+
+    def __init__(self, edges):
+        self.edges = np.asarray(edges, dtype=np.float64)
+        self.counts = np.zeros(len(self.edges) - 1, dtype=np.int64)
+        self.underflow = 0
+        self.overflow = 0
+
+    @classmethod
+    def uniform(cls, low, high, bins):
+        return cls(np.linspace(low, high, bins + 1))
+
+    def update(self, values):
+        """Add a chunk of observations."""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        self.counts += np.histogram(values, bins=self.edges)[0]
+        self.underflow += int(np.count_nonzero(values < self.edges[0]))
+        self.overflow += int(np.count_nonzero(values > self.edges[-1]))
+        return self
+
+    def merge(self, other):
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("histograms with different bin edges cannot be merged")
+        self.counts += other.counts
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        return self
+
+    def __add__(self, other):
+        return Histogram(self.edges).merge(self).merge(other)
+
+    @property
+    def total(self):
+        return int(self.counts.sum()) + self.underflow + self.overflow
+
+    @property
+    def centers(self):
+        return (self.edges[:-1] + self.edges[1:]) / 2
+
+    def sf(self, x):
+        """Fraction of all draws above ``x``, interpolating linearly within bins."""
+        above = np.append(np.cumsum(self.counts[::-1])[::-1], 0) + self.overflow
+        return np.interp(x, self.edges, above, left=self.total, right=self.overflow) / max(self.total, 1)
+
+    def quantile(self, q):
+        """Value below which a fraction ``q`` of the draws fall, clamped to the bin range."""
+        below = np.append(0, np.cumsum(self.counts)) + self.underflow
+        return np.interp(np.asarray(q) * self.total, below, self.edges)
+
+    def to_dict(self):
+        return {
+            "edges": self.edges.tolist(),
+            "counts": self.counts.tolist(),
+            "underflow": self.underflow,
+            "overflow": self.overflow,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        hist = cls(data["edges"])
+        hist.counts = np.asarray(data["counts"], dtype=np.int64)
+        hist.underflow = data["underflow"]
+        hist.overflow = data["overflow"]
+        return hist
+
+
+class ColumnMoments:
+    """Count, mean and variance of every column of a stream of row blocks, skipping NaN.
+
+    The vector form of ``Moments`` (to second order), for screening many
+    metrics at once: a block of shape (rows, columns) is reduced column-wise
+    and merged with the same pairwise update.
+    """
+
+    def __init__(self, columns):
+        self.count = np.zeros(columns, dtype=np.int64)
+        self.mean = np.zeros(columns)
+        self.m2 = np.zeros(columns)
+
+    def update(self, block):
+        """Add a (rows, columns) block of observations; NaN entries are ignored."""
+        block = np.asarray(block, dtype=np.float64)
+        if block.shape[0] == 0:
+            return self
+        chunk = ColumnMoments(block.shape[1])
+        missing = np.isnan(block)
+        # Most blocks are complete, and the NaN-aware path costs two extra passes
+        has_missing = missing.any()
+        chunk.count = block.shape[0] - (np.count_nonzero(missing, axis=0) if has_missing else 0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            sums = np.nansum(block, axis=0) if has_missing else block.sum(axis=0)
+            chunk.mean = np.where(chunk.count > 0, sums / chunk.count, 0.0)
+        deviations = block - chunk.mean
+        if has_missing:
+            deviations[missing] = 0.0
+        chunk.m2 = np.einsum("ij,ij->j", deviations, deviations)
+        return self.merge(chunk)
+
+    def merge(self, other):
+        """Fold another accumulator with the same columns into this one and return it."""
+        n = self.count + other.count
+        delta = other.mean - self.mean
+        with np.errstate(invalid="ignore", divide="ignore"):
+            weight = np.where(n > 0, other.count / n, 0.0)
+        self.m2 = self.m2 + other.m2 + delta * delta * self.count * weight
+        self.mean = self.mean + delta * weight
+        self.count = n
+        return self
+
+    def __add__(self, other):
+        return ColumnMoments(len(self.count)).merge(self).merge(other)
+
+    def variance(self, ddof=0):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.count > ddof, self.m2 / (self.count - ddof), np.nan)
+
+    def std(self, ddof=0):
+        return np.sqrt(self.variance(ddof))
+
+    def to_dict(self):
+        return {"count": self.count.tolist(), "mean": self.mean.tolist(), "m2": self.m2.tolist()}
+
+    @classmethod
+    def from_dict(cls, data):
+        acc = cls(len(data["count"]))
+        acc.count = np.asarray(data["count"], dtype=np.int64)
+        acc.mean = np.asarray(data["mean"], dtype=np.float64)
+        acc.m2 = np.asarray(data["m2"], dtype=np.float64)
+        return acc
+
+    def __repr__(self):
+        return f"ColumnMoments(columns={len(self.count)}, rows={int(self.count.max(initial=0))})"
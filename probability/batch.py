@@ -0,0 +1,357 @@
+"""Chunked processing of large uploaded measurement files.
+
+Uploaded CSV and Parquet files can hold tens of millions of rows, more than
+is comfortable to load into a single DataFrame on a shared server.  The
+readers here yield fixed-size row blocks of only the requested columns;
+each pipeline processes a block, folds it into mergeable accumulators or
+writes it out, and drops it, so memory use depends on ``chunk_rows`` and
+not on the size of the file.
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import weakref
+
+import numpy as np
+
+from probability.accumulators import ColumnMoments, Histogram, Moments
+from probability.distributions import normal_cdf, normal_sf, z_score
+from probability.lazy import lazy_import
+from probability.resampling import block_rows
+
+pd = lazy_import("pandas")
+pa = lazy_import("pyarrow")
+pq = lazy_import("pyarrow.parquet")
+pa_csv = lazy_import("pyarrow.csv")
+
+CHUNK_ROWS = 1_000_000
+
+# Output formats and their file extensions; both are written by Arrow, as
+# pandas' to_csv formats floats about ten times slower
+OUTPUT_FORMATS = {"parquet": ".parquet", "csv": ".csv"}
+
+# Output files of every session live under this directory
+SCRATCH_ROOT = os.path.join(tempfile.gettempdir(), "probability-batch")
+
+# Session directories untouched for this long are deleted by the next session that writes a file
+SCRATCH_TTL_S = 6 * 3600
+
+
+def sweep_scratch(root=SCRATCH_ROOT, ttl=SCRATCH_TTL_S):
+    """Delete the session directories under ``root`` not modified for ``ttl`` seconds."""
+    cutoff = time.time() - ttl
+    try:
+        entries = list(os.scandir(root))
+    except FileNotFoundError:
+        return
+    for entry in entries:
+        try:
+            if entry.is_dir() and entry.stat().st_mtime < cutoff:
+                shutil.rmtree(entry.path, ignore_errors=True)
+        except FileNotFoundError:  # removed by another session meanwhile
+            pass
+
+
+class ScratchDir:
+    """A private directory for one session's output files.
+
+    Keep it in ``st.session_state``: the directory is deleted when the
+    object is garbage collected, which happens when Streamlit drops an
+    ended session's state.  Directories of sessions that never got that far
+    (a killed server) are removed by ``sweep_scratch`` once they are stale.
+    """
+
+    def __init__(self, root=SCRATCH_ROOT, ttl=SCRATCH_TTL_S):
+        self.root = root
+        self.ttl = ttl
+        os.makedirs(root, exist_ok=True)
+        self.path = tempfile.mkdtemp(dir=root)
+        self._finalizer = weakref.finalize(self, shutil.rmtree, self.path, ignore_errors=True)
+
+    def new_file(self, suffix=""):
+        """Path of a new empty file in the directory; also sweeps stale directories of other sessions."""
+        # Recreated if it was swept while this session sat idle
+        os.makedirs(self.path, exist_ok=True)
+        os.utime(self.path)
+        sweep_scratch(self.root, self.ttl)
+        handle, path = tempfile.mkstemp(suffix=suffix, dir=self.path)
+        os.close(handle)
+        return path
+
+    def cleanup(self):
+        """Delete the directory and everything in it now."""
+        self._finalizer()
+
+
+def file_format(name):
+    """``"parquet"`` or ``"csv"``, from the file name's extension."""
+    return "parquet" if name.lower().endswith((".parquet", ".pq")) else "csv"
+
+
+def _read_errors():
+    """Exceptions meaning an upload is empty or not a CSV/Parquet file at all."""
+    return pd.errors.EmptyDataError, pd.errors.ParserError, pa.ArrowInvalid, UnicodeDecodeError
+
+
+def numeric_columns(file, fmt, sample_rows=1000):
+    """Names of the numeric columns, from the Parquet schema or the first rows of a CSV.
+
+    An empty or unreadable file has no columns.
+    """
+    file.seek(0)
+    try:
+        if fmt == "parquet":
+            schema = pq.ParquetFile(file).schema_arrow
+            names = [field.name for field in schema if pa.types.is_integer(field.type) or pa.types.is_floating(field.type)]
+        else:
+            names = list(pd.read_csv(file, nrows=sample_rows).select_dtypes("number").columns)
+    except _read_errors():
+        names = []
+    file.seek(0)
+    return names
+
+
+def _batch_frame(batch, text_columns):
+    """A Parquet record batch as a DataFrame, with ``text_columns`` cast to strings (nulls stay missing)."""
+    table = pa.Table.from_batches([batch])
+    for name in text_columns:
+        index = table.schema.get_field_index(name)
+        table = table.set_column(index, name, table.column(index).cast(pa.string()))
+    return table.to_pandas()
+
+
+def preview(file, fmt, rows=1000, text_columns=()):
+    """The first ``rows`` rows of every column, e.g. to offer column and label choices.
+
+    ``text_columns`` are read as strings, exactly as ``iter_chunks`` reads
+    them.  An empty or unreadable file gives an empty frame.
+    """
+    file.seek(0)
+    try:
+        if fmt == "parquet":
+            batch = next(pq.ParquetFile(file).iter_batches(batch_size=rows), None)
+            frame = _batch_frame(batch, text_columns) if batch is not None else pd.DataFrame()
+        else:
+            frame = pd.read_csv(file, nrows=rows, dtype={name: str for name in text_columns})
+    except _read_errors():
+        frame = pd.DataFrame()
+    file.seek(0)
+    return frame
+
+
+def column_labels(file, fmt, column, rows=1000):
+    """Sorted distinct labels of ``column`` in the first ``rows`` rows, as strings."""
+    return sorted(preview(file, fmt, rows, text_columns=[column])[column].dropna().unique().tolist())
+
+
+def iter_chunks(file, fmt, columns, chunk_rows=CHUNK_ROWS, text_columns=()):
+    """Yield ``(frame, fraction_read)`` for successive blocks of at most ``chunk_rows`` rows.
+
+    Only ``columns`` are read.  ``text_columns`` (labels, group names) are
+    read as strings: otherwise each block infers its own dtype, and a label
+    read as ``1`` in one block and ``"1"`` in the next would not match.
+    ``fraction_read`` is exact for Parquet and approximate (bytes consumed
+    by the parser) for CSV.
+    """
+    file.seek(0)
+    if fmt == "parquet":
+        parquet = pq.ParquetFile(file)
+        total = max(parquet.metadata.num_rows, 1)
+        done = 0
+        for batch in parquet.iter_batches(batch_size=chunk_rows, columns=columns):
+            done += batch.num_rows
+            yield _batch_frame(batch, text_columns), done / total
+    else:
+        size = max(file.seek(0, os.SEEK_END), 1)
+        file.seek(0)
+        dtype = {name: str for name in text_columns}
+        for frame in pd.read_csv(file, usecols=columns, chunksize=chunk_rows, dtype=dtype):
+            yield frame, min(file.tell() / size, 1.0)
+
+
+def numeric_values(frame, column):
+    """``frame[column]`` as float64, with unparseable entries as NaN."""
+    return pd.to_numeric(frame[column], errors="coerce").to_numpy(dtype=np.float64)
+
+
+def normal_scores(values, mean, std, tail=0.05):
+    """z-scores, percentiles and tail flags (-1 low, 0, +1 high) of ``values`` under N(mean, std^2).
+
+    A value is flagged when it lies in the lowest or highest ``tail`` of the
+    distribution.
+    """
+    z = z_score(values, mean, std)
+    percentile = normal_cdf(z)
+    flag = np.zeros(len(z), dtype=np.int8)
+    flag[percentile < tail] = -1
+    flag[percentile > 1 - tail] = 1
+    return z, percentile, flag
+
+
+def table_writer(path, schema, out_format):
+    """An Arrow writer appending tables with ``schema`` to ``path`` as Parquet or CSV."""
+    if out_format == "parquet":
+        return pq.ParquetWriter(path, schema)
+    return pa_csv.CSVWriter(path, schema)
+
+
+def score_normal_file(file, fmt, column, mean, std, out_path, out_format="parquet", tail=0.05,
+                      chunk_rows=CHUNK_ROWS, progress=None, percentile_bins=20):
+    """Score every value of ``column`` against N(mean, std^2) and write them to ``out_path``.
+
+    The output has one row per input row: ``row``, ``value``, ``z_score``,
+    ``percentile`` and ``tail_flag`` (``low``/``high``/empty).  Returns a
+    summary dict with the row counts, the ``Moments`` of the valid values
+    and a ``Histogram`` of their percentiles, which is flat when the
+    measurements follow the assumed distribution.  ``progress(fraction)``
+    is called after every chunk.
+    """
+    summary = {
+        "rows": 0,
+        "invalid": 0,
+        "low": 0,
+        "high": 0,
+        "moments": Moments(),
+        "percentiles": Histogram.uniform(0, 1, percentile_bins),
+    }
+    labels = pa.array(["low", "", "high"])
+    schema = pa.schema([
+        ("row", pa.int64()),
+        ("value", pa.float64()),
+        ("z_score", pa.float64()),
+        ("percentile", pa.float64()),
+        ("tail_flag", pa.dictionary(pa.int8(), pa.string())),
+    ])
+    with table_writer(out_path, schema, out_format) as out:
+        for frame, fraction in iter_chunks(file, fmt, [column], chunk_rows):
+            values = numeric_values(frame, column)
+            z, percentile, flag = normal_scores(values, mean, std, tail)
+            valid = ~np.isnan(values)
+
+            out.write_table(pa.table([
+                np.arange(summary["rows"], summary["rows"] + len(values)),
+                values,
+                z,
+                percentile,
+                pa.DictionaryArray.from_arrays(flag + 1, labels),
+            ], schema=schema))
+
+            summary["rows"] += len(values)
+            summary["invalid"] += int(np.count_nonzero(~valid))
+            summary["low"] += int(np.count_nonzero(flag == -1))
+            summary["high"] += int(np.count_nonzero(flag == 1))
+            summary["moments"].update(values[valid])
+            summary["percentiles"].update(percentile[valid])
+            if progress is not None:
+                progress(fraction)
+    return summary
+
+
+def fit_file(file, fmt, column, edges, chunk_rows=CHUNK_ROWS, progress=None):
+    """``Moments`` and a ``Histogram`` over ``edges`` of every value of ``column``, in one pass.
+
+    The moments give the fitted normal; the histogram keeps the empirical
+    distribution, so tails and quantiles can be compared without a second
+    pass.  Returns a dict with ``rows``, ``invalid``, ``moments`` and ``hist``.
+    """
+    summary = {"rows": 0, "invalid": 0, "moments": Moments(), "hist": Histogram(edges)}
+    for frame, fraction in iter_chunks(file, fmt, [column], chunk_rows):
+        values = numeric_values(frame, column)
+        valid = values[~np.isnan(values)]
+        summary["rows"] += len(values)
+        summary["invalid"] += len(values) - len(valid)
+        summary["moments"].update(valid)
+        summary["hist"].update(valid)
+        if progress is not None:
+            progress(fraction)
+    return summary
+
+
+def aggregate_counts(file, fmt, row_column, col_column, count_column=None, chunk_rows=CHUNK_ROWS, progress=None,
+                     compact_cells=CHUNK_ROWS):
+    """Sum a long-format count file into one count per (row label, column label) cell.
+
+    Each input row is a ``row_column`` label, a ``col_column`` label and a
+    ``count_column`` count (1 per row when ``count_column`` is None).  Every
+    chunk is grouped on its own; the partial sums are regrouped whenever they
+    exceed ``compact_cells`` rows, so memory follows the number of distinct
+    cells, not the number of input rows.  Labels are read as strings, so
+    ``1`` and ``"1"`` are one label.  Rows with a missing label or a
+    missing or negative count are dropped.
+
+    Returns a dict with the cell coordinates ``rows`` and ``cols`` (codes into
+    ``row_labels`` and ``col_labels``), their ``counts``, and the number of
+    input ``lines`` and ``invalid`` rows.
+    """
+    columns = [row_column, col_column] + ([count_column] if count_column is not None else [])
+    keys = ["row", "col"]
+    partials, pending = [], 0
+    lines = invalid = 0
+    for frame, fraction in iter_chunks(file, fmt, columns, chunk_rows, text_columns=[row_column, col_column]):
+        counts = numeric_values(frame, count_column) if count_column is not None else np.ones(len(frame))
+        cells = pd.DataFrame({"row": frame[row_column].to_numpy(), "col": frame[col_column].to_numpy(), "count": counts})
+        valid = cells["row"].notna() & cells["col"].notna() & (cells["count"] >= 0)
+        lines += len(cells)
+        invalid += int(len(cells) - valid.sum())
+        grouped = cells[valid].groupby(keys, sort=False, observed=True)["count"].sum().reset_index()
+        partials.append(grouped)
+        pending += len(grouped)
+        if pending > compact_cells and len(partials) > 1:
+            partials = [pd.concat(partials).groupby(keys, sort=False)["count"].sum().reset_index()]
+            pending = len(partials[0])
+        if progress is not None:
+            progress(fraction)
+
+    cells = pd.concat(partials).groupby(keys, sort=False)["count"].sum() if partials else pd.Series(dtype=np.float64)
+    cells = cells[cells > 0]
+    row_codes, row_labels = pd.factorize(cells.index.get_level_values("row") if len(cells) else np.array([]), sort=True)
+    col_codes, col_labels = pd.factorize(cells.index.get_level_values("col") if len(cells) else np.array([]), sort=True)
+    return {
+        "rows": row_codes,
+        "cols": col_codes,
+        "counts": cells.to_numpy(dtype=np.float64),
+        "row_labels": np.asarray(row_labels),
+        "col_labels": np.asarray(col_labels),
+        "lines": lines,
+        "invalid": invalid,
+    }
+
+
+def group_column_moments(file, fmt, group_column, treatment_label, columns, chunk_rows=None, progress=None):
+    """Per-group ``ColumnMoments`` of ``columns`` in a wide table, in one pass.
+
+    Rows whose ``group_column``, read as a string, equals ``treatment_label``
+    form the treatment group and every other row the control group.  ``chunk_rows`` defaults to
+    blocks of about 64 MB, however many columns there are.  Returns a dict
+    with ``rows``, ``treatment`` and ``control``.
+    """
+    if chunk_rows is None:
+        chunk_rows = block_rows(len(columns))
+    summary = {"rows": 0, "treatment": ColumnMoments(len(columns)), "control": ColumnMoments(len(columns))}
+    for frame, fraction in iter_chunks(file, fmt, [group_column] + list(columns), chunk_rows,
+                                       text_columns=[group_column]):
+        block = frame[list(columns)].to_numpy(dtype=np.float64, na_value=np.nan)
+        is_treatment = frame[group_column].eq(str(treatment_label)).to_numpy(dtype=bool, na_value=False)
+        summary["rows"] += len(frame)
+        summary["treatment"].update(block[is_treatment])
+        summary["control"].update(block[~is_treatment])
+        if progress is not None:
+            progress(fraction)
+    return summary
+
+
+def breach_probabilities(summary, thresholds):
+    """P(X > t) for every threshold under the fitted normal and in the data.
+
+    ``summary`` is the result of ``fit_file``.  Returns a dict of arrays:
+    ``threshold``, ``normal`` and ``empirical``.
+    """
+    thresholds = np.asarray(thresholds, dtype=np.float64)
+    moments = summary["moments"]
+    return {
+        "threshold": thresholds,
+        "normal": normal_sf(thresholds, moments.mean, moments.std(ddof=1)),
+        "empirical": summary["hist"].sf(thresholds),
+    }
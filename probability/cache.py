@@ -0,0 +1,80 @@
+"""Process-wide least-recently-used caches with a byte budget.
+
+Several results the pages need are expensive to build but deterministic
+given their key: synthetic populations, whole-support binomial tables.
+``ByteBudgetCache`` keeps one read-only copy of each per server process,
+shared by all sessions, and evicts the least recently used entries once
+their total size exceeds a byte budget.  Values are built outside the lock,
+so one session building a large entry does not block the others.
+"""
+
+import threading
+from collections import OrderedDict
+
+
+class ByteBudgetCache:
+    """Thread-safe LRU cache of read-only values with a byte budget.
+
+    Values are sized with ``sizeof``, which defaults to their ``nbytes``;
+    subclasses holding other values override it.
+    """
+
+    def __init__(self, byte_budget):
+        self.byte_budget = byte_budget
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def sizeof(value):
+        return value.nbytes
+
+    @property
+    def nbytes(self):
+        with self._lock:
+            return sum(self.sizeof(value) for value in self._entries.values())
+
+    def get_or_build(self, key, build):
+        """The cached value for ``key``, calling ``build()`` to create it on first request."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        value = build()
+
+        with self._lock:
+            # Another session may have built the same key meanwhile
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            self._entries[key] = value
+            self._evict()
+        return value
+
+    def _evict(self):
+        total = sum(self.sizeof(value) for value in self._entries.values())
+        # Always keep the most recent entry, even if it alone exceeds the budget
+        while total > self.byte_budget and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            total -= self.sizeof(evicted)
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": sum(self.sizeof(value) for value in self._entries.values()),
+                "byte_budget": self.byte_budget,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
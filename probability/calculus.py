@@ -0,0 +1,39 @@
+"""Symbolic limits, derivatives and integrals for the calculus page."""
+
+import numpy as np
+import sympy as sp
+
+x = sp.Symbol('x')
+
+
+def parse_function(text):
+    return sp.sympify(text)
+
+
+def sympy_to_function(expr):
+    """Vectorized NumPy callable for an expression in ``x``."""
+    return sp.lambdify(x, expr, "numpy")
+
+
+def limit_at(expr, point):
+    return sp.limit(expr, x, point)
+
+
+def derivative_at(expr, point):
+    """Derivative of ``expr``, its value at ``point`` and the tangent line's intercept."""
+    derivative = sp.diff(expr, x)
+    slope = derivative.subs(x, point)
+    intercept = expr.subs(x, point) - slope * point
+    return derivative, slope, intercept
+
+
+def definite_integral(expr, a, b):
+    return sp.integrate(expr, (x, a, b))
+
+
+def left_riemann_sum(expr, a, b, n_rectangles):
+    """Left Riemann sum of ``expr`` over ``[a, b]`` with ``n_rectangles`` equal widths."""
+    dx = (b - a) / n_rectangles
+    left_edges = np.linspace(a, b, n_rectangles + 1)[:-1]
+    heights = np.broadcast_to(sympy_to_function(expr)(left_edges), left_edges.shape)
+    return float(np.sum(heights) * dx)
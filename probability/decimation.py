@@ -0,0 +1,153 @@
+"""Server-side downsampling of long Plotly line and scatter traces.
+
+Figure JSON size dominates page latency on slow networks, so traces are
+reduced to a per-figure point budget before they are sent to the browser:
+
+* ordered line series use Largest-Triangle-Three-Buckets (``lttb``), which
+  keeps the visual shape of the curve, or min/max bucketing (``minmax``),
+  which keeps every local extreme;
+* unordered scatter clouds (markers only, or 3-D) are thinned uniformly at
+  random so their density is preserved.
+
+Traces that still have many points afterwards are switched from
+``go.Scatter`` to the WebGL ``go.Scattergl``.
+"""
+
+import numpy as np
+import plotly.graph_objects as go
+
+# Total points kept across all decimated traces of one figure
+DEFAULT_POINT_BUDGET = 4000
+
+# Scatter traces with more rendered points than this use WebGL
+DEFAULT_GL_THRESHOLD = 2000
+
+# Per-point properties that must never be sliced even if their length matches
+_UNSLICED_KEYS = {"colorscale"}
+
+
+def lttb(x, y, n_out):
+    """Indices of ``n_out`` points chosen by Largest-Triangle-Three-Buckets."""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if n_out >= n:
+        return np.arange(n)
+    if n_out < 3:
+        raise ValueError("LTTB needs at least 3 output points")
+
+    # First and last points are always kept; the rest is split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    prev = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        # Average of the next bucket (or the last point) is the third triangle vertex
+        if i + 2 < len(edges):
+            next_start, next_stop = edges[i + 1], edges[i + 2]
+            avg_x = x[next_start:next_stop].mean()
+            avg_y = y[next_start:next_stop].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+        area = np.abs((x[prev] - avg_x) * (y[start:stop] - y[prev])
+                      - (x[prev] - x[start:stop]) * (avg_y - y[prev]))
+        prev = start + int(np.argmax(area))
+        selected[i + 1] = prev
+    return selected
+
+
+def minmax(y, n_out):
+    """Indices of the minimum and maximum of ``n_out // 2`` equal-width buckets."""
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n_out >= n:
+        return np.arange(n)
+    edges = np.linspace(0, n, max(n_out // 2, 1) + 1).astype(np.int64)
+    selected = []
+    for start, stop in zip(edges[:-1], edges[1:]):
+        if stop > start:
+            bucket = y[start:stop]
+            selected.extend((start + int(np.argmin(bucket)), start + int(np.argmax(bucket))))
+    return np.unique(selected)
+
+
+def thin(n, n_out, seed=0):
+    """Sorted indices of a uniform random subset of ``n_out`` of ``n`` points."""
+    if n_out >= n:
+        return np.arange(n)
+    rng = np.random.default_rng(seed)
+    return np.sort(rng.choice(n, size=n_out, replace=False))
+
+
+def _slice_props(props, idx, n):
+    sliced = {}
+    for key, value in props.items():
+        if key in _UNSLICED_KEYS:
+            sliced[key] = value
+        elif isinstance(value, dict):
+            sliced[key] = _slice_props(value, idx, n)
+        elif isinstance(value, (list, tuple, np.ndarray)) and len(value) == n:
+            sliced[key] = np.asarray(value)[idx]
+        else:
+            sliced[key] = value
+    return sliced
+
+
+def _trace_length(trace):
+    for axis in ("x", "y"):
+        values = getattr(trace, axis, None)
+        if values is not None:
+            return len(values)
+    return 0
+
+
+def _decimate_trace(trace, n_out, method, gl_threshold):
+    props = trace.to_plotly_json()
+    trace_type = props.pop("type")
+    n = _trace_length(trace)
+    if n > n_out:
+        mode = props.get("mode") or "lines"
+        if trace_type == "scatter3d" or "lines" not in mode:
+            idx = thin(n, n_out)
+        else:
+            x = props.get("x")
+            x = np.arange(n) if x is None else x
+            y = props.get("y")
+            idx = lttb(x, y, n_out) if method == "lttb" else minmax(y, n_out)
+        props = _slice_props(props, idx, n)
+        n = len(idx)
+
+    if trace_type == "scatter" and n > gl_threshold:
+        return go.Scattergl(props, skip_invalid=True)
+    return type(trace)(props)
+
+
+def decimate_figure(fig, max_points=DEFAULT_POINT_BUDGET, method="lttb", gl_threshold=DEFAULT_GL_THRESHOLD):
+    """Return a copy of ``fig`` whose scatter traces fit in ``max_points``.
+
+    The budget is shared between ``scatter``, ``scattergl`` and ``scatter3d``
+    traces in proportion to their length; other trace types are untouched.
+    Call this after the figure is fully built, since the returned figure no
+    longer carries ``make_subplots`` grid information.
+    """
+    lengths = [_trace_length(t) if t.type in ("scatter", "scattergl", "scatter3d") else 0 for t in fig.data]
+    total = sum(lengths)
+    if total == 0:
+        return fig
+
+    traces = []
+    for trace, n in zip(fig.data, lengths):
+        if n == 0:
+            traces.append(trace)
+            continue
+        share = n if total <= max_points else max(3, int(max_points * n / total))
+        traces.append(_decimate_trace(trace, share, method, gl_threshold))
+    return go.Figure(data=traces, layout=fig.layout)
+
+
+def scatter_trace(x, y, max_points=DEFAULT_POINT_BUDGET, method="lttb", gl_threshold=DEFAULT_GL_THRESHOLD, **kwargs):
+    """Build a single decimated ``go.Scatter``/``go.Scattergl`` trace."""
+    trace = go.Scatter(x=x, y=y, **kwargs)
+    return _decimate_trace(trace, max_points, method, gl_threshold)
@@ -0,0 +1,110 @@
+"""Probability mass, density and cumulative functions used across the apps.
+
+Thin, vectorized wrappers over ``scipy.stats`` so every page computes the
+same quantity the same way and the calculations can be imported without
+Streamlit.
+"""
+
+import numpy as np
+
+from probability.lazy import lazy_import
+
+stats = lazy_import("scipy.stats")
+
+
+def bernoulli_pmf(p, x):
+    return p if x == 1 else 1 - p
+
+
+def bernoulli_moments(p):
+    """Mean, variance and standard deviation of Bernoulli(p); ``p`` may be an array."""
+    p = np.asarray(p, dtype=np.float64)
+    variance = p * (1 - p)
+    return p, variance, np.sqrt(variance)
+
+
+def binomial_pmf(k, n, p):
+    return stats.binom.pmf(k, n, p)
+
+
+def binomial_cdf(k, n, p):
+    return stats.binom.cdf(k, n, p)
+
+
+def binomial_sf(k, n, p):
+    """P(X > k) for X ~ Binomial(n, p)."""
+    return stats.binom.sf(k, n, p)
+
+
+def binomial_moments(n, p):
+    """Mean, variance and standard deviation of Binomial(n, p)."""
+    mean = n * p
+    variance = n * p * (1 - p)
+    return mean, variance, np.sqrt(variance)
+
+
+def uniform_pdf(x, a, b):
+    x = np.asarray(x, dtype=np.float64)
+    return np.where((x >= a) & (x <= b), 1 / (b - a), 0.0)
+
+
+def uniform_moments(a, b):
+    """Mean and variance of the continuous Uniform(a, b)."""
+    return (a + b) / 2, (b - a) ** 2 / 12
+
+
+def discrete_uniform_pmf(low, high):
+    """Support ``low..high`` and the equal probability of each value."""
+    values = np.arange(low, high + 1)
+    return values, np.full(len(values), 1 / len(values))
+
+
+def normal_pdf(x, mu=0.0, sigma=1.0):
+    return stats.norm.pdf(x, mu, sigma)
+
+
+def normal_cdf(x, mu=0.0, sigma=1.0):
+    return stats.norm.cdf(x, mu, sigma)
+
+
+def normal_sf(x, mu=0.0, sigma=1.0):
+    """Upper-tail probability P(X > x)."""
+    return stats.norm.sf(x, mu, sigma)
+
+
+def normal_interval_probability(lower, upper, mu=0.0, sigma=1.0):
+    """P(lower <= X <= upper) for X ~ N(mu, sigma^2)."""
+    return normal_cdf(upper, mu, sigma) - normal_cdf(lower, mu, sigma)
+
+
+def normal_two_sided_tail(z):
+    """P(|Z| > |z|) for a standard normal Z."""
+    return 2 * normal_sf(np.abs(z))
+
+
+def z_score(x, mu, sigma):
+    return (np.asarray(x, dtype=np.float64) - mu) / sigma
+
+
+def lognormal_pdf(x, mu, sigma):
+    """Density of exp(Y) where Y ~ N(mu, sigma^2)."""
+    return stats.lognorm.pdf(x, s=sigma, scale=np.exp(mu))
+
+
+def lognormal_moments(mu, sigma):
+    """Mean and variance of exp(Y) where Y ~ N(mu, sigma^2)."""
+    mean = np.exp(mu + sigma ** 2 / 2)
+    variance = (np.exp(sigma ** 2) - 1) * np.exp(2 * mu + sigma ** 2)
+    return mean, variance
+
+
+def bivariate_normal_cov(std_x, std_y, correlation):
+    return np.array([[std_x ** 2, correlation * std_x * std_y],
+                     [correlation * std_x * std_y, std_y ** 2]])
+
+
+def bivariate_normal_pdf_grid(x, y, mean_x, mean_y, std_x, std_y, correlation):
+    """Density of a bivariate normal on the ``meshgrid(x, y)`` grid."""
+    X, Y = np.meshgrid(x, y)
+    rv = stats.multivariate_normal([mean_x, mean_y], bivariate_normal_cov(std_x, std_y, correlation))
+    return rv.pdf(np.dstack((X, Y)))
@@ -0,0 +1,99 @@
+"""Point and interval estimates for a population mean."""
+
+import numpy as np
+
+from probability.lazy import lazy_import
+
+stats = lazy_import("scipy.stats")
+
+
+def standard_error(sample, ddof=1):
+    sample = np.asarray(sample, dtype=np.float64)
+    return np.std(sample, ddof=ddof) / np.sqrt(len(sample))
+
+
+def z_critical(confidence):
+    """Two-sided standard normal critical value for ``confidence`` in (0, 1)."""
+    return stats.norm.ppf((1 + confidence) / 2)
+
+
+def t_critical(confidence, df):
+    """Two-sided Student t critical value for ``confidence`` in (0, 1)."""
+    return stats.t.ppf((1 + confidence) / 2, df)
+
+
+def t_confidence_interval(sample, confidence):
+    """Sample mean and the t-based confidence interval ``(mean, lower, upper)``."""
+    sample = np.asarray(sample, dtype=np.float64)
+    mean = np.mean(sample)
+    margin = t_critical(confidence, len(sample) - 1) * standard_error(sample)
+    return mean, mean - margin, mean + margin
+
+
+def z_confidence_interval(sample, z, ddof=0):
+    """Sample mean and the normal-approximation interval ``mean ± z * s / sqrt(n)``."""
+    sample = np.asarray(sample, dtype=np.float64)
+    mean = np.mean(sample)
+    margin = z * standard_error(sample, ddof=ddof)
+    return mean, mean - margin, mean + margin
+
+
+def proportion_margin_of_error(p, n, z=1.96):
+    return z * np.sqrt(p * (1 - p) / n)
+
+
+def t_intervals(samples, confidence):
+    """Row-wise t intervals for a ``(K, n)`` matrix of samples: ``(means, lower, upper)``."""
+    samples = np.asarray(samples, dtype=np.float64)
+    n = samples.shape[1]
+    means = samples.mean(axis=1)
+    margins = t_critical(confidence, n - 1) * samples.std(axis=1, ddof=1) / np.sqrt(n)
+    return means, means - margins, means + margins
+
+
+def coverage_experiment(rng, num_intervals, sample_size, mean, std, confidence, max_block=4_000_000):
+    """t intervals from ``num_intervals`` independent N(mean, std^2) samples of ``sample_size``.
+
+    Samples are drawn as matrices of at most ``max_block`` values, so memory
+    does not grow with ``num_intervals * sample_size``.  Returns a dict of
+    arrays ``mean``, ``lower``, ``upper`` and ``covered`` (whether each
+    interval contains the true mean).
+    """
+    rows = max(1, max_block // sample_size)
+    means = np.empty(num_intervals)
+    lower = np.empty(num_intervals)
+    upper = np.empty(num_intervals)
+    for start in range(0, num_intervals, rows):
+        stop = min(start + rows, num_intervals)
+        block = rng.normal(mean, std, size=(stop - start, sample_size))
+        means[start:stop], lower[start:stop], upper[start:stop] = t_intervals(block, confidence)
+    return {"mean": means, "lower": lower, "upper": upper, "covered": (lower <= mean) & (mean <= upper)}
+
+
+def bootstrap_intervals(estimate, replicates, confidence, jackknife_values=None):
+    """Percentile, basic and BCa bootstrap intervals as ``{method: (lower, upper)}``.
+
+    ``estimate`` is the statistic on the original sample and ``replicates``
+    its bootstrap distribution.  The BCa interval needs the statistic's
+    ``jackknife_values`` (``probability.resampling.jackknife``) for the
+    acceleration and is left out without them.
+    """
+    replicates = np.asarray(replicates, dtype=np.float64)
+    alpha = (1 - confidence) / 2
+    lower, upper = np.quantile(replicates, [alpha, 1 - alpha])
+    intervals = {
+        "percentile": (lower, upper),
+        "basic": (2 * estimate - upper, 2 * estimate - lower),
+    }
+    if jackknife_values is not None:
+        # Bias correction: how far the estimate sits from the bootstrap median
+        below = (np.count_nonzero(replicates < estimate) + 0.5 * np.count_nonzero(replicates == estimate)) / len(replicates)
+        edge = 0.5 / len(replicates)
+        z0 = stats.norm.ppf(np.clip(below, edge, 1 - edge))
+        deviations = np.mean(jackknife_values) - np.asarray(jackknife_values)
+        spread = 6 * np.sum(deviations ** 2) ** 1.5
+        acceleration = np.sum(deviations ** 3) / spread if spread > 0 else 0.0
+        z = stats.norm.ppf([alpha, 1 - alpha])
+        levels = stats.norm.cdf(z0 + (z0 + z) / (1 - acceleration * (z0 + z)))
+        intervals["bca"] = tuple(np.quantile(replicates, levels))
+    return intervals
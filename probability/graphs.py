@@ -0,0 +1,33 @@
+"""Node- and network-level metrics for the graph theory page."""
+
+import networkx as nx
+import networkx.algorithms.community as nx_comm
+
+
+def node_metrics(G):
+    """Degree and centrality measures keyed by metric name, each a ``{node: value}`` dict."""
+    return {
+        'Degree': dict(G.degree()),
+        'Betweenness Centrality': nx.betweenness_centrality(G),
+        'Closeness Centrality': nx.closeness_centrality(G),
+        'Eigenvector Centrality': nx.eigenvector_centrality(G),
+    }
+
+
+def network_metrics(G):
+    return {
+        'nodes': G.number_of_nodes(),
+        'edges': G.number_of_edges(),
+        'average_clustering': nx.average_clustering(G),
+        'density': nx.density(G),
+        'diameter': nx.diameter(G),
+    }
+
+
+def community_partition(G, seed=None):
+    """Louvain communities as a ``{node: community_index}`` mapping."""
+    partition = {}
+    for i, community in enumerate(nx_comm.louvain_communities(G, seed=seed)):
+        for node in community:
+            partition[node] = i
+    return partition
@@ -0,0 +1,168 @@
+"""Parametric hypothesis tests used by the hypothesis-testing pages."""
+
+import heapq
+
+import numpy as np
+
+from probability.lazy import lazy_import
+
+stats = lazy_import("scipy.stats")
+
+
+def z_test(sample_mean, population_mean, population_std, n):
+    """Two-sided one-sample z-test; returns ``(z, p_value)``."""
+    z = (sample_mean - population_mean) / (population_std / np.sqrt(n))
+    return z, 2 * stats.norm.sf(abs(z))
+
+
+def one_sample_t_test(sample, hypothesized_mean):
+    """Two-sided one-sample t-test; returns ``(t, p_value, df)``."""
+    sample = np.asarray(sample, dtype=np.float64)
+    t_stat, p_value = stats.ttest_1samp(sample, hypothesized_mean)
+    return t_stat, p_value, len(sample) - 1
+
+
+def welch_df(var1, n1, var2, n2):
+    """Welch–Satterthwaite degrees of freedom for two variances and sizes."""
+    a = var1 / n1
+    b = var2 / n2
+    return (a + b) ** 2 / (a ** 2 / (n1 - 1) + b ** 2 / (n2 - 1))
+
+
+def welch_t_test(treatment, control):
+    """Two-sided Welch t-test of ``treatment`` against ``control``; returns ``(t, p_value, df)``."""
+    treatment = np.asarray(treatment, dtype=np.float64)
+    control = np.asarray(control, dtype=np.float64)
+    t_stat, p_value = stats.ttest_ind(treatment, control, equal_var=False)
+    df = welch_df(np.var(treatment, ddof=1), len(treatment), np.var(control, ddof=1), len(control))
+    return t_stat, p_value, df
+
+
+def parse_contingency_table(text):
+    """Parse rows of comma-separated integer counts, one row per line."""
+    return np.array([list(map(int, row.split(','))) for row in text.strip().split('\n')])
+
+
+def chi_square_independence(observed):
+    """Chi-square test of independence; returns ``(chi2, p_value, dof, expected)``."""
+    return stats.chi2_contingency(np.asarray(observed))
+
+
+def sparse_chi_square_independence(rows, cols, counts, shape=None):
+    """Chi-square test of independence for a table given only by its non-zero cells.
+
+    ``rows``, ``cols`` and ``counts`` list the non-zero cells of an
+    ``shape = (r, c)`` table.  Uses sum((O - E)^2 / E) = sum(O^2 / E) - N,
+    where the right-hand sum runs over the non-zero cells only, so the dense
+    table is never built.  Returns ``(chi2, p_value, dof, expected)`` like
+    ``chi_square_independence``, with ``expected`` given for the listed cells.
+    """
+    rows = np.asarray(rows, dtype=np.int64)
+    cols = np.asarray(cols, dtype=np.int64)
+    counts = np.asarray(counts, dtype=np.float64)
+    if shape is None:
+        shape = (rows.max() + 1, cols.max() + 1)
+    row_totals = np.bincount(rows, weights=counts, minlength=shape[0])
+    col_totals = np.bincount(cols, weights=counts, minlength=shape[1])
+    total = counts.sum()
+    expected = row_totals[rows] * col_totals[cols] / total
+    chi2 = max(np.sum(counts * counts / expected) - total, 0.0)
+    # Labels that never occur carry no information
+    dof = (np.count_nonzero(row_totals) - 1) * (np.count_nonzero(col_totals) - 1)
+    return chi2, stats.chi2.sf(chi2, dof) if dof > 0 else 1.0, dof, expected
+
+
+def top_chi_square_cells(rows, cols, counts, k=20, shape=None):
+    """The ``k`` cells contributing most to the chi-square statistic, largest first.
+
+    Non-zero cells are ranked with ``np.argpartition``.  An empty cell
+    contributes its expected count.  When most cells are filled the empty
+    ones are listed directly; otherwise the largest are found by a
+    best-first walk over row and column totals in decreasing order, which
+    stops after ``k`` empty cells, or once no remaining empty cell can beat
+    the k-th largest non-zero contribution.  Returns a dict
+    of arrays ``row``, ``col``, ``observed``, ``expected``, ``residual``
+    (Pearson, (O - E) / sqrt(E)) and ``contribution``.
+    """
+    rows = np.asarray(rows, dtype=np.int64)
+    cols = np.asarray(cols, dtype=np.int64)
+    counts = np.asarray(counts, dtype=np.float64)
+    if shape is None:
+        shape = (rows.max() + 1, cols.max() + 1)
+    row_totals = np.bincount(rows, weights=counts, minlength=shape[0])
+    col_totals = np.bincount(cols, weights=counts, minlength=shape[1])
+    total = counts.sum()
+    expected = row_totals[rows] * col_totals[cols] / total
+    contribution = (counts - expected) ** 2 / expected
+    if len(contribution) > k:
+        keep = np.argpartition(contribution, -k)[-k:]
+    else:
+        keep = np.arange(len(contribution))
+    candidates = [(rows[keep], cols[keep], counts[keep], expected[keep])]
+    # An empty cell must contribute more than this to enter the top k
+    threshold = contribution[keep].min() if len(keep) == k else 0.0
+
+    cells = shape[0] * shape[1]
+    if len(counts) == cells:
+        empty = []
+    elif cells <= 8 * len(counts):
+        # Mostly filled: a mask of the cells is no bigger than the non-zero cells themselves
+        is_empty = np.ones(cells, dtype=bool)
+        is_empty[rows * shape[1] + cols] = False
+        empty_codes = np.flatnonzero(is_empty)
+        empty_rows, empty_cols = np.divmod(empty_codes, shape[1])
+        empty_expected = row_totals[empty_rows] * col_totals[empty_cols] / total
+        if len(empty_codes) > k:
+            best = np.argpartition(empty_expected, -k)[-k:]
+            empty_rows, empty_cols, empty_expected = empty_rows[best], empty_cols[best], empty_expected[best]
+        empty = list(zip(empty_rows, empty_cols, empty_expected))
+    else:
+        empty = _largest_empty_cells(rows, cols, row_totals, col_totals, total, shape, k, threshold)
+    if empty:
+        empty_rows, empty_cols, empty_expected = map(np.array, zip(*empty))
+        candidates.append((empty_rows, empty_cols, np.zeros(len(empty)), empty_expected))
+
+    top_rows, top_cols, top_observed, top_expected = (np.concatenate(parts) for parts in zip(*candidates))
+    residual = (top_observed - top_expected) / np.sqrt(top_expected)
+    order = np.argsort(-residual ** 2)[:k]
+    return {
+        "row": top_rows[order],
+        "col": top_cols[order],
+        "observed": top_observed[order],
+        "expected": top_expected[order],
+        "residual": residual[order],
+        "contribution": residual[order] ** 2,
+    }
+
+
+def _largest_empty_cells(rows, cols, row_totals, col_totals, total, shape, k, threshold):
+    """Up to ``k`` ``(row, col, expected)`` empty cells with the largest expected counts above ``threshold``.
+
+    Best-first search over (row, column) pairs by expected count, skipping
+    observed cells; expected counts only decrease along the walk, so it
+    stops at the first cell at or below ``threshold``.
+    """
+    row_order = np.argsort(-row_totals)
+    col_order = np.argsort(-col_totals)
+    observed_codes = np.sort(rows * shape[1] + cols)
+    heap = [(-row_totals[row_order[0]] * col_totals[col_order[0]], 0, 0)]
+    seen = {(0, 0)}
+    empty = []
+    while heap and len(empty) < k:
+        negative, i, j = heapq.heappop(heap)
+        if -negative / total <= threshold:
+            break
+        row, col = row_order[i], col_order[j]
+        code = row * shape[1] + col
+        position = np.searchsorted(observed_codes, code)
+        if position == len(observed_codes) or observed_codes[position] != code:
+            empty.append((row, col, -negative / total))
+        for ni, nj in ((i + 1, j), (i, j + 1)):
+            if ni < shape[0] and nj < shape[1] and (ni, nj) not in seen:
+                seen.add((ni, nj))
+                heapq.heappush(heap, (-row_totals[row_order[ni]] * col_totals[col_order[nj]], ni, nj))
+    return empty
+
+
+def reject_null(p_value, alpha):
+    return p_value < alpha
@@ -0,0 +1,57 @@
+"""Deferred imports for heavy optional libraries.
+
+``scipy.stats`` alone takes about a second to import and ``matplotlib.pyplot``
+more than half of one, yet many pages only reach them behind a button or in a
+branch the default view never runs.  ``lazy_import`` returns a stand-in module
+that performs the real import on first attribute access::
+
+    stats = lazy_import("scipy.stats")   # nothing imported yet
+    stats.norm.pdf(0)                     # scipy.stats is imported here
+
+``lazy_callable`` does the same for a single function imported with
+``from module import name``.  Time spent on each deferred import is kept in
+``IMPORT_TIMES`` so it can be reported alongside the eager imports.
+"""
+
+import importlib
+import sys
+import time
+import types
+
+IMPORT_TIMES = {}
+
+
+def _import(name):
+    module = sys.modules.get(name)
+    if module is None:
+        start = time.perf_counter()
+        module = importlib.import_module(name)
+        IMPORT_TIMES[name] = time.perf_counter() - start
+    return module
+
+
+class LazyModule(types.ModuleType):
+    """Module stand-in that imports the real module on first attribute access."""
+
+    def __getattr__(self, attr):
+        module = _import(self.__name__)
+        # Later lookups on the stand-in bypass __getattr__ entirely
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+    def __dir__(self):
+        return dir(_import(self.__name__))
+
+
+def lazy_import(name):
+    """The module ``name``, imported on first use unless it is already loaded."""
+    return sys.modules.get(name) or LazyModule(name)
+
+
+def lazy_callable(module_name, attr):
+    """A function that imports ``module_name`` on its first call and forwards to ``attr``."""
+    def call(*args, **kwargs):
+        return getattr(_import(module_name), attr)(*args, **kwargs)
+
+    call.__name__ = call.__qualname__ = attr
+    return call
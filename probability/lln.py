@@ -0,0 +1,80 @@
+"""Streaming Law of Large Numbers simulator.
+
+Trials are generated in fixed-size chunks and only the running sum and a
+``Moments`` accumulator are carried between chunks, so memory use is
+independent of the number of trials.  Instead of the full running-mean
+series the simulator keeps a decimated trace (about ``max_points`` evenly
+spaced points) plus exact running means at log-spaced checkpoints.
+"""
+
+import numpy as np
+
+from probability.accumulators import Moments
+
+DEFAULT_CHUNK_SIZE = 1_000_000
+
+
+def log_checkpoints(num_trials, num_checkpoints=50):
+    """Log-spaced, unique trial counts between 1 and ``num_trials``."""
+    points = np.logspace(0, np.log10(num_trials), num_checkpoints)
+    return np.unique(np.round(points).astype(np.int64))
+
+
+def stream_running_mean(draw_chunk, num_trials, chunk_size=DEFAULT_CHUNK_SIZE, max_points=2000,
+                        num_checkpoints=50):
+    """Simulate ``num_trials`` trials and yield a snapshot after every chunk.
+
+    ``draw_chunk(n)`` must return ``n`` new trial outcomes.  Each snapshot is a
+    dict with the number of ``trials`` so far, the running ``mean``, the
+    decimated trace (``x``, ``y``) and the exact running means at the
+    checkpoints reached so far (``checkpoint_x``, ``checkpoint_y``), plus the
+    ``moments`` of all outcomes so far.
+    """
+    if num_trials < 1:
+        raise ValueError("num_trials must be positive")
+
+    stride = max(1, num_trials // max_points)
+    checkpoints = log_checkpoints(num_trials, num_checkpoints)
+    trace_x, trace_y = [], []
+    check_x, check_y = [], []
+    total = 0.0
+    moments = Moments()
+    done = 0
+
+    while done < num_trials:
+        n = min(chunk_size, num_trials - done)
+        chunk = np.asarray(draw_chunk(n), dtype=np.float64)
+        positions = np.arange(done + 1, done + n + 1)
+        running = (total + np.cumsum(chunk)) / positions
+
+        # Keep every stride-th point, plus the final trial so the trace ends exactly
+        keep = positions % stride == 0
+        if done + n == num_trials:
+            keep[-1] = True
+        trace_x.append(positions[keep])
+        trace_y.append(running[keep])
+
+        hit = checkpoints[(checkpoints > done) & (checkpoints <= done + n)]
+        check_x.append(hit)
+        check_y.append(running[hit - done - 1])
+
+        total += chunk.sum()
+        moments.update(chunk)
+        done += n
+        yield {
+            "trials": done,
+            "mean": total / done,
+            "x": np.concatenate(trace_x),
+            "y": np.concatenate(trace_y),
+            "checkpoint_x": np.concatenate(check_x),
+            "checkpoint_y": np.concatenate(check_y),
+            "moments": moments,
+        }
+
+
+def run_running_mean(draw_chunk, num_trials, **kwargs):
+    """Run a streaming simulation to completion and return the final snapshot."""
+    snapshot = None
+    for snapshot in stream_running_mean(draw_chunk, num_trials, **kwargs):
+        pass
+    return snapshot
@@ -0,0 +1,212 @@
+"""Sharded Monte Carlo runs on a process pool.
+
+A simulation is a *task*: a module-level function ``task(rng, n, **params)``
+that runs ``n`` trials with the ``Generator`` it is given and returns a dict
+of partial results – counts, histogram bin counts, ``Moments`` accumulators.
+``run_simulation`` splits the trials into chunks, gives each chunk its own
+child of one ``SeedSequence`` and adds the partial dicts together as chunks
+finish.  Addition is associative and each chunk's stream depends only on its
+index, so the merged result is the same for any number of workers and can be
+replayed from the seed.
+
+Tasks run in worker processes started with ``spawn`` (forking a threaded
+Streamlit server is unsafe), so they must be importable; the tasks the pages
+use live at the bottom of this module.  A spawned child normally re-runs the
+parent's ``__main__`` file, which under Streamlit is the page script itself;
+workers are started with ``__main__`` hidden so they only import the task's
+module.
+"""
+
+import atexit
+import os
+import sys
+import threading
+import types
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing.context import SpawnContext, SpawnProcess
+
+import numpy as np
+
+from probability.accumulators import Moments
+from probability.resampling import bootstrap_replicates
+from probability.rng import DEFAULT_BIT_GENERATOR, make_generator
+
+DEFAULT_CHUNK_SIZE = 5_000_000
+
+_pools = {}
+
+
+def default_workers():
+    """Worker processes to use: every core the process is allowed to run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # macOS, Windows
+        return os.cpu_count() or 1
+
+
+_main_lock = threading.Lock()
+
+
+class _WorkerProcess(SpawnProcess):
+    """A spawned process that does not re-run the parent's ``__main__``.
+
+    ``multiprocessing`` tells the child to re-import the parent's main
+    module from its ``__spec__`` or ``__file__``.  Streamlit's main module is
+    the running page (or ``app.py``), so every worker would execute the
+    whole page.  While the child is being launched an empty module stands in
+    for ``__main__``.
+    """
+
+    @staticmethod
+    def _Popen(process_obj):
+        with _main_lock:
+            main = sys.modules["__main__"]
+            sys.modules["__main__"] = types.ModuleType("__main__")
+            try:
+                return SpawnProcess._Popen(process_obj)
+            finally:
+                sys.modules["__main__"] = main
+
+
+class _WorkerContext(SpawnContext):
+    Process = _WorkerProcess
+
+
+def get_pool(max_workers=None):
+    """A process pool shared by every session, created on first use.
+
+    Workers are spawned lazily by the executor, possibly from a later
+    ``submit``, so the context rather than this function hides ``__main__``.
+    """
+    max_workers = max_workers or default_workers()
+    if max_workers not in _pools:
+        _pools[max_workers] = ProcessPoolExecutor(max_workers, mp_context=_WorkerContext())
+    return _pools[max_workers]
+
+
+@atexit.register
+def shutdown_pools():
+    for pool in _pools.values():
+        pool.shutdown(wait=False, cancel_futures=True)
+    _pools.clear()
+
+
+def merge_partials(left, right):
+    """Add two partial-result dicts key by key; either may be ``None``."""
+    if left is None:
+        return dict(right)
+    if right is None:
+        return dict(left)
+    merged = dict(left)
+    for key, value in right.items():
+        merged[key] = merged[key] + value if key in merged else value
+    return merged
+
+
+def _run_chunk(task, seed, n, bit_generator, params):
+    return n, task(make_generator(seed, bit_generator), n, **params)
+
+
+def run_simulation(task, num_trials, seed=None, chunk_size=DEFAULT_CHUNK_SIZE, max_workers=None,
+                   progress=None, bit_generator=DEFAULT_BIT_GENERATOR, stop=None, **params):
+    """Run ``num_trials`` trials of ``task`` and return the merged partial results.
+
+    ``seed`` is anything ``np.random.SeedSequence`` accepts, or a
+    ``SeedSequence`` such as ``RNGService.seed_sequence(name)``.
+    ``progress(done, total)`` is called from the calling thread after each
+    chunk.  With ``max_workers=1`` the chunks run in-process, giving the
+    same result without starting a pool.
+
+    ``stop(result)`` is checked after each merge; once it returns True the
+    remaining chunks are cancelled and the partial result is returned.  On
+    the pool, chunks can finish out of order, so where a run stops is only
+    reproducible in-process.
+    """
+    if num_trials < 1:
+        raise ValueError("num_trials must be positive")
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+
+    sizes = [chunk_size] * (num_trials // chunk_size)
+    if num_trials % chunk_size:
+        sizes.append(num_trials % chunk_size)
+    chunks = list(zip(seed.spawn(len(sizes)), sizes))
+
+    result = None
+    done = 0
+    if (max_workers or default_workers()) == 1 or len(chunks) == 1:
+        for child, n in chunks:
+            result = merge_partials(result, _run_chunk(task, child, n, bit_generator, params)[1])
+            done += n
+            if progress is not None:
+                progress(done, num_trials)
+            if stop is not None and stop(result):
+                break
+        return result
+
+    pool = get_pool(max_workers)
+    pending = {pool.submit(_run_chunk, task, child, n, bit_generator, params) for child, n in chunks}
+    try:
+        while pending:
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                n, partial = future.result()
+                result = merge_partials(result, partial)
+                done += n
+            if progress is not None:
+                progress(done, num_trials)
+            if stop is not None and stop(result):
+                break
+    finally:
+        for future in pending:
+            future.cancel()
+    return result
+
+
+# Tasks -----------------------------------------------------------------------
+
+def poll_task(rng, n, sample_size, p):
+    """``n`` polls of ``sample_size`` voters; counts of each possible number of supporters."""
+    supporters = rng.binomial(sample_size, p, size=n)
+    return {
+        "moments": Moments.from_values(supporters / sample_size),
+        "hist": np.bincount(supporters, minlength=sample_size + 1),
+    }
+
+
+def dice_task(rng, n, sides=6):
+    """``n`` rolls of a fair die; how often each face ``1..sides`` came up."""
+    rolls = rng.integers(0, sides, size=n, dtype=np.int8 if sides <= 127 else np.int64)
+    return {"counts": np.bincount(rolls, minlength=sides)}
+
+
+def lottery_task(rng, n, total_tickets, ticket, bins=50):
+    """``n`` draws of a winning ticket from ``1..total_tickets``; wins for ``ticket`` and a binned histogram.
+
+    Bin ``i`` counts tickets ``t`` with ``(t - 1) * bins // total_tickets == i``, the
+    same bins as ``np.linspace(1, total_tickets + 1, bins + 1)``.
+    """
+    bins = min(bins, total_tickets)
+    winners = rng.integers(1, total_tickets, size=n, endpoint=True)
+    return {
+        "count": n,
+        "wins": np.count_nonzero(winners == ticket),
+        "hist": np.bincount((winners - 1) * bins // total_tickets, minlength=bins),
+    }
+
+
+def bootstrap_task(rng, n, sample, reducers=("mean",)):
+    """``n`` bootstrap resamples of ``sample``; each statistic's replicates in a one-element list.
+
+    Lists concatenate under ``+``, so merged results hold every chunk's
+    replicates.  ``reducers`` must be names from ``resampling.REDUCERS``:
+    callables do not pickle into spawned workers.
+    """
+    replicates = bootstrap_replicates(sample, n, reducers, rng=rng)
+    return {name: [values] for name, values in replicates.items()}
+
+
+def worker_info_task(rng, n):
+    """Diagnostic task: the ``__mp_main__`` file of the process running it and whether Streamlit is loaded."""
+    main = sys.modules.get("__mp_main__")
+    return {"main_files": [getattr(main, "__file__", None)], "streamlit": int("streamlit" in sys.modules)}
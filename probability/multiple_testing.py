@@ -0,0 +1,108 @@
+"""Screening thousands of metrics at once.
+
+Each metric is a column of a wide table, and each unit (row) is in the
+treatment or the control group.  A two-sample test per metric only needs
+each group's count, mean and variance per column, so rows are streamed in
+blocks into two ``ColumnMoments`` accumulators and every test runs
+vectorized over all columns at the end.  Testing thousands of hypotheses
+at alpha each would give dozens of false discoveries, so the p-values are
+then adjusted:
+
+* ``bonferroni`` – controls the family-wise error rate; simple but strict;
+* ``holm`` – step-down Bonferroni; same guarantee, never less powerful;
+* ``bh`` – Benjamini-Hochberg; controls the false discovery rate, the
+  expected share of false positives among the discoveries.
+"""
+
+import numpy as np
+
+from probability.accumulators import ColumnMoments
+from probability.hypothesis import welch_df
+from probability.lazy import lazy_import
+from probability.resampling import block_rows
+
+stats = lazy_import("scipy.stats")
+
+CORRECTIONS = {
+    "none": "No correction",
+    "bonferroni": "Bonferroni",
+    "holm": "Holm",
+    "bh": "Benjamini-Hochberg",
+}
+
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+
+
+def column_tests(treatment, control, test="t"):
+    """Two-sided two-sample test of every column; ``treatment``/``control`` are ``ColumnMoments``.
+
+    ``test="t"`` is Welch's t-test, ``test="z"`` the large-sample z-test
+    with the same standard error.  Returns a dict of arrays: ``difference``
+    (treatment minus control), ``effect`` (difference in pooled standard
+    deviations), ``statistic`` and ``p_value``.  Columns where either group
+    has fewer than two values get NaN.
+    """
+    var_t, var_c = treatment.variance(ddof=1), control.variance(ddof=1)
+    n_t, n_c = treatment.count, control.count
+    difference = treatment.mean - control.mean
+    with np.errstate(invalid="ignore", divide="ignore"):
+        statistic = difference / np.sqrt(var_t / n_t + var_c / n_c)
+        pooled = np.sqrt(((n_t - 1) * var_t + (n_c - 1) * var_c) / (n_t + n_c - 2))
+        if test == "z":
+            p_value = 2 * stats.norm.sf(np.abs(statistic))
+        else:
+            p_value = 2 * stats.t.sf(np.abs(statistic), welch_df(var_t, n_t, var_c, n_c))
+    return {"difference": difference, "effect": difference / pooled, "statistic": statistic, "p_value": p_value}
+
+
+def adjust_p_values(p_values, method="bh"):
+    """Adjusted p-values for one of ``CORRECTIONS``; reject where adjusted p < alpha.
+
+    NaN p-values (untestable columns) stay NaN and do not count as tests.
+    """
+    p_values = np.asarray(p_values, dtype=np.float64)
+    adjusted = np.full_like(p_values, np.nan)
+    valid = np.flatnonzero(~np.isnan(p_values))
+    m = len(valid)
+    if m == 0 or method == "none":
+        adjusted[valid] = p_values[valid]
+        return adjusted
+    if method == "bonferroni":
+        adjusted[valid] = np.minimum(p_values[valid] * m, 1.0)
+        return adjusted
+
+    order = valid[np.argsort(p_values[valid], kind="stable")]
+    ranked = p_values[order]
+    rank = np.arange(1, m + 1)
+    if method == "holm":
+        # p_(i) * (m - i + 1), made monotone from the smallest p-value up
+        stepped = np.maximum.accumulate(ranked * (m - rank + 1))
+    elif method == "bh":
+        # p_(i) * m / i, made monotone from the largest p-value down
+        stepped = np.minimum.accumulate((ranked * m / rank)[::-1])[::-1]
+    else:
+        raise ValueError(f"unknown correction {method!r}; expected one of {list(CORRECTIONS)}")
+    adjusted[order] = np.minimum(stepped, 1.0)
+    return adjusted
+
+
+def screen_task(rng, n, shifts, treatment_share=0.5, memory_budget=DEFAULT_MEMORY_BUDGET):
+    """Simulate ``n`` units measured on ``len(shifts)`` standard-normal metrics.
+
+    Treatment units have every metric shifted by ``shifts`` (0 for unaffected
+    metrics).  Rows are generated in blocks of at most ``memory_budget``
+    bytes and folded straight into the accumulators, so the table is never
+    held in memory.  Returns ``{"treatment": ColumnMoments, "control": ColumnMoments}``,
+    which merges across ``probability.montecarlo`` chunks.
+    """
+    shifts = np.asarray(shifts, dtype=np.float64)
+    treatment, control = ColumnMoments(len(shifts)), ColumnMoments(len(shifts))
+    rows = block_rows(len(shifts), memory_budget=memory_budget)
+    for start in range(0, n, rows):
+        size = min(rows, n - start)
+        n_treatment = rng.binomial(size, treatment_share)
+        block = rng.standard_normal((n_treatment, len(shifts)))
+        block += shifts
+        treatment.update(block)
+        control.update(rng.standard_normal((size - n_treatment, len(shifts))))
+    return {"treatment": treatment, "control": control}
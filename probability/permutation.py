@@ -0,0 +1,221 @@
+"""Distribution-free permutation tests.
+
+Three tests share one engine:
+
+* ``sign_flip_test`` – one sample, H0: symmetric about ``mu0``; the
+  statistic is the mean deviation and each permutation flips signs;
+* ``two_sample_permutation_test`` – H0: both groups come from one
+  distribution; the statistic is the difference in means and each
+  permutation relabels the pooled data;
+* ``contingency_permutation_test`` – H0: independence; the statistic is
+  Pearson's chi-square (no continuity correction) and each permutation
+  shuffles the column labels of the expanded table, keeping both margins.
+
+Permutations are generated as matrices that fit a fixed memory budget
+and reduced row-wise.  Small problems are enumerated exactly; otherwise
+permutations run as ``probability.montecarlo`` tasks in batches, which can
+be sharded over the process pool, and the run stops early once a
+Clopper-Pearson interval for the p-value lies entirely on one side of
+``alpha``.
+"""
+
+import itertools
+import math
+
+import numpy as np
+
+from probability.lazy import lazy_import
+from probability.montecarlo import run_simulation
+from probability.resampling import block_rows
+
+stats = lazy_import("scipy.stats")
+
+DEFAULT_MEMORY_BUDGET = 8 * 1024 * 1024
+
+# Problems with at most this many distinct permutations are enumerated exactly
+MAX_EXACT = 1 << 20
+
+DEFAULT_BATCH = 1000
+
+
+def _at_least(values, observed):
+    """Permutation statistics at least as extreme as ``observed``, with a relative tolerance for float ties."""
+    return int(np.count_nonzero(values >= observed - 1e-9 * max(1.0, abs(observed))))
+
+
+def p_value_interval(hits, count, confidence=0.99):
+    """Clopper-Pearson interval for the p-value estimated from ``hits`` of ``count`` permutations."""
+    tail = (1 - confidence) / 2
+    lower = stats.beta.ppf(tail, hits, count - hits + 1) if hits > 0 else 0.0
+    upper = stats.beta.ppf(1 - tail, hits + 1, count - hits) if hits < count else 1.0
+    return lower, upper
+
+
+# Statistics of one block of permutations -------------------------------------
+
+def _sign_flip_stats(bits, deviations, total):
+    # A row of bits picks the deviations that keep their sign: mean = (2 * kept - total) / n
+    return np.abs(2 * (bits @ deviations) - total) / len(deviations)
+
+
+def _two_sample_stats(first_sums, total, n_first, n_second):
+    return np.abs(first_sums / n_first - (total - first_sums) / n_second)
+
+
+def _chi_square_stats(tables, expected):
+    return (((tables - expected) ** 2) / expected).sum(axis=(-2, -1))
+
+
+def _expand_table(table):
+    """Row and column label of every unit counted in ``table``."""
+    rows, cols = np.indices(table.shape)
+    counts = table.ravel()
+    return np.repeat(rows.ravel(), counts), np.repeat(cols.ravel(), counts)
+
+
+def _expected_counts(table):
+    return np.outer(table.sum(axis=1), table.sum(axis=0)) / table.sum()
+
+
+def _label_tables(row_labels, col_blocks, shape):
+    """Contingency tables of ``row_labels`` against every row of ``col_blocks``."""
+    rows, cells = len(col_blocks), shape[0] * shape[1]
+    codes = row_labels * shape[1] + col_blocks + np.arange(rows)[:, np.newaxis] * cells
+    return np.bincount(codes.ravel(), minlength=rows * cells).reshape(rows, *shape)
+
+
+def _combination_blocks(n, k, rows=65536):
+    """Every ``k``-subset of ``range(n)``, as index arrays of at most ``rows`` rows."""
+    combinations = itertools.combinations(range(n), k)
+    while True:
+        block = np.array(list(itertools.islice(combinations, rows)), dtype=np.int64)
+        if not len(block):
+            return
+        yield block
+
+
+# Monte Carlo tasks -------------------------------------------------------------
+
+def sign_flip_task(rng, n, deviations, observed):
+    """``n`` random sign flips of ``deviations``; how many give a mean at least as extreme."""
+    total = deviations.sum()
+    rows = block_rows(len(deviations), memory_budget=DEFAULT_MEMORY_BUDGET)
+    hits = 0
+    for start in range(0, n, rows):
+        size = min(rows, n - start)
+        packed = rng.integers(0, 256, size=(size, (len(deviations) + 7) // 8), dtype=np.uint8)
+        bits = np.unpackbits(packed, axis=1, count=len(deviations)).astype(np.float64)
+        hits += _at_least(_sign_flip_stats(bits, deviations, total), observed)
+    return {"hits": hits, "count": n}
+
+
+def two_sample_task(rng, n, pooled, n_first, observed):
+    """``n`` random relabelings of ``pooled``; how many give a mean difference at least as extreme."""
+    total = pooled.sum()
+    rows = block_rows(len(pooled), memory_budget=DEFAULT_MEMORY_BUDGET)
+    hits = 0
+    for start in range(0, n, rows):
+        block = np.tile(pooled, (min(rows, n - start), 1))
+        rng.permuted(block, axis=1, out=block)
+        sums = block[:, :n_first].sum(axis=1)
+        hits += _at_least(_two_sample_stats(sums, total, n_first, len(pooled) - n_first), observed)
+    return {"hits": hits, "count": n}
+
+
+def contingency_task(rng, n, table, observed):
+    """``n`` random shuffles of the column labels of ``table``; how many give a chi-square at least as large."""
+    row_labels, col_labels = _expand_table(table)
+    expected = _expected_counts(table)
+    rows = block_rows(len(col_labels), memory_budget=DEFAULT_MEMORY_BUDGET)
+    hits = 0
+    for start in range(0, n, rows):
+        block = np.tile(col_labels, (min(rows, n - start), 1))
+        rng.permuted(block, axis=1, out=block)
+        hits += _at_least(_chi_square_stats(_label_tables(row_labels, block, table.shape), expected), observed)
+    return {"hits": hits, "count": n}
+
+
+# Tests -----------------------------------------------------------------------------
+
+def _monte_carlo(task, observed, max_permutations, alpha, seed, batch_size, early_stop, confidence,
+                 max_workers, progress, **params):
+    def clears_alpha(result):
+        lower, upper = p_value_interval(result["hits"], result["count"], confidence)
+        return upper < alpha or lower > alpha
+
+    result = run_simulation(task, max_permutations, seed=seed, chunk_size=batch_size, max_workers=max_workers,
+                            progress=progress, stop=clears_alpha if early_stop else None, observed=observed, **params)
+    hits, count = result["hits"], result["count"]
+    return {
+        "statistic": observed,
+        # Counting the observed arrangement keeps the estimate a valid p-value
+        "p_value": (hits + 1) / (count + 1),
+        "hits": hits,
+        "permutations": count,
+        "exact": False,
+        "stopped_early": count < max_permutations,
+        "interval": p_value_interval(hits, count, confidence),
+    }
+
+
+def _exact(observed, permutation_stats):
+    hits = count = 0
+    for values in permutation_stats:
+        hits += _at_least(values, observed)
+        count += len(values)
+    return {
+        "statistic": observed,
+        "p_value": hits / count,
+        "hits": hits,
+        "permutations": count,
+        "exact": True,
+        "stopped_early": False,
+        "interval": (hits / count, hits / count),
+    }
+
+
+def sign_flip_test(sample, mu0=0.0, max_permutations=10_000, alpha=0.05, seed=None, batch_size=DEFAULT_BATCH,
+                   early_stop=True, confidence=0.99, max_workers=1, progress=None):
+    """Two-sided sign-flip test of H0: ``sample`` is symmetric about ``mu0``.
+
+    Returns a dict with the observed ``statistic`` (absolute mean deviation),
+    ``p_value``, the number of ``permutations`` used, whether the result is
+    ``exact`` or ``stopped_early``, and the p-value's Clopper-Pearson ``interval``.
+    """
+    deviations = np.asarray(sample, dtype=np.float64) - mu0
+    n = len(deviations)
+    observed = abs(deviations.mean())
+    if 2 ** n <= min(MAX_EXACT, max_permutations):
+        total = deviations.sum()
+        codes = np.arange(2 ** n)
+        blocks = (((codes[start:start + 65536, np.newaxis] >> np.arange(n)) & 1).astype(np.float64)
+                  for start in range(0, len(codes), 65536))
+        return _exact(observed, (_sign_flip_stats(bits, deviations, total) for bits in blocks))
+    return _monte_carlo(sign_flip_task, observed, max_permutations, alpha, seed, batch_size, early_stop, confidence,
+                        max_workers, progress, deviations=deviations)
+
+
+def two_sample_permutation_test(first, second, max_permutations=10_000, alpha=0.05, seed=None,
+                                batch_size=DEFAULT_BATCH, early_stop=True, confidence=0.99, max_workers=1,
+                                progress=None):
+    """Two-sided permutation test of a difference in means between ``first`` and ``second``."""
+    first = np.asarray(first, dtype=np.float64)
+    second = np.asarray(second, dtype=np.float64)
+    pooled = np.concatenate([first, second])
+    n_first, n_second = len(first), len(second)
+    observed = abs(first.mean() - second.mean())
+    if math.comb(len(pooled), n_first) <= min(MAX_EXACT, max_permutations):
+        total = pooled.sum()
+        return _exact(observed, (_two_sample_stats(pooled[idx].sum(axis=1), total, n_first, n_second)
+                                 for idx in _combination_blocks(len(pooled), n_first)))
+    return _monte_carlo(two_sample_task, observed, max_permutations, alpha, seed, batch_size, early_stop,
+                        confidence, max_workers, progress, pooled=pooled, n_first=n_first)
+
+
+def contingency_permutation_test(table, max_permutations=10_000, alpha=0.05, seed=None, batch_size=DEFAULT_BATCH,
+                                 early_stop=True, confidence=0.99, max_workers=1, progress=None):
+    """Permutation test of independence for a table of counts (Monte Carlo only)."""
+    table = np.asarray(table, dtype=np.int64)
+    observed = _chi_square_stats(table, _expected_counts(table))
+    return _monte_carlo(contingency_task, observed, max_permutations, alpha, seed, batch_size, early_stop,
+                        confidence, max_workers, progress, table=table)
@@ -0,0 +1,176 @@
+"""Process-wide cache of seeded synthetic populations.
+
+Streamlit re-runs a page for every widget change and every session, but the
+synthetic populations the pages sample from are deterministic given their
+distribution, parameters, size and seed.  ``PopulationStore`` keeps one
+read-only copy of each population per server process, shared by all
+sessions, in a ``ByteBudgetCache``.
+
+Populations too large for RAM can instead be materialized once to a ``.npy``
+file with ``open_population`` and read back through ``np.memmap``.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+
+import numpy as np
+
+from probability.cache import ByteBudgetCache
+
+# Total bytes of population data kept alive by the default store
+DEFAULT_BYTE_BUDGET = 256 * 1024 * 1024
+
+
+def _normal(rng, size, loc=0.0, scale=1.0):
+    return rng.normal(loc=loc, scale=scale, size=size)
+
+
+def _uniform(rng, size, low=0.0, high=1.0):
+    return rng.uniform(low=low, high=high, size=size)
+
+
+def _exponential(rng, size, scale=1.0):
+    return rng.exponential(scale=scale, size=size)
+
+
+def _normal_mixture(rng, size, components=((-1.0, 0.4, 0.5), (1.0, 0.4, 0.5))):
+    # components are (loc, scale, weight); parts are concatenated, not shuffled
+    parts = [rng.normal(loc=loc, scale=scale, size=int(size * weight)) for loc, scale, weight in components]
+    return np.concatenate(parts)
+
+
+GENERATORS = {
+    "normal": _normal,
+    "uniform": _uniform,
+    "exponential": _exponential,
+    "normal_mixture": _normal_mixture,
+}
+
+# Elements generated per write when materializing a population to disk
+DEFAULT_CHUNK_SIZE = 10_000_000
+
+# Where on-disk populations live unless a directory is passed explicitly
+POPULATION_DIR = os.environ.get(
+    "PROBABILITY_POPULATION_DIR", os.path.join(tempfile.gettempdir(), "probability_populations")
+)
+
+
+def _generate(distribution, size, seed, params):
+    population = GENERATORS[distribution](np.random.default_rng(seed), size, **params)
+    population.setflags(write=False)
+    return population
+
+
+class PopulationStore(ByteBudgetCache):
+    """Thread-safe LRU cache of read-only population arrays with a byte budget."""
+
+    def __init__(self, byte_budget=DEFAULT_BYTE_BUDGET):
+        super().__init__(byte_budget)
+
+    @staticmethod
+    def make_key(distribution, params, size, seed):
+        return (distribution, tuple(sorted(params.items())), int(size), seed)
+
+    def get(self, distribution, size, seed=0, **params):
+        """Return the cached population, generating it on first request."""
+        if distribution not in GENERATORS:
+            raise ValueError(f"Unknown distribution '{distribution}'. Choose from {sorted(GENERATORS)}.")
+        key = self.make_key(distribution, params, size, seed)
+        return self.get_or_build(key, lambda: _generate(distribution, size, seed, params))
+
+
+# Module-level store shared by every session in the server process
+default_store = PopulationStore()
+
+
+def get_population(distribution, size, seed=0, **params):
+    """Fetch a seeded population from the shared ``default_store``."""
+    return default_store.get(distribution, size, seed=seed, **params)
+
+
+def _segments(distribution, size, params):
+    # Split a population into (count, generator, params) runs so it can be written chunk by chunk
+    if distribution == "normal_mixture":
+        components = params.get("components", ((-1.0, 0.4, 0.5), (1.0, 0.4, 0.5)))
+        return [(int(size * weight), _normal, {"loc": loc, "scale": scale})
+                for loc, scale, weight in components]
+    return [(int(size), GENERATORS[distribution], params)]
+
+
+def population_path(distribution, size, seed=0, directory=None, **params):
+    """Deterministic ``.npy`` path for a population key."""
+    key = PopulationStore.make_key(distribution, params, size, seed)
+    digest = hashlib.sha1(repr(key).encode()).hexdigest()[:16]
+    return os.path.join(directory or POPULATION_DIR, f"{distribution}_{int(size)}_{digest}.npy")
+
+
+def materialize_population(path, distribution, size, seed=0, chunk_size=DEFAULT_CHUNK_SIZE, **params):
+    """Generate a population chunk by chunk straight into a ``.npy`` file.
+
+    Memory use is bounded by ``chunk_size`` regardless of ``size``.  The file
+    is written under a temporary name and renamed, so concurrent workers never
+    see a partial population.
+    """
+    if distribution not in GENERATORS:
+        raise ValueError(f"Unknown distribution '{distribution}'. Choose from {sorted(GENERATORS)}.")
+    segments = _segments(distribution, size, params)
+    total = sum(count for count, _, _ in segments)
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    out = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=np.float64, shape=(total,))
+    rng = np.random.default_rng(seed)
+    pos = 0
+    for count, generator, kwargs in segments:
+        for start in range(0, count, chunk_size):
+            n = min(chunk_size, count - start)
+            out[pos:pos + n] = generator(rng, n, **kwargs)
+            pos += n
+    out.flush()
+    del out
+    os.replace(tmp_path, path)
+    return path
+
+
+def open_population(distribution, size, seed=0, directory=None, chunk_size=DEFAULT_CHUNK_SIZE, **params):
+    """Open an on-disk population read-only, materializing it on first use."""
+    path = population_path(distribution, size, seed, directory, **params)
+    if not os.path.exists(path):
+        materialize_population(path, distribution, size, seed, chunk_size, **params)
+    return np.load(path, mmap_mode="r")
+
+
+def population_summary(population, bins=50, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Mean, std, min, max and a histogram computed in chunks.
+
+    Suitable for memory-mapped populations that cannot be passed to
+    ``np.mean`` or ``go.Histogram`` whole.  Returns a dict with ``counts`` and
+    ``edges`` for plotting as bars.
+    """
+    n = len(population)
+    shift = float(population[0])
+    total = total_sq = 0.0
+    low, high = np.inf, -np.inf
+    for start in range(0, n, chunk_size):
+        chunk = np.asarray(population[start:start + chunk_size], dtype=np.float64) - shift
+        total += chunk.sum()
+        total_sq += np.dot(chunk, chunk)
+        low = min(low, chunk.min())
+        high = max(high, chunk.max())
+
+    counts = np.zeros(bins, dtype=np.int64)
+    edges = np.linspace(low + shift, high + shift, bins + 1)
+    for start in range(0, n, chunk_size):
+        counts += np.histogram(population[start:start + chunk_size], bins=edges)[0]
+
+    mean = total / n
+    return {
+        "mean": mean + shift,
+        "std": float(np.sqrt(max(total_sq / n - mean * mean, 0.0))),
+        "min": low + shift,
+        "max": high + shift,
+        "counts": counts,
+        "edges": edges,
+    }
@@ -0,0 +1,128 @@
+"""Opt-in per-rerun latency instrumentation for the Streamlit pages.
+
+Streamlit re-executes a page top to bottom on every widget change.  A page
+gets one ``RerunProfiler`` per run and wraps its expensive blocks in named
+sections::
+
+    profiler = page_profiler("7_central_limit_theorem")
+    with profiler.section("data generation"):
+        population = ...
+    profiler.report()
+
+The ``app.py`` launcher runs every page inside ``RerunProfiler.running``, so
+each page gets a whole-rerun record.  Under the launcher ``page_profiler``
+returns the launcher's profiler: the page's sections join its record and
+the page's own ``report`` call is a no-op, so there is one record per rerun.
+Run on its own, a page gets a fresh profiler and reports itself.
+
+Profiling is off unless the ``PROBABILITY_PROFILE`` environment variable is
+set to ``1`` or the page is opened with ``?profile=1``; when off, sections are
+no-ops.  When on, ``report`` shows a collapsible timing table in the sidebar
+and appends one JSON record per rerun to ``PROFILE_LOG``.
+
+Unlike the rest of the package this module requires Streamlit.
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from datetime import datetime, timezone
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+PROFILE_ENV = "PROBABILITY_PROFILE"
+PROFILE_LOG = os.environ.get("PROBABILITY_PROFILE_LOG", os.path.join("logs", "rerun_timings.jsonl"))
+
+# The launcher's profiler while it runs a page; each script run has its own thread and so its own value
+_running = ContextVar("running_profiler", default=None)
+
+
+def profiling_enabled():
+    """Whether profiling was requested through the environment or the URL."""
+    if os.environ.get(PROFILE_ENV) == "1":
+        return True
+    try:
+        return st.query_params.get("profile") == "1"
+    except Exception:  # outside a running Streamlit session
+        return False
+
+
+class RerunProfiler:
+    """Times named sections of one script run and reports them when it ends."""
+
+    def __init__(self, page, enabled=None, log_path=PROFILE_LOG):
+        self.page = page
+        self.enabled = profiling_enabled() if enabled is None else enabled
+        self.log_path = log_path
+        self.sections = []
+        self._start = time.perf_counter()
+
+    def section(self, name):
+        """Context manager timing the enclosed block under ``name``."""
+        if not self.enabled:
+            return nullcontext()
+        return self._timed(name)
+
+    @contextmanager
+    def running(self):
+        """Make this the profiler ``page_profiler`` returns while the enclosed block runs."""
+        token = _running.set(self)
+        try:
+            yield self
+        finally:
+            _running.reset(token)
+
+    @contextmanager
+    def _timed(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.sections.append({"name": name, "seconds": time.perf_counter() - start})
+
+    def record(self):
+        """The structured record for this rerun."""
+        ctx = get_script_run_ctx()
+        return {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "page": self.page,
+            "session_id": ctx.session_id if ctx is not None else None,
+            "total_seconds": time.perf_counter() - self._start,
+            "sections": self.sections,
+        }
+
+    def report(self):
+        """Show the timing table in the sidebar and append the record to the log.
+
+        Does nothing inside ``running``; whoever started it reports once the page is done.
+        """
+        if not self.enabled or _running.get() is self:
+            return None
+        record = self.record()
+        # Repeated section names (e.g. one per tab) are summed in the table but kept apart in the log
+        totals = {}
+        for entry in self.sections:
+            totals[entry["name"]] = totals.get(entry["name"], 0.0) + entry["seconds"]
+        untracked = record["total_seconds"] - sum(totals.values())
+
+        with st.sidebar.expander(f"⏱️ Rerun timing: {record['total_seconds'] * 1e3:.0f} ms"):
+            rows = [{"Section": name, "ms": seconds * 1e3} for name, seconds in totals.items()]
+            rows.append({"Section": "(untracked)", "ms": untracked * 1e3})
+            st.dataframe(rows, hide_index=True)
+
+        if self.log_path:
+            directory = os.path.dirname(self.log_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.log_path, "a") as fh:
+                fh.write(json.dumps(record) + "\n")
+        return record
+
+
+def page_profiler(page):
+    """The launcher's profiler when the page runs under ``app.py``, else a new ``RerunProfiler`` for ``page``."""
+    profiler = _running.get()
+    return profiler if profiler is not None else RerunProfiler(page)
@@ -0,0 +1,32 @@
+"""Moments of discrete random variables and joint distributions."""
+
+import numpy as np
+
+
+def discrete_moments(values, probabilities):
+    """Expected value, variance and standard deviation of a discrete distribution."""
+    values = np.asarray(values, dtype=np.float64)
+    probabilities = np.asarray(probabilities, dtype=np.float64)
+    expected_value = np.sum(values * probabilities)
+    variance = np.sum((values - expected_value) ** 2 * probabilities)
+    return expected_value, variance, np.sqrt(variance)
+
+
+def dice_sum_difference_joint():
+    """Joint PMF of the sum (rows, 2..12) and absolute difference (columns, 0..5) of two dice."""
+    dice_sums = np.arange(2, 13)
+    dice_diffs = np.arange(0, 6)
+    first, second = np.meshgrid(np.arange(1, 7), np.arange(1, 7))
+    joint_prob = np.zeros((len(dice_sums), len(dice_diffs)))
+    np.add.at(joint_prob, (first + second - 2, np.abs(first - second)), 1 / 36)
+    return dice_sums, dice_diffs, joint_prob
+
+
+def linear_transform_normal(mu, sigma, a, b):
+    """Mean and standard deviation of aX + b for X ~ N(mu, sigma^2)."""
+    return a * mu + b, abs(a) * sigma
+
+
+def square_of_normal_moments(mu, sigma):
+    """Mean and variance of X^2 for X ~ N(mu, sigma^2)."""
+    return mu ** 2 + sigma ** 2, 2 * sigma ** 2 * (2 * mu ** 2 + sigma ** 2)
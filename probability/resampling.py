@@ -0,0 +1,123 @@
+"""Vectorized resampling engine used by the sampling-distribution and CLT apps.
+
+All bootstrap indices for a batch of samples are drawn as one
+``(num_samples, sample_size)`` block and reduced along ``axis=1``.  When that
+block would exceed the memory budget it is processed in row chunks instead.
+
+Memory-mapped populations are gathered with sorted indices so page faults
+walk the file sequentially instead of jumping around at random.
+"""
+
+import numpy as np
+
+from probability.rng import as_generator
+
+# Bytes allowed for one block of indices plus gathered values
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+
+REDUCERS = {
+    "mean": lambda block: np.mean(block, axis=1),
+    "var": lambda block: np.var(block, axis=1),
+    "std": lambda block: np.std(block, axis=1),
+    "median": lambda block: np.median(block, axis=1),
+    "min": lambda block: np.min(block, axis=1),
+    "max": lambda block: np.max(block, axis=1),
+    "sum": lambda block: np.sum(block, axis=1),
+    "iqr": lambda block: np.subtract(*np.percentile(block, [75, 25], axis=1)),
+}
+
+
+def _resolve_reducer(func):
+    if isinstance(func, str):
+        if func not in REDUCERS:
+            raise ValueError(f"Unknown reducer '{func}'. Choose from {sorted(REDUCERS)} or pass a callable.")
+        func = REDUCERS[func]
+    return func
+
+
+def _resolve_reducers(reducers):
+    if isinstance(reducers, str):
+        reducers = (reducers,)
+    if isinstance(reducers, dict):
+        items = reducers.items()
+    else:
+        items = ((name, name) for name in reducers)
+    return {name: _resolve_reducer(func) for name, func in items}
+
+
+def block_rows(width, max_rows=None, itemsize=8, memory_budget=DEFAULT_MEMORY_BUDGET):
+    """Rows of ``width`` elements of ``itemsize`` bytes that fit in one block of ``memory_budget`` bytes.
+
+    At least one row, and at most ``max_rows`` when given.
+    """
+    rows = max(1, memory_budget // max(1, width * itemsize))
+    return rows if max_rows is None else int(max(1, min(max_rows, rows)))
+
+
+def _gather(population, idx):
+    if not isinstance(population, np.memmap):
+        return population[idx]
+    # Read in file order, then scatter back so every row keeps its own draws
+    flat = idx.ravel()
+    order = np.argsort(flat, kind="stable")
+    values = np.empty(flat.shape, dtype=population.dtype)
+    values[order] = population[flat[order]]
+    return values.reshape(idx.shape)
+
+
+def resample_statistics(population, sample_size, num_samples, reducers=("mean",),
+                        memory_budget=DEFAULT_MEMORY_BUDGET, rng=None):
+    """Draw ``num_samples`` samples with replacement and reduce each in one pass.
+
+    ``reducers`` is a name, a sequence of names from ``REDUCERS``, or a dict
+    mapping output names to either a reducer name or a callable that takes a
+    ``(rows, sample_size)`` block and returns one value per row.  Returns a
+    dict of 1-D arrays of length ``num_samples``.  ``rng`` is a ``Generator``
+    or a seed; by default fresh OS entropy is used.
+    """
+    if sample_size < 1 or num_samples < 1:
+        raise ValueError("sample_size and num_samples must be positive")
+
+    if not isinstance(population, np.memmap):
+        population = np.asarray(population)
+    rng = as_generator(rng)
+    funcs = _resolve_reducers(reducers)
+    # Each element needs one index plus one gathered value
+    rows = block_rows(sample_size, num_samples, np.dtype(np.intp).itemsize + population.dtype.itemsize, memory_budget)
+
+    results = {name: None for name in funcs}
+    for start in range(0, num_samples, rows):
+        stop = min(start + rows, num_samples)
+        idx = rng.integers(0, len(population), size=(stop - start, sample_size))
+        block = _gather(population, idx)
+        for name, func in funcs.items():
+            values = np.asarray(func(block))
+            if results[name] is None:
+                results[name] = np.empty(num_samples, dtype=values.dtype)
+            results[name][start:stop] = values
+    return results
+
+
+def sample_means(population, sample_size, num_samples, memory_budget=DEFAULT_MEMORY_BUDGET, rng=None):
+    """Means of ``num_samples`` resamples of size ``sample_size``."""
+    return resample_statistics(population, sample_size, num_samples, ("mean",), memory_budget, rng)["mean"]
+
+
+def bootstrap_replicates(sample, num_resamples, reducers=("mean",), memory_budget=DEFAULT_MEMORY_BUDGET, rng=None):
+    """Statistics of ``num_resamples`` bootstrap resamples (same size as ``sample``, with replacement)."""
+    return resample_statistics(sample, len(sample), num_resamples, reducers, memory_budget, rng)
+
+
+def jackknife(sample, reducer="mean", max_groups=1000):
+    """Leave-one-out values of a statistic, as used for the BCa acceleration.
+
+    Samples larger than ``max_groups`` are split into ``max_groups``
+    contiguous groups that are left out in turn (the delete-d jackknife), so
+    the cost stays at ``max_groups`` evaluations for any sample size.
+    """
+    sample = np.asarray(sample)
+    func = _resolve_reducer(reducer)
+    bounds = np.linspace(0, len(sample), min(len(sample), max_groups) + 1).astype(np.int64)
+    values = [func(np.concatenate([sample[:start], sample[stop:]])[np.newaxis, :])[0]
+              for start, stop in zip(bounds[:-1], bounds[1:])]
+    return np.asarray(values, dtype=np.float64)
@@ -0,0 +1,109 @@
+"""Reproducible, independent random streams for the simulations.
+
+The pages used the process-global ``np.random`` state, so concurrent sessions
+in one server reseeded each other and no run could be replayed.  Here every
+session owns an ``RNGService`` rooted at one ``SeedSequence``; each named
+simulation draws from its own child stream, and streams can be split further
+with ``spawn`` to hand to threads or worker processes.  Recording the
+service's ``entropy`` is enough to replay every draw of the session::
+
+    service = RNGService()                 # or RNGService(entropy=recorded)
+    rng = service.generator("clt")         # 1st run of the "clt" simulation
+    workers = service.spawn("bootstrap", 8)
+
+Streams are keyed by simulation name and run number rather than by creation
+order, so adding a simulation to a page does not change the draws of the
+others.
+"""
+
+import zlib
+
+import numpy as np
+
+BIT_GENERATORS = {
+    "PCG64": np.random.PCG64,
+    "Philox": np.random.Philox,
+}
+DEFAULT_BIT_GENERATOR = "PCG64"
+
+
+def make_generator(seed=None, bit_generator=DEFAULT_BIT_GENERATOR):
+    """A ``Generator`` from an int, a ``SeedSequence`` or fresh OS entropy."""
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return np.random.Generator(BIT_GENERATORS[bit_generator](seed))
+
+
+def as_generator(rng=None):
+    """Coerce ``None``, a seed or an existing ``Generator`` to a ``Generator``."""
+    if isinstance(rng, np.random.Generator):
+        return rng
+    return make_generator(rng)
+
+
+def spawn_generators(seed, n, bit_generator=DEFAULT_BIT_GENERATOR):
+    """``n`` statistically independent generators derived from one seed."""
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return [make_generator(child, bit_generator) for child in seed.spawn(n)]
+
+
+def _name_key(name):
+    # Stable across processes and Python versions, unlike hash()
+    return zlib.crc32(name.encode("utf-8"))
+
+
+class RNGService:
+    """Hands out named, replayable random streams from one root entropy value."""
+
+    def __init__(self, entropy=None, bit_generator=DEFAULT_BIT_GENERATOR):
+        self.entropy = np.random.SeedSequence(entropy).entropy
+        self.bit_generator = bit_generator
+        self.runs = {}
+
+    def seed_sequence(self, name, run=None):
+        """The ``SeedSequence`` of run ``run`` of simulation ``name``.
+
+        Without ``run`` the next run number for ``name`` is used, so each
+        call yields a fresh stream; passing a recorded run number replays it.
+        """
+        if run is None:
+            run = self.runs.get(name, 0)
+            self.runs[name] = run + 1
+        return np.random.SeedSequence(self.entropy, spawn_key=(_name_key(name), run))
+
+    def generator(self, name, run=None):
+        """A ``Generator`` for one run of simulation ``name``."""
+        return make_generator(self.seed_sequence(name, run), self.bit_generator)
+
+    def spawn(self, name, n, run=None):
+        """``n`` independent generators for one run of ``name``, e.g. one per worker."""
+        return spawn_generators(self.seed_sequence(name, run), n, self.bit_generator)
+
+    def replay_info(self, name):
+        """Entropy and most recent run number, enough to recreate the last stream of ``name``."""
+        return {"entropy": self.entropy, "name": name, "run": self.runs.get(name, 0) - 1}
+
+
+def session_rng(key="rng_service"):
+    """The current Streamlit session's ``RNGService``, created on first use.
+
+    Opening a page with ``?seed=<entropy>`` replays a recorded session; a
+    seed that is not a non-negative integer is ignored with a warning.
+    Requires Streamlit; the rest of this module does not.
+    """
+    import streamlit as st
+
+    if key not in st.session_state:
+        seed = st.query_params.get("seed")
+        if seed is not None:
+            try:
+                seed = int(seed)
+                if seed < 0:
+                    raise ValueError(seed)
+            except ValueError:
+                st.warning(f"Ignoring invalid seed {st.query_params.get('seed')!r}; "
+                           "it must be a non-negative integer. Using a fresh random seed.")
+                seed = None
+        st.session_state[key] = RNGService(seed)
+    return st.session_state[key]
@@ -0,0 +1,20 @@
+"""Elementary probability rules: conditional probability and Bayes' theorem."""
+
+
+def conditional_probability(p_a_and_b, p_b):
+    """P(A | B) = P(A and B) / P(B), defined as 0 when P(B) is 0."""
+    return p_a_and_b / p_b if p_b != 0 else 0
+
+
+def total_probability(p_b_given_a, p_a, p_b_given_not_a):
+    """P(B) = P(B | A) P(A) + P(B | not A) P(not A)."""
+    return p_b_given_a * p_a + p_b_given_not_a * (1 - p_a)
+
+
+def bayes_posterior(likelihood, prior, evidence):
+    """P(A | B) = P(B | A) P(A) / P(B)."""
+    return likelihood * prior / evidence
+
+
+def classical_probability(favorable, total):
+    return favorable / total
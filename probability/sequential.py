@@ -0,0 +1,147 @@
+"""Sequential A/B tests with always-valid p-values.
+
+A fixed-horizon test is only valid if it is run once, at the planned sample
+size; re-running it after every batch ("peeking") inflates the false
+positive rate far above alpha.  The mixture sequential probability ratio
+test (mSPRT, Johari et al. 2017) can be checked after every batch instead.
+For a difference in means with estimate ``d`` and variance ``V``, mixing
+the likelihood ratio over effects drawn from N(0, tau^2) gives
+
+    Lambda = sqrt(V / (V + tau^2)) * exp(tau^2 d^2 / (2 V (V + tau^2)))
+
+and ``p_n = min(p_{n-1}, 1 / Lambda_n)`` is an always-valid p-value: the
+chance that it ever drops below alpha under H0 is at most alpha.  Inverting
+the test gives a confidence sequence, intervals that cover the true
+difference at every batch simultaneously.
+
+Each arm's count, mean and variance live in a ``Moments`` accumulator, so a
+batch costs one pass over its own values and an O(1) merge; nothing is ever
+recomputed over the observations seen so far.
+"""
+
+import numpy as np
+
+from probability.accumulators import Moments
+from probability.hypothesis import welch_df
+from probability.lazy import lazy_import
+
+stats = lazy_import("scipy.stats")
+
+
+def msprt_statistic(difference, variance, tau):
+    """Log of the normal-mixture likelihood ratio ``Lambda`` for H0: no difference."""
+    tau2 = tau * tau
+    return 0.5 * np.log(variance / (variance + tau2)) + tau2 * difference ** 2 / (2 * variance * (variance + tau2))
+
+
+def confidence_sequence_radius(variance, tau, alpha):
+    """Half-width of the ``1 - alpha`` confidence sequence around the estimated difference."""
+    tau2 = tau * tau
+    return np.sqrt(variance * (variance + tau2) / tau2 * (2 * np.log(1 / alpha) + np.log((variance + tau2) / variance)))
+
+
+class SequentialTest:
+    """mSPRT for the difference in means (treatment minus control) of two streams.
+
+    ``tau`` is the scale of effects the test is tuned to detect, in the units
+    of the observations; it affects power, never validity.
+    """
+
+    def __init__(self, alpha=0.05, tau=1.0):
+        self.alpha = alpha
+        self.tau = tau
+        self.treatment = Moments()
+        self.control = Moments()
+        self.p_value = 1.0
+        self.lower = -np.inf
+        self.upper = np.inf
+        self.batches = 0
+
+    @property
+    def count(self):
+        return self.treatment.count + self.control.count
+
+    @property
+    def difference(self):
+        return self.treatment.mean - self.control.mean
+
+    @property
+    def variance(self):
+        """Estimated variance of ``difference`` (NaN until both arms have two observations)."""
+        if min(self.treatment.count, self.control.count) < 2:
+            return np.nan
+        return self.treatment.variance(ddof=1) / self.treatment.count + self.control.variance(ddof=1) / self.control.count
+
+    @property
+    def rejected(self):
+        return self.p_value <= self.alpha
+
+    def fixed_horizon_p_value(self):
+        """Welch t-test p-value from the current moments, valid only if this were the last look."""
+        variance = self.variance
+        if not variance > 0:
+            return 1.0
+        df = welch_df(self.treatment.variance(ddof=1), self.treatment.count,
+                      self.control.variance(ddof=1), self.control.count)
+        return 2 * stats.t.sf(abs(self.difference) / np.sqrt(variance), df)
+
+    def update(self, treatment=(), control=()):
+        """Add a batch of observations to each arm and return the current state as a dict."""
+        self.treatment.update(treatment)
+        self.control.update(control)
+        self.batches += 1
+        variance = self.variance
+        if variance > 0:
+            log_ratio = msprt_statistic(self.difference, variance, self.tau)
+            self.p_value = min(self.p_value, float(np.exp(min(-log_ratio, 0.0))))
+            radius = confidence_sequence_radius(variance, self.tau, self.alpha)
+            # Intersecting with earlier intervals keeps the sequence valid and nested
+            self.lower = max(self.lower, self.difference - radius)
+            self.upper = min(self.upper, self.difference + radius)
+        return self.snapshot()
+
+    def snapshot(self):
+        return {
+            "events": self.count,
+            "batches": self.batches,
+            "difference": self.difference,
+            "p_value": self.p_value,
+            "fixed_p_value": self.fixed_horizon_p_value(),
+            "lower": self.lower,
+            "upper": self.upper,
+            "rejected": self.rejected,
+        }
+
+
+def stream_sequential_test(batches, alpha=0.05, tau=1.0, stop_on_reject=True):
+    """Feed ``(treatment, control)`` batches to a ``SequentialTest`` and yield a snapshot after each.
+
+    Stops after the first batch that rejects H0 when ``stop_on_reject`` is set.
+    """
+    test = SequentialTest(alpha, tau)
+    for treatment, control in batches:
+        snapshot = test.update(treatment, control)
+        yield snapshot
+        if stop_on_reject and snapshot["rejected"]:
+            return
+
+
+def simulated_batches(rng, num_events, batch_size, control_mean, control_std, treatment_mean, treatment_std,
+                      treatment_share=0.5):
+    """Yield ``(treatment, control)`` batches of normal observations; each event joins treatment with ``treatment_share``."""
+    done = 0
+    while done < num_events:
+        n = min(batch_size, num_events - done)
+        n_treatment = rng.binomial(n, treatment_share)
+        yield (rng.normal(treatment_mean, treatment_std, n_treatment),
+               rng.normal(control_mean, control_std, n - n_treatment))
+        done += n
+
+
+def split_groups(groups, values, treatment_label):
+    """Split one batch of a long-format log into ``(treatment, control)`` value arrays, dropping NaN values."""
+    groups = np.asarray(groups)
+    values = np.asarray(values, dtype=np.float64)
+    valid = ~np.isnan(values)
+    is_treatment = groups == treatment_label
+    return values[valid & is_treatment], values[valid & ~is_treatment]
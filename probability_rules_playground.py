@@ -2,7 +2,9 @@ import streamlit as st
 import plotly.graph_objects as go
 import random
 import pandas as pd
-import matplotlib.pyplot as plt
+from probability.lazy import lazy_import
+
+plt = lazy_import("matplotlib.pyplot")
 
 # Set page config
 st.set_page_config(layout="wide", page_title="Probability Rules Playground", page_icon="🎲")
@@ -1,7 +1,7 @@
 import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+from probability.rng import session_rng
 
 # Set page configuration
 st.set_page_config(layout="wide", page_title="Number Representation Explorer", page_icon="🔢")
@@ -125,7 +125,7 @@ with tabs[2]:
     
     with col2:
         # Generate random vectors
-        vectors = np.random.randn(10, dimension)
+        vectors = session_rng().generator("vectors").standard_normal((10, dimension))
         
         # Perform dimensionality reduction for visualization
         if dimension > 3:
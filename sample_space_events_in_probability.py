@@ -1,10 +1,11 @@
 import streamlit as st
 import plotly.graph_objects as go
-import random
 import pandas as pd
 from PIL import Image
 import io
 import base64
+from probability.rules import classical_probability
+from probability.rng import session_rng
 
 # Set page config
 st.set_page_config(layout="wide", page_title="Probability Playground", page_icon="🎲")
@@ -125,7 +126,7 @@ with tab1:
 
     with col2:
         if st.button("Roll Dice 🎲"):
-            result = random.randint(1, 6)
+            result = int(session_rng().generator("dice_roll").integers(1, 7))
             dice_animation = create_dice_animation(result)
             st.image(dice_animation, use_column_width=True)
             st.markdown(f"<p class='big-font'>You rolled: {result}</p>", unsafe_allow_html=True)
@@ -157,8 +158,9 @@ with tab2:
         ranks = ['A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K']
         
         if st.button("Draw Card 🃏"):
-            card_suit = random.choice(suits)
-            card_rank = random.choice(ranks)
+            rng = session_rng().generator("card_draw")
+            card_suit = rng.choice(suits)
+            card_rank = rng.choice(ranks)
             st.markdown(f"<p class='big-font' style='font-size: 72px !important;'>{card_rank}{card_suit}</p>", unsafe_allow_html=True)
             
             events = []
@@ -184,7 +186,7 @@ with tab3:
 
     with col2:
         if st.button("Calculate Probability"):
-            probability = favorable / total
+            probability = classical_probability(favorable, total)
             st.markdown(f"<p class='big-font'>Probability: {probability:.4f}</p>", unsafe_allow_html=True)
             st.markdown(f"<p class='small-font'>Or approximately 1 in {round(1/probability)}</p>", unsafe_allow_html=True)
 
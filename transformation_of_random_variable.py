@@ -1,7 +1,11 @@
 import streamlit as st
 import plotly.graph_objects as go
 import numpy as np
-from scipy import stats
+from probability.distributions import lognormal_moments, lognormal_pdf, normal_pdf
+from probability.random_variables import linear_transform_normal, square_of_normal_moments
+from probability.lazy import lazy_import
+
+stats = lazy_import("scipy.stats")
 
 st.set_page_config(layout="wide", page_title="Transformations of Random Variables", page_icon="🔄")
 
@@ -46,14 +50,13 @@ with tab1:
         a = st.slider("Coefficient (a):", -5.0, 5.0, 1.0, 0.1, key='linear_a')
         b = st.slider("Constant (b):", -5.0, 5.0, 0.0, 0.1, key='linear_b')
         
-        new_mu = a * mu + b
-        new_sigma = abs(a) * sigma
+        new_mu, new_sigma = linear_transform_normal(mu, sigma, a, b)
         st.write(f"New Distribution: Y ~ N({new_mu:.2f}, {new_sigma**2:.2f})")
     
     with col2:
         x = np.linspace(mu - 4*sigma, mu + 4*sigma, 1000)
-        y_original = stats.norm.pdf(x, mu, sigma)
-        y_transformed = stats.norm.pdf((x - b) / a, mu, sigma) / abs(a)
+        y_original = normal_pdf(x, mu, sigma)
+        y_transformed = normal_pdf((x - b) / a, mu, sigma) / abs(a)
         fig = plot_transformation(x, y_original, y_transformed, "Linear Transformation")
         st.plotly_chart(fig, use_container_width=True)
 
@@ -64,14 +67,13 @@ with tab2:
         mu = st.slider("Mean (μ) of X:", -5.0, 5.0, 0.0, 0.1, key='quad_mu')
         sigma = st.slider("Std Dev (σ) of X:", 0.1, 5.0, 1.0, 0.1, key='quad_sigma')
         
-        new_mu = mu**2 + sigma**2
-        new_var = 2*sigma**2 * (2*mu**2 + sigma**2)
+        new_mu, new_var = square_of_normal_moments(mu, sigma)
         st.write(f"E[Y] = {new_mu:.2f}")
         st.write(f"Var(Y) = {new_var:.2f}")
     
     with col2:
         x = np.linspace(mu - 4*sigma, mu + 4*sigma, 1000)
-        y_original = stats.norm.pdf(x, mu, sigma)
+        y_original = normal_pdf(x, mu, sigma)
         y_transformed = stats.chi2.pdf(x**2, df=1)
         fig = plot_transformation(x, y_original, y_transformed, "Quadratic Transformation")
         st.plotly_chart(fig, use_container_width=True)
@@ -83,15 +85,14 @@ with tab3:
         mu = st.slider("Mean (μ) of X:", -2.0, 2.0, 0.0, 0.1, key='exp_mu')
         sigma = st.slider("Std Dev (σ) of X:", 0.1, 2.0, 1.0, 0.1, key='exp_sigma')
         
-        new_mu = np.exp(mu + sigma**2/2)
-        new_var = (np.exp(sigma**2) - 1) * np.exp(2*mu + sigma**2)
+        new_mu, new_var = lognormal_moments(mu, sigma)
         st.write(f"E[Y] = {new_mu:.2f}")
         st.write(f"Var(Y) = {new_var:.2f}")
     
     with col2:
         x = np.linspace(mu - 4*sigma, mu + 4*sigma, 1000)
-        y_original = stats.norm.pdf(x, mu, sigma)
-        y_transformed = stats.lognorm.pdf(np.exp(x), s=sigma, scale=np.exp(mu))
+        y_original = normal_pdf(x, mu, sigma)
+        y_transformed = lognormal_pdf(np.exp(x), mu, sigma)
         fig = plot_transformation(x, y_original, y_transformed, "Exponential Transformation")
         st.plotly_chart(fig, use_container_width=True)
 
@@ -106,8 +107,8 @@ with tab4:
     
     with col2:
         x = np.linspace(0, np.exp(mu + 4*sigma), 1000)
-        y_original = stats.lognorm.pdf(x, s=sigma, scale=np.exp(mu))
-        y_transformed = stats.norm.pdf(np.log(x), mu, sigma)
+        y_original = lognormal_pdf(x, mu, sigma)
+        y_transformed = normal_pdf(np.log(x), mu, sigma)
         fig = plot_transformation(x, y_original, y_transformed, "Logarithmic Transformation")
         st.plotly_chart(fig, use_container_width=True)
 